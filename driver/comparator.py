@@ -54,6 +54,9 @@ class AlgorithmComparator:
         # Get applicable algorithms
         algorithms_to_test = self._get_applicable_algorithms(max_lift)
         
+        # The optimal length, when it can be computed without search, certifies each result
+        optimal_length = self._known_optimal_length(self.driver, max_lift)
+        
         # Run each algorithm
         results = []
         for short_name, solver_class, full_name in algorithms_to_test:
@@ -83,7 +86,7 @@ class AlgorithmComparator:
             results.append(result)
         
         # Display results
-        display_single_instance_comparison(results)
+        display_single_instance_comparison(results, optimal_length)
         
         # Return best solution
         successful_results = [r for r in results if r.get('success', False)]
@@ -117,6 +120,12 @@ class AlgorithmComparator:
         # Generate puzzle instances
         puzzle_instances = self._generate_puzzle_instances(num_instances)
         
+        # Optimal lengths known without search certify the solutions of each instance
+        optimal_lengths = [
+            self._known_optimal_length(self.driver.__class__(initial_state, target_state), max_lift)
+            for initial_state, target_state in puzzle_instances
+        ]
+        
         # Run each algorithm on all instances
         for short_name, solver_class, full_name in algorithms_to_test:
             print(f"Running {full_name} across {num_instances} instances...")
@@ -135,13 +144,15 @@ class AlgorithmComparator:
                 'failed_instances': 0,
                 'timeout_instances': 0,
                 'timeout_duration': timeout,
-                'has_upper_bound': False
+                'has_upper_bound': False,
+                'verified_instances': 0,
+                'suboptimal_instances': 0
             }
             
             for instance_idx, (initial_state, target_state) in enumerate(puzzle_instances):
                 try:
                     # Create temporary driver for this instance
-                    temp_driver = self.driver.__class__(initial_state, target_state)
+                    temp_driver = self.driver.__class__(initial_state, target_state, options=self.driver.options)
                     
                     # Execute algorithm
                     result = temp_driver.execute_with_timeout(
@@ -164,6 +175,10 @@ class AlgorithmComparator:
                                 algorithm_results[short_name]['max_data_structures'].append(result.get('max_data_structure_size', 0))
                             algorithm_results[short_name]['iterations'].append(result.get('iterations', 0))
                             algorithm_results[short_name]['solutions'].append(result['solution'])
+                            if optimal_lengths[instance_idx] is not None:
+                                algorithm_results[short_name]['verified_instances'] += 1
+                                if len(result['solution']) != optimal_lengths[instance_idx]:
+                                    algorithm_results[short_name]['suboptimal_instances'] += 1
                         else:
                             algorithm_results[short_name]['failed_instances'] += 1
                     elif result.get('timeout', False):
@@ -205,6 +220,23 @@ class AlgorithmComparator:
         else:
             raise RuntimeError("No algorithms completed successfully")
     
+    @staticmethod
+    def _known_optimal_length(driver: 'HanoiDriver', max_lift: int) -> Optional[int]:
+        """
+        Get the optimal solution length of an instance when it is known without search.
+        
+        Args:
+            driver: The HanoiDriver holding the instance
+            max_lift: Maximum number of disks that can be lifted at once
+            
+        Returns:
+            The optimal number of moves, or None if it would require a search
+        """
+        try:
+            return driver.distance(max_lift)
+        except ValueError:
+            return None
+    
     def _get_applicable_algorithms(self, max_lift: int) -> List[Tuple[str, Any, str]]:
         """
         Get list of applicable algorithms based on puzzle characteristics.
@@ -219,10 +251,20 @@ class AlgorithmComparator:
         algorithms_to_test = []
         
         for short_name, algorithm_info in self.driver.ALGORITHMS.items():
-            # Skip CFORM unless it's applicable
+            # Skip CFORM, CFORMK, EXACT and TABLE unless they're applicable
             if short_name == 'CFORM':
                 if self.driver._is_classical_puzzle() and max_lift == 1:
                     algorithms_to_test.append((short_name, algorithm_info['class'], algorithm_info['name']))
+            elif short_name == 'CFORMK':
+                if self.driver._is_classical_puzzle() and max_lift > 1:
+                    algorithms_to_test.append((short_name, algorithm_info['class'], algorithm_info['name']))
+            elif short_name == 'EXACT':
+                if max_lift == 1:
+                    algorithms_to_test.append((short_name, algorithm_info['class'], algorithm_info['name']))
+            elif short_name == 'TABLE':
+                # Every target gets its own full-space table on disk: only where the user asked for one
+                if self.driver.options.get('cache_dir') is not None:
+                    algorithms_to_test.append((short_name, algorithm_info['class'], algorithm_info['name']))
             else:
                 algorithms_to_test.append((short_name, algorithm_info['class'], algorithm_info['name']))
         
@@ -3,19 +3,34 @@
 # This is free and unencumbered software released into the public domain.
 # For more information, please refer to the LICENSE file or <https://unlicense.org>
 
+import inspect
 import threading
 import time
-from typing import List, Optional, Dict, Any, Tuple
+from typing import Iterator, List, Optional, Dict, Any, Sequence, Tuple
 from solvers.hanoi_state import HanoiState
+from solvers.bitboard_state import BitboardHanoiState
+from solvers.compressed_solution import CompressedSolution
+from solvers.closed_form.exact_solver import exact_distance, next_optimal_move
+from solvers.closed_form.multi_lift_solver import optimal_transfer
 from .profiler import PerformanceProfiler
 from solvers import (
+    BaseSolver,
     ClosedFormSolver, 
+    ExactSolver,
+    MultiLiftClosedFormSolver,
     GeneralBFSSolver, 
+    ParallelBFSSolver,
+    ExternalBFSSolver,
+    DistanceTableSolver,
     DFSSolver, 
     IterativeDeepeningSolver,
     AStarSolver,
+    AnytimeAStarSolver,
+    WeightedAStarSolver,
+    FocalSearchSolver,
     IDAStarSolver,
     GreedyBestFirstSolver,
+    MMSolver,
     BidirectionalBFSSolver,
     ParallelBidirectionalBFSSolver
 )
@@ -27,26 +42,80 @@ class HanoiDriver:
     # Algorithm registry
     ALGORITHMS = {
         'BFS': {'class': GeneralBFSSolver, 'name': 'Breadth-First Search'},
+        'PBFS': {'class': ParallelBFSSolver, 'name': 'Parallel BFS (multi-process)'},
+        'EBFS': {'class': ExternalBFSSolver, 'name': 'External-memory BFS'},
+        'TABLE': {'class': DistanceTableSolver, 'name': 'Distance Table Descent'},
         'DFS': {'class': DFSSolver, 'name': 'Depth-First Search'},
         'IDE': {'class': IterativeDeepeningSolver, 'name': 'Iterative Deepening'},
         'ASTAR': {'class': AStarSolver, 'name': 'A* with heuristic'},
+        'ANYTIME': {'class': AnytimeAStarSolver, 'name': 'Anytime Repairing A*'},
+        'WASTAR': {'class': WeightedAStarSolver, 'name': 'Weighted A*'},
+        'FOCAL': {'class': FocalSearchSolver, 'name': 'Focal Search'},
         'IDASTAR': {'class': IDAStarSolver, 'name': 'Iterative Deepening A*'},
         'GBFS': {'class': GreedyBestFirstSolver, 'name': 'Greedy Best-First Search'},
+        'MM': {'class': MMSolver, 'name': 'Bidirectional A* (MM)'},
         'BIBFS': {'class': BidirectionalBFSSolver, 'name': 'Bidirectional BFS'},
         'PBIBFS': {'class': ParallelBidirectionalBFSSolver, 'name': 'Parallel Bidirectional BFS'},
-        'CFORM': {'class': ClosedFormSolver, 'name': 'Closed Form'}
+        'CFORM': {'class': ClosedFormSolver, 'name': 'Closed Form'},
+        'EXACT': {'class': ExactSolver, 'name': 'Exact Recursive'},
+        'CFORMK': {'class': MultiLiftClosedFormSolver, 'name': 'Closed Form (multi-lift)'}
     }
     
-    def __init__(self, initial_state: HanoiState, target_state: HanoiState):
+    # State engine registry
+    STATE_ENGINES = {
+        'tuple': HanoiState,
+        'bitboard': BitboardHanoiState
+    }
+    
+    def __init__(self, initial_state: HanoiState, target_state: HanoiState,
+                 options: Optional[Dict[str, Any]] = None):
         """
         Initialize the driver with start and end states.
         
         Args:
             initial_state: The HanoiState from which to start the search
             target_state: The HanoiState to reach
+            options: Optional driver settings, by key:
+                     - 'state_engine': 'tuple' (default) or 'bitboard', the state
+                       representation the solvers run on.
+                     - 'strip_settled': True (default) to drop the settled disks (see
+                       `_strip_settled_disks`) before running any solver.
+                     - 'anytime': True to return, when a solver times out, the best
+                       solution it has found so far instead of failing (see `lower_bound`).
+                     - 'solution_cache': a `SolutionCache` answering the puzzles already
+                       solved, up to peg renaming and reversal, by the same algorithm
+                       with the same solver options.
+                     Any other key is forwarded to the solvers whose `_solve_internal`
+                     accepts a parameter of that name, such as:
+                     - 'visited': 'set' (default) or 'bitmap', the duplicate detection
+                       structure of the BFS, DFS and bidirectional solvers.
+                     - 'heuristic': 'blocking' (default), 'recursive' or 'pdb', the
+                       heuristic of the informed solvers.
+                     - 'cache_dir': the directory where pattern databases and distance
+                       tables are saved.
+                     - 'lock_settled': True to never move the largest disks again once
+                       they sit on their target pegs (see `BaseSolver._get_successors`).
+                     - 'weight': the suboptimality bound of the WASTAR and FOCAL solvers,
+                       or the first weight of the ANYTIME solver.
         """
-        self.initial_state = initial_state
-        self.target_state = target_state
+        self.options = dict(options) if options else {}
+        
+        # Proven lower bound on the optimal length, when the last solution may be longer
+        self.lower_bound: Optional[int] = None
+        
+        state_engine = self.options.get('state_engine', 'tuple')
+        if state_engine not in self.STATE_ENGINES:
+            raise ValueError(f"Unknown state engine: {state_engine}")
+        
+        self.initial_state = self._convert_state(initial_state, state_engine)
+        self.target_state = self._convert_state(target_state, state_engine)
+        
+        # The solvers run on the puzzle without its settled disks, whose moves are the same
+        if self.options.get('strip_settled', True):
+            self.settled_disks, self.reduced_initial_state, self.reduced_target_state = self._strip_settled_disks()
+        else:
+            self.settled_disks, self.reduced_initial_state, self.reduced_target_state = (
+                0, self.initial_state, self.target_state)
         
     def solve_with_algorithm(self, max_lift: int = 1, algorithm: Optional[str] = None, 
               profile: Optional[int] = None, timeout: int = 30) -> List[Tuple[int, int, int]]:
@@ -78,13 +147,28 @@ class HanoiDriver:
             else:
                 return comparator.compare_algorithms(max_lift, timeout)
         
-        # Handle specific algorithm
-        if algorithm is not None:
-            return self._solve_with_algorithm(algorithm, max_lift, profile, timeout)
+        # Handle specific algorithm, or auto-select one
+        self.lower_bound = None
+        if algorithm is None:
+            algorithm = self._auto_select_algorithm(max_lift)
+        
+        # Puzzles equal up to peg renaming or reversal share their cached solutions;
+        # profiled runs always solve, to measure the solver
+        cache = self.options.get('solution_cache') if profile is None else None
+        if cache is not None and self._validate_algorithm(algorithm):
+            # Solutions found with other solver options, e.g. another heuristic, may differ
+            cache_options = self._forwarded_options(self.ALGORITHMS[algorithm]['class']._solve_internal)
+            solution = cache.get(algorithm, self.initial_state, self.target_state, max_lift, cache_options)
+            if solution is not None:
+                return solution
+        
+        solution = self._solve_with_algorithm(algorithm, max_lift, profile, timeout)
         
-        # Auto-select algorithm
-        selected_algorithm = self._auto_select_algorithm(max_lift)
-        return self._solve_with_algorithm(selected_algorithm, max_lift, profile, timeout)
+        # Compressed closed-form solutions are rebuilt faster than they are stored;
+        # solutions returned at the deadline may not be the algorithm's final answer
+        if cache is not None and isinstance(solution, list) and self.lower_bound is None:
+            cache.put(algorithm, self.initial_state, self.target_state, max_lift, solution, cache_options)
+        return solution
     
     def _solve_with_algorithm(self, algorithm: str, max_lift: int, 
                              profile: Optional[int], timeout: int) -> List[Tuple[int, int, int]]:
@@ -112,13 +196,89 @@ class HanoiDriver:
         # Execute with timeout
         result = self.execute_with_timeout(algorithm, solver_class, algorithm_name, max_lift, timeout)
         
-        if result.get('timeout', False):
-            raise RuntimeError(f"{algorithm_name} timed out after {timeout} seconds")
-        elif not result.get('success', False):
+        if not result.get('success', False):
+            if result.get('timeout', False):
+                lower_bound = result.get('lower_bound', 0)
+                proven = f" (the shortest solution needs at least {lower_bound} moves)" if lower_bound else ""
+                raise RuntimeError(f"{algorithm_name} timed out after {timeout} seconds{proven}")
             raise RuntimeError(f"{algorithm_name} failed: {result.get('error', 'Unknown error')}")
         
+        if result.get('suboptimality_bound', 1.0) > 1.0:
+            self.lower_bound = result['lower_bound']
         return result['solution']
     
+    def stream_solution(self, max_lift: int = 1) -> Iterator[Tuple[int, int, int]]:
+        """
+        Lazily generate the optimal solution of a classical puzzle.
+        
+        The moves are computed one at a time by the closed-form solver and never
+        stored, so arbitrarily long solutions can be printed in constant memory.
+        
+        Args:
+            max_lift: The maximum number of disks that can be lifted at once
+            
+        Returns:
+            An iterator over the moves of the optimal solution
+            
+        Raises:
+            ValueError: If the puzzle is not classical or max_lift is not 1
+        """
+        if not (self._is_classical_puzzle() and max_lift == 1):
+            raise ValueError("Streaming is only available for classical puzzles with max_lift 1")
+        
+        return ClosedFormSolver(self.initial_state, self.target_state).iter_moves()
+    
+    def distance(self, max_lift: int = 1) -> int:
+        """
+        Compute the optimal number of moves without producing the moves.
+        
+        With single-disk lifts the distance between any two states follows from
+        the exact recursive solver in O(n) time; for classical puzzles it also
+        follows from the multi-lift recurrence for any max_lift.
+        
+        Args:
+            max_lift: The maximum number of disks that can be lifted at once
+            
+        Returns:
+            The length of the optimal solution
+            
+        Raises:
+            ValueError: If the distance cannot be computed without search
+        """
+        if max_lift == 1:
+            if self.initial_state.disk_labels() != self.target_state.disk_labels():
+                raise ValueError("Initial and target states must hold the same disks")
+            return exact_distance(self.initial_state, self.target_state)
+        if self._is_classical_puzzle():
+            tower_height = self.initial_state.number_of_disks
+            return optimal_transfer(tower_height, max_lift)[0]
+        raise ValueError("The optimal distance is only known without search for max_lift 1 or classical puzzles")
+    
+    def next_optimal_move(self, state: Optional[HanoiState] = None,
+                          max_lift: int = 1) -> Optional[Tuple[int, int, int]]:
+        """
+        Compute the first move of an optimal path towards the target state.
+        
+        No search is involved, so this can serve step-by-step hints: apply the
+        returned move and ask again from the resulting state.
+        
+        Args:
+            state: The state to move from (defaults to the initial state)
+            max_lift: The maximum number of disks that can be lifted at once
+            
+        Returns:
+            The (from_peg, to_peg, num_disks) move, or None if the state is the target
+            
+        Raises:
+            ValueError: If max_lift is not 1, or the state holds different disks
+        """
+        if max_lift != 1:
+            raise ValueError("Optimal moves are only known without search for max_lift 1")
+        state = self.initial_state if state is None else state
+        if state.disk_labels() != self.target_state.disk_labels():
+            raise ValueError("The state and the target state must hold the same disks")
+        return next_optimal_move(state, self.target_state)
+    
     def execute_with_timeout(self, algorithm: str, solver_class, algorithm_name: str, 
                            max_lift: int, timeout: int, quiet: bool = False) -> Dict[str, Any]:
         """
@@ -142,18 +302,13 @@ class HanoiDriver:
             nonlocal solver_instance
             try:
                 # Create solver
-                solver_instance = solver_class(self.initial_state, self.target_state)
+                solver_instance = solver_class(self.reduced_initial_state, self.reduced_target_state)
                 
                 start_time = time.perf_counter()
                 
                 # Execute algorithm
-                if algorithm == 'CFORM':
-                    solution = solver_instance._solve_internal()
-                elif algorithm in ['IDE', 'IDASTAR']:
-                    # Only pass quiet parameter to iterative algorithms that support it
-                    solution = solver_instance._solve_internal(max_liftable_disks=max_lift, quiet=quiet)
-                else:
-                    solution = solver_instance._solve_internal(max_liftable_disks=max_lift)
+                solver_arguments = self._solver_arguments(solver_instance, max_lift, quiet, timeout)
+                solution = solver_instance._solve_internal(**solver_arguments)
                 
                 end_time = time.perf_counter()
                 solve_time = end_time - start_time
@@ -173,6 +328,9 @@ class HanoiDriver:
                 nodes_generated = result.get('nodes_generated', 0)
                 result['efficiency'] = self.calculate_efficiency(nodes_explored, nodes_generated)
                 
+                # Anytime and bounded suboptimal solvers return solutions not always proven shortest
+                self._record_anytime_bound(result, solver_instance, solution)
+                
             except Exception as e:
                 result['success'] = False
                 result['error'] = str(e)
@@ -197,9 +355,100 @@ class HanoiDriver:
                 except Exception:
                     # If we can't collect stats, just continue with timeout result
                     pass
+                
+                # In anytime mode, serve the best solution found by the deadline
+                incumbent = solver_instance.get_incumbent()
+                if incumbent is not None and (self.options.get('anytime', False) or algorithm == 'ANYTIME'):
+                    result['success'] = True
+                    result['solution'] = incumbent
+                    result['solve_time'] = timeout
+                    result['solution_length'] = len(incumbent)
+                    del result['error']
+                    self._record_anytime_bound(result, solver_instance, incumbent)
         
         return result
     
+    def _record_anytime_bound(self, result: Dict[str, Any], solver_instance,
+                              solution: Sequence[Tuple[int, int, int]]) -> None:
+        """
+        Bound how much longer than a shortest solution an incumbent may be.
+        
+        Only the solutions published as incumbents, by anytime and bounded
+        suboptimal searches, can be longer than the solver's proven lower bound
+        ('lower_bound' in the statistics); their ratio to it is stored as
+        'suboptimality_bound', 1.0 for a solution proven shortest.
+        
+        Args:
+            result: The result dictionary of the run, statistics included
+            solver_instance: The solver that produced the solution
+            solution: The solution returned
+        """
+        if solver_instance.get_incumbent() is not None:
+            result['suboptimality_bound'] = BaseSolver.suboptimality_bound(len(solution),
+                                                                           result.get('lower_bound', 0))
+    
+    def _solver_arguments(self, solver_instance, max_lift: int, quiet: bool,
+                          timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Build the keyword arguments for a solver's `_solve_internal` method.
+        
+        Only the arguments the solver declares are passed: `quiet` goes to the
+        solvers that report progress, `timeout` to the solvers that can stop
+        their own worker threads, and driver options go to the solvers with
+        a parameter of the same name.
+        
+        Args:
+            solver_instance: The solver about to run
+            max_lift: Maximum number of disks that can be lifted at once
+            quiet: If True, suppress progress output during algorithm execution
+            timeout: Timeout in seconds, if any
+            
+        Returns:
+            Dictionary of keyword arguments for `_solve_internal`
+        """
+        parameters = inspect.signature(solver_instance._solve_internal).parameters
+        
+        arguments: Dict[str, Any] = {'max_liftable_disks': max_lift}
+        if 'quiet' in parameters:
+            arguments['quiet'] = quiet
+        if 'timeout' in parameters and timeout is not None:
+            arguments['timeout'] = timeout
+        arguments.update(self._forwarded_options(solver_instance._solve_internal))
+        
+        return arguments
+    
+    def _forwarded_options(self, solve_internal) -> Dict[str, Any]:
+        """
+        Select the driver options forwarded to a solver's `_solve_internal` method.
+        
+        Args:
+            solve_internal: The `_solve_internal` method of a solver, bound or not
+            
+        Returns:
+            The options named after a parameter of the method, by name
+        """
+        parameters = inspect.signature(solve_internal).parameters
+        return {name: value for name, value in self.options.items()
+                if name in parameters and name != 'solution_cache'}
+    
+    @classmethod
+    def _convert_state(cls, state: HanoiState, state_engine: str):
+        """
+        Convert a state to the representation used by the given state engine.
+        
+        Args:
+            state: The state to convert
+            state_engine: Name of the target state engine
+            
+        Returns:
+            The state in the requested representation
+        """
+        if state_engine == 'bitboard':
+            return BitboardHanoiState.from_state(state)
+        if isinstance(state, BitboardHanoiState):
+            return state.to_state()
+        return state
+    
     @staticmethod
     def generate_puzzle_states(num_disks: int, mode: str) -> Tuple[HanoiState, HanoiState]:
         """
@@ -238,19 +487,26 @@ class HanoiDriver:
         return (nodes_explored / nodes_generated) * 100 if nodes_generated > 0 else 0
     
     @staticmethod
-    def validate_solution(solution: List[Tuple[int, int, int]], 
+    def validate_solution(solution: Sequence[Tuple[int, int, int]], 
                          initial_state: HanoiState, target_state: HanoiState) -> bool:
         """
         Validate that a solution is correct for given states.
         
+        Works with any state engine, as long as both states use the same one.
+        A `CompressedSolution` is checked symbolically, without replaying the
+        moves of its tower transfers one by one.
+        
         Args:
-            solution: List of moves to validate
+            solution: Sequence of moves to validate
             initial_state: Starting state
             target_state: Target state
             
         Returns:
             True if solution is valid, False otherwise
         """
+        if isinstance(solution, CompressedSolution):
+            return solution.is_valid(initial_state, target_state)
+        
         try:
             test_state = initial_state
             for from_peg, to_peg, num_disks in solution:
@@ -269,28 +525,73 @@ class HanoiDriver:
         Returns:
             Algorithm name to use
         """
-        if self._is_classical_puzzle() and max_lift == 1:
+        # Without its settled disks, a puzzle may turn out to be classical
+        classical = self._is_classical_puzzle(reduced=True)
+        if classical and max_lift == 1:
             return 'CFORM'
+        elif classical:
+            return 'CFORMK'
+        elif max_lift == 1:
+            return 'EXACT'
         else:
-            return 'BFS'
+            return 'BIBFS'
     
-    def _is_classical_puzzle(self) -> bool:
+    def _is_classical_puzzle(self, reduced: bool = False) -> bool:
         """
         Check if the puzzle is a classical Tower of Hanoi puzzle.
         
+        Args:
+            reduced: If True, check the puzzle without its settled disks instead
+            
         Returns:
             True if it's a classical puzzle, False otherwise
         """
-        initial_peg = self.initial_state.get_classical_peg_if_any()
-        target_peg = self.target_state.get_classical_peg_if_any()
+        initial_state = self.reduced_initial_state if reduced else self.initial_state
+        target_state = self.reduced_target_state if reduced else self.target_state
+        initial_peg = initial_state.get_classical_peg_if_any()
+        target_peg = target_state.get_classical_peg_if_any()
         
         return (
             initial_peg is not None and
             target_peg is not None and
             initial_peg != target_peg and
-            self.initial_state.number_of_disks == self.target_state.number_of_disks
+            initial_state.number_of_disks == target_state.number_of_disks
         )
     
+    def _strip_settled_disks(self) -> Tuple[int, Any, Any]:
+        """
+        Removes the settled disks from the puzzle.
+        
+        The largest disks that sit on the same peg in the initial and target
+        states are settled: they are at the bottom of their peg and below every
+        other disk, so they never need to move, and every smaller disk can land
+        on them. Any solution of the puzzle without them is a solution of the
+        full puzzle, with the same moves, and dropping them from any solution
+        of the full puzzle leaves a solution of the smaller one that is no
+        longer. Each settled disk divides the state space by 3.
+        
+        Returns:
+            The number of settled disks, and the initial and target states without
+            them, with the remaining disks relabelled 1..m. A puzzle with no settled
+            disk, or with nothing left to move, is returned unchanged.
+        """
+        number_of_disks = len(self.initial_state.disk_labels())
+        if self.initial_state.disk_labels() != self.target_state.disk_labels():
+            return 0, self.initial_state, self.target_state
+        initial_rank, target_rank = self.initial_state.rank(), self.target_state.rank()
+        
+        # Base-3 digit i of a rank is the peg of the i-th smallest disk: compare from the top
+        remaining = number_of_disks
+        while remaining > 0 and initial_rank // 3 ** (remaining - 1) == target_rank // 3 ** (remaining - 1):
+            remaining -= 1
+        if remaining in (0, number_of_disks):
+            return 0, self.initial_state, self.target_state
+        
+        state_class = type(self.initial_state)
+        return (number_of_disks - remaining,
+                state_class.unrank(initial_rank % 3 ** remaining, remaining),
+                state_class.unrank(target_rank % 3 ** remaining, remaining))
+    
     def _validate_algorithm(self, algorithm: str) -> bool:
         """
         Validate that an algorithm is supported.
@@ -0,0 +1,62 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+import unittest
+
+from solvers.hanoi_state import HanoiState
+from .comparator import AlgorithmComparator
+from .driver import HanoiDriver
+
+class TestSettledDisks(unittest.TestCase):
+    def test_settled_disks_are_stripped(self):
+        # Disks 6 and 5 already sit on their target pegs; disk 4 does not
+        initial_state = HanoiState(((6, 2, 1), (4, 3), (5,)))
+        target_state = HanoiState(((6, 4), (1,), (5, 3, 2)))
+        driver = HanoiDriver(initial_state, target_state)
+        self.assertEqual(driver.settled_disks, 2)
+        self.assertEqual(driver.reduced_initial_state.pegs, ((2, 1), (4, 3), ()))
+        self.assertEqual(driver.reduced_target_state.pegs, ((4,), (1,), (3, 2)))
+
+        for max_lift in (1, 2):
+            reference = HanoiDriver(initial_state, target_state, options={'strip_settled': False})
+            solution = driver.solve_with_algorithm(max_lift, 'BFS')
+            self.assertEqual(len(solution), len(reference.solve_with_algorithm(max_lift, 'BFS')))
+            self.assertTrue(HanoiDriver.validate_solution(solution, initial_state, target_state))
+
+    def test_reduced_puzzle_may_be_classical(self):
+        initial_state = HanoiState(((4, 3, 2, 1), (), ()))
+        target_state = HanoiState(((4,), (), (3, 2, 1)))
+        driver = HanoiDriver(initial_state, target_state)
+        self.assertEqual(driver._auto_select_algorithm(1), 'CFORM')
+        solution = driver.solve_with_algorithm(1)
+        self.assertEqual(len(solution), 7)
+        self.assertTrue(HanoiDriver.validate_solution(solution, initial_state, target_state))
+
+class TestAnytime(unittest.TestCase):
+    def test_deadline_serves_incumbent(self):
+        initial_state = HanoiState.unrank(12345, 12)
+        target_state = HanoiState.unrank(500000, 12)
+        driver = HanoiDriver(initial_state, target_state, options={'anytime': True})
+        solution = driver.solve_with_algorithm(2, 'ANYTIME', timeout=0.05)
+        self.assertTrue(HanoiDriver.validate_solution(solution, initial_state, target_state))
+        self.assertIsNotNone(driver.lower_bound)
+        self.assertLess(driver.lower_bound, len(solution))
+
+        # Without an incumbent, the timeout still fails
+        with self.assertRaises(RuntimeError):
+            driver.solve_with_algorithm(2, 'BFS', timeout=0.05)
+        self.assertIsNone(driver.lower_bound)
+
+class TestCompare(unittest.TestCase):
+    def test_table_needs_cache_dir(self):
+        initial_state = HanoiState.unrank(100, 5)
+        target_state = HanoiState.unrank(200, 5)
+        for options, included in (({}, False), ({'cache_dir': '/unused'}, True)):
+            comparator = AlgorithmComparator(HanoiDriver(initial_state, target_state, options=options))
+            names = [name for name, _, _ in comparator._get_applicable_algorithms(2)]
+            self.assertEqual('TABLE' in names, included)
+
+if __name__ == '__main__':
+    unittest.main()
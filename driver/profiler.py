@@ -72,7 +72,8 @@ class PerformanceProfiler:
             'nodes_explored': getattr(solver, '_stats_nodes_explored', 0),
             'nodes_generated': getattr(solver, '_stats_nodes_generated', 0),
             'iterations': getattr(solver, '_stats_iterations', 0),
-            'cutoff_bounds': getattr(solver, '_stats_cutoff_bounds', None)
+            'cutoff_bounds': getattr(solver, '_stats_cutoff_bounds', None),
+            'lower_bound': getattr(solver, '_stats_lower_bound', 0)
         }
         
         # Handle max_data_structure_size - prefer upper bound if available
@@ -81,6 +82,12 @@ class PerformanceProfiler:
         else:
             basic_stats['max_data_structure_size'] = getattr(solver, '_stats_max_data_structure_size', 0)
         
+        # Bounded suboptimal and anytime solvers bound the length of their best solution
+        incumbent = solver.get_incumbent() if hasattr(solver, 'get_incumbent') else None
+        if incumbent is not None:
+            basic_stats['suboptimality_bound'] = BaseSolver.suboptimality_bound(
+                len(incumbent), basic_stats['lower_bound'])
+        
         # Merge solver-specific stats with basic stats
         solver_stats.update(basic_stats)
         
@@ -0,0 +1,242 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+"""
+Persistent cache of solutions, shared by puzzles equal up to symmetry.
+
+Renaming the three pegs maps every puzzle to another one whose solutions are
+the same moves with renamed pegs, and since moves are reversible, reading a
+solution backwards, with each move inverted, solves the puzzle with start and
+goal swapped. Each (initial, target, max_lift) query is therefore reduced to a
+canonical form, the smallest of its 12 images under the 6 peg permutations
+and the reversal, and solutions are stored once per canonical form.
+
+Solutions live in an in-memory LRU map, backed by an sqlite database so that
+later runs find them too. Moves are stored as packed move codes. Solutions
+are kept apart by algorithm and by the solver options they were found with,
+such as the heuristic, since those may change the answer.
+"""
+
+import os
+import sqlite3
+from array import array
+from collections import OrderedDict
+from itertools import permutations
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from solvers.search_nodes import decode_move, encode_move
+
+# Default number of solutions kept in memory
+DEFAULT_CAPACITY = 4096
+
+# The 6 peg permutations, as tuples mapping a 0-indexed peg to its new index
+PEG_PERMUTATIONS = tuple(permutations(range(3)))
+
+# Caches already opened in this process, by database path
+_OPEN_CACHES: Dict[Optional[str], 'SolutionCache'] = {}
+
+
+def _peg_digits(rank: int, number_of_disks: int) -> List[int]:
+    """Lists the 0-indexed peg of every disk, smallest first, from a state rank."""
+    digits = []
+    for _ in range(number_of_disks):
+        rank, digit = divmod(rank, 3)
+        digits.append(digit)
+    return digits
+
+
+def _permuted_rank(digits: Sequence[int], permutation: Sequence[int]) -> int:
+    """Computes the rank of a state after renaming its pegs."""
+    rank = 0
+    for digit in reversed(digits):
+        rank = rank * 3 + permutation[digit]
+    return rank
+
+
+def canonical_form(initial_rank: int, target_rank: int,
+                   number_of_disks: int) -> Tuple[int, int, Tuple[int, ...], bool]:
+    """
+    Finds the canonical image of a puzzle under peg renaming and reversal.
+
+    Args:
+        initial_rank: The rank of the initial state.
+        target_rank: The rank of the target state.
+        number_of_disks: The number of disks in the puzzle.
+
+    Returns:
+        The initial and target ranks of the canonical puzzle, the peg permutation
+        leading to it and whether start and goal are swapped in it.
+    """
+    initial_digits = _peg_digits(initial_rank, number_of_disks)
+    target_digits = _peg_digits(target_rank, number_of_disks)
+    best = None
+    for permutation in PEG_PERMUTATIONS:
+        initial = _permuted_rank(initial_digits, permutation)
+        target = _permuted_rank(target_digits, permutation)
+        for candidate in ((initial, target, permutation, False), (target, initial, permutation, True)):
+            if best is None or candidate[:2] < best[:2]:
+                best = candidate
+    return best
+
+
+def transform_solution(solution: Sequence[Tuple[int, int, int]], permutation: Sequence[int],
+                       reverse: bool, inverse: bool = False) -> List[Tuple[int, int, int]]:
+    """
+    Maps a solution to or from the labelling of the canonical puzzle.
+
+    Args:
+        solution: The moves to map.
+        permutation: The peg permutation of the canonical form.
+        reverse: Whether start and goal are swapped in the canonical form.
+        inverse: False to map a solution to the canonical puzzle, True to map it back.
+
+    Returns:
+        The mapped list of (from_peg, to_peg, num_disks) moves.
+    """
+    if inverse:
+        permutation = [permutation.index(peg) for peg in range(3)]
+    moves = [(permutation[from_peg - 1] + 1, permutation[to_peg - 1] + 1, num_disks)
+             for from_peg, to_peg, num_disks in solution]
+    if reverse:
+        moves = [(to_peg, from_peg, num_disks) for from_peg, to_peg, num_disks in reversed(moves)]
+    return moves
+
+
+class SolutionCache:
+    """
+    Solutions by canonical puzzle, in an LRU map backed by an sqlite database.
+
+    Attributes:
+        path (Optional[str]): The database file, or None for an in-memory cache only.
+        capacity (int): The number of solutions kept in memory.
+        hits (int): The number of lookups answered from the cache.
+        misses (int): The number of lookups not answered.
+    """
+
+    def __init__(self, path: Optional[str] = None, capacity: int = DEFAULT_CAPACITY):
+        """
+        Opens, or creates, a solution cache.
+
+        If the database cannot be opened, the cache is simply kept in memory.
+
+        Args:
+            path: The sqlite database file. Defaults to no database.
+            capacity: The number of solutions kept in memory.
+        """
+        self.path = path
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._recent: 'OrderedDict[str, bytes]' = OrderedDict()
+        self._database: Optional[sqlite3.Connection] = None
+        if path is not None:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+                self._database = sqlite3.connect(path, check_same_thread=False)
+                self._database.execute("CREATE TABLE IF NOT EXISTS solutions "
+                                       "(puzzle TEXT PRIMARY KEY, moves BLOB NOT NULL)")
+                self._database.commit()
+            except (OSError, sqlite3.Error):
+                self._database = None
+
+    @staticmethod
+    def _puzzle_key(algorithm: str, number_of_disks: int, max_lift: int, initial_rank: int,
+                    target_rank: int, options: Optional[Dict[str, Any]] = None) -> str:
+        """Names a canonical puzzle, solved with the given solver options, in the database."""
+        key = f"{algorithm}:{number_of_disks}:{max_lift}:{initial_rank}:{target_rank}"
+        if options:
+            key += ':' + ','.join(f"{name}={options[name]!r}" for name in sorted(options))
+        return key
+
+    def _remember(self, key: str, moves: bytes) -> None:
+        """Stores packed moves in the LRU map, evicting the least recently used ones."""
+        self._recent[key] = moves
+        self._recent.move_to_end(key)
+        while len(self._recent) > self.capacity:
+            self._recent.popitem(last=False)
+
+    def get(self, algorithm: str, initial_state, target_state, max_lift: int,
+            options: Optional[Dict[str, Any]] = None) -> Optional[List[Tuple[int, int, int]]]:
+        """
+        Looks up a solution of a puzzle, or of any puzzle equal to it up to symmetry.
+
+        Args:
+            algorithm: The algorithm the solution must come from.
+            initial_state: The initial state of the puzzle.
+            target_state: The target state of the puzzle.
+            max_lift: The maximum number of disks lifted by a single move.
+            options: The solver options the solution must come from, by name.
+
+        Returns:
+            The solution in the labelling of the puzzle, or None if it is not cached.
+        """
+        number_of_disks = len(initial_state.disk_labels())
+        initial, target, permutation, reverse = canonical_form(
+            initial_state.rank(), target_state.rank(), number_of_disks)
+        key = self._puzzle_key(algorithm, number_of_disks, max_lift, initial, target, options)
+
+        moves = self._recent.get(key)
+        if moves is not None:
+            self._recent.move_to_end(key)
+        elif self._database is not None:
+            try:
+                row = self._database.execute("SELECT moves FROM solutions WHERE puzzle = ?", (key,)).fetchone()
+            except sqlite3.Error:
+                row = None
+            if row is not None:
+                moves = bytes(row[0])
+                self._remember(key, moves)
+
+        if moves is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        codes = array('H')
+        codes.frombytes(moves)
+        return transform_solution([decode_move(code) for code in codes], permutation, reverse, inverse=True)
+
+    def put(self, algorithm: str, initial_state, target_state, max_lift: int,
+            solution: Sequence[Tuple[int, int, int]], options: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Stores the solution of a puzzle under its canonical form.
+
+        Args:
+            algorithm: The algorithm the solution comes from.
+            initial_state: The initial state of the puzzle.
+            target_state: The target state of the puzzle.
+            max_lift: The maximum number of disks lifted by a single move.
+            solution: The moves solving the puzzle.
+            options: The solver options the solution comes from, by name.
+        """
+        number_of_disks = len(initial_state.disk_labels())
+        initial, target, permutation, reverse = canonical_form(
+            initial_state.rank(), target_state.rank(), number_of_disks)
+        key = self._puzzle_key(algorithm, number_of_disks, max_lift, initial, target, options)
+
+        moves = array('H', (encode_move(*move) for move in
+                            transform_solution(solution, permutation, reverse))).tobytes()
+        self._remember(key, moves)
+        if self._database is not None:
+            try:
+                self._database.execute("INSERT OR REPLACE INTO solutions VALUES (?, ?)", (key, moves))
+                self._database.commit()
+            except sqlite3.Error:
+                pass
+
+
+def open_solution_cache(path: Optional[str] = None, capacity: int = DEFAULT_CAPACITY) -> SolutionCache:
+    """
+    Gets the solution cache of a database, shared by all drivers of this process.
+
+    Args:
+        path: The sqlite database file, or None for an in-memory cache only.
+        capacity: The number of solutions kept in memory, when the cache is first opened.
+
+    Returns:
+        The solution cache.
+    """
+    if path not in _OPEN_CACHES:
+        _OPEN_CACHES[path] = SolutionCache(path, capacity)
+    return _OPEN_CACHES[path]
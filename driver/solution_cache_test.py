@@ -0,0 +1,75 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+import os
+import random
+import tempfile
+import unittest
+
+from solvers.hanoi_state import HanoiState
+from .driver import HanoiDriver
+from .solution_cache import PEG_PERMUTATIONS, SolutionCache
+
+def rename_pegs(state, permutation):
+    pegs = [()] * 3
+    for peg_index, peg in enumerate(state.pegs):
+        pegs[permutation[peg_index]] = peg
+    return HanoiState(tuple(pegs))
+
+class TestSolutionCache(unittest.TestCase):
+    def test_symmetric_puzzles_share_solutions(self):
+        random.seed(7)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            path = os.path.join(cache_dir, 'solutions.sqlite')
+            for _ in range(5):
+                num_disks = 5
+                initial_state = HanoiState.unrank(random.randrange(3 ** num_disks), num_disks)
+                target_state = HanoiState.unrank(random.randrange(3 ** num_disks), num_disks)
+                driver = HanoiDriver(initial_state, target_state, options={'solution_cache': SolutionCache(path)})
+                length = len(driver.solve_with_algorithm(2, 'BFS'))
+
+                # A new cache only finds the solution in the database
+                cache = SolutionCache(path)
+                for permutation in PEG_PERMUTATIONS:
+                    start, goal = rename_pegs(initial_state, permutation), rename_pegs(target_state, permutation)
+                    for start, goal in ((start, goal), (goal, start)):
+                        solution = cache.get('BFS', start, goal, 2)
+                        self.assertEqual(len(solution), length)
+                        self.assertTrue(HanoiDriver.validate_solution(solution, start, goal))
+                        self.assertTrue(all(num_disks <= 2 for _, _, num_disks in solution))
+                self.assertEqual(cache.misses, 0)
+                self.assertIsNone(cache.get('BFS', initial_state, target_state, 1))
+
+    def test_solver_options_never_share_solutions(self):
+        initial_state = HanoiState.unrank(1234, 8)
+        target_state = HanoiState.unrank(5678, 8)
+        option_sets = [{'heuristic': 'blocking'}, {'heuristic': 'recursive'},
+                       {'heuristic': 'blocking', 'lock_settled': True}]
+        with tempfile.TemporaryDirectory() as cache_dir:
+            option_sets.append({'heuristic': 'blocking', 'cache_dir': cache_dir})
+            path = os.path.join(cache_dir, 'solutions.sqlite')
+            solutions = []
+            for options in option_sets:
+                cache = SolutionCache(path)
+                driver = HanoiDriver(initial_state, target_state, options=dict(options, solution_cache=cache))
+                solutions.append(driver.solve_with_algorithm(2, 'GBFS'))
+                self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+            # Each option set finds its own solution again, the options the solver ignores aside
+            for options, solution in zip(option_sets, solutions):
+                cache = SolutionCache(path)
+                driver = HanoiDriver(initial_state, target_state,
+                                     options=dict(options, visited='bitmap', prune_moves=False, solution_cache=cache))
+                self.assertEqual(driver.solve_with_algorithm(2, 'GBFS'), solution)
+                self.assertEqual((cache.hits, cache.misses), (1, 0))
+
+    def test_keys_of_option_sets_differ(self):
+        keys = {SolutionCache._puzzle_key('ASTAR', 5, 2, 10, 20, options)
+                for options in (None, {'heuristic': 'blocking'}, {'heuristic': 'pdb'},
+                                {'heuristic': 'pdb', 'cache_dir': '/tmp/tables'}, {'lock_settled': True})}
+        self.assertEqual(len(keys), 5)
+
+if __name__ == '__main__':
+    unittest.main()
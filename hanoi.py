@@ -12,6 +12,7 @@ puzzles using various algorithms, with detailed performance analysis and visuali
 
 import argparse
 import math
+import os
 import random
 import sys
 import time
@@ -19,11 +20,14 @@ from typing import List, Tuple, Any, Dict
 
 from input.commandline_args import create_parser
 from driver.driver import HanoiDriver
+from driver.solution_cache import open_solution_cache
 from solvers.hanoi_state import HanoiState
+from solvers.table_cache import DEFAULT_CACHE_DIR
 from output.profiling_and_comparing import (
     display_puzzle_header,
     display_puzzle_states,
     display_solution_summary,
+    display_anytime_summary,
     display_solution_moves,
     display_solution_states,
     display_multi_instance_header,
@@ -45,8 +49,8 @@ def main():
     # Handle the simple shortcut case: `python3 hanoi.py 5`
     if len(sys.argv) == 2 and sys.argv[1].isdigit():
         num_disks = int(sys.argv[1])
-        # Manually create args namespace with correct defaults for the shortcut.
-        args = argparse.Namespace(show=None, max_lift=1, search=None, profile=None, timeout=30, seed=None, instance=None)
+        # Parse the shortcut as `--classic N`, so that every other option keeps its default
+        args = create_parser().parse_args(['--classic', sys.argv[1]])
         # No seed initialization for shortcut case (will use random puzzles if applicable)
         if num_disks > 0:
             solve_puzzle(num_disks, 'classic', args)
@@ -77,6 +81,36 @@ def main():
     elif args.instance:
         solve_custom_instance(args)
 
+def build_driver_options(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Collects the driver settings from the parsed command-line arguments.
+
+    Args:
+        args: The parsed command-line arguments.
+
+    Returns:
+        A dictionary of options to pass to `HanoiDriver`.
+    """
+    options = {
+        'state_engine': args.state_engine,
+        'visited': args.visited,
+        'prune_moves': args.prune_moves,
+        'strip_settled': args.strip_settled,
+        'anytime': args.anytime,
+        'lock_settled': args.lock_settled,
+        'heuristic': args.heuristic,
+        'cache_dir': args.cache_dir,
+        'workers': args.workers,
+        'scratch_dir': args.scratch_dir,
+        'buffer_size': args.buffer_size,
+    }
+    if args.weight is not None:
+        options['weight'] = args.weight
+    if args.cache:
+        options['solution_cache'] = open_solution_cache(
+            os.path.join(args.cache_dir or DEFAULT_CACHE_DIR, 'solutions.sqlite'))
+    return options
+
 def solve_puzzle(num_disks: int, mode: str, args: argparse.Namespace):
     """
     Coordinates the process of solving a single puzzle instance.
@@ -95,7 +129,7 @@ def solve_puzzle(num_disks: int, mode: str, args: argparse.Namespace):
     # Determine number of instances to run
     num_instances = args.profile if args.profile is not None and args.profile > 1 else 1
     
-    if num_instances > 1:
+    if num_instances > 1 and not args.count_only:
         solve_multiple_instances(num_disks, mode, args, num_instances)
     else:
         solve_single_instance(num_disks, mode, args)
@@ -122,7 +156,13 @@ def solve_single_instance(num_disks: int, mode: str, args: argparse.Namespace):
     display_puzzle_states(initial_state, target_state)
     
     # Solve the puzzle
-    driver = HanoiDriver(initial_state, target_state)
+    driver = HanoiDriver(initial_state, target_state, options=build_driver_options(args))
+    if args.count_only:
+        count_optimal_moves(driver, args)
+        return
+    if args.stream and stream_classical_solution(driver, args, mode, initial_state):
+        return
+    
     start_time = time.time()
     solution_path = driver.solve_with_algorithm(max_lift=args.max_lift, algorithm=args.search, profile=args.profile, timeout=args.timeout)
     end_time = time.time()
@@ -133,7 +173,10 @@ def solve_single_instance(num_disks: int, mode: str, args: argparse.Namespace):
         return
     
     # Display solution summary
-    display_solution_summary(len(solution_path), elapsed_time, mode)
+    if driver.lower_bound is not None:
+        display_anytime_summary(len(solution_path), elapsed_time, driver.lower_bound)
+    else:
+        display_solution_summary(len(solution_path), elapsed_time, mode)
     
     # Display solution based on verbosity level
     verbosity = determine_verbosity_level(solution_path, args.show)
@@ -143,6 +186,62 @@ def solve_single_instance(num_disks: int, mode: str, args: argparse.Namespace):
     elif verbosity == 'states':
         display_solution_states(solution_path, initial_state)
 
+def count_optimal_moves(driver: HanoiDriver, args: argparse.Namespace):
+    """
+    Prints the optimal number of moves of a puzzle, without solving it.
+
+    Args:
+        driver: The driver holding the puzzle to measure.
+        args: The parsed command-line arguments.
+    """
+    start_time = time.time()
+    try:
+        distance = driver.distance(args.max_lift)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return
+    elapsed_time = time.time() - start_time
+
+    print(f"\nOptimal solution length computed in {elapsed_time:.4f} seconds: {distance} moves required.")
+
+def stream_classical_solution(driver: HanoiDriver, args: argparse.Namespace, mode: str, initial_state: HanoiState) -> bool:
+    """
+    Streams the optimal solution of a classical puzzle, move by move.
+
+    The moves are printed as soon as they are computed and are never stored,
+    so the first move appears immediately and memory stays constant however
+    long the solution is.
+
+    Args:
+        driver: The driver holding the puzzle to solve.
+        args: The parsed command-line arguments, used for verbosity control.
+        mode: The type of puzzle ('classic' or 'random').
+        initial_state: The initial state, used to display intermediate states.
+
+    Returns:
+        True if the solution was streamed, False if streaming does not apply
+        to this puzzle and it has to be solved normally.
+    """
+    try:
+        moves = driver.stream_solution(args.max_lift)
+    except ValueError:
+        print("Note: --stream only applies to classical puzzles with -l 1; solving normally.")
+        return False
+
+    # The length of a classical solution is known without generating it
+    solution_length = 2 ** initial_state.number_of_disks - 1
+    start_time = time.time()
+
+    verbosity = args.show if args.show else 'moves'
+    if verbosity == 'moves':
+        display_solution_moves(moves)
+    elif verbosity == 'states':
+        display_solution_states(moves, initial_state)
+
+    elapsed_time = time.time() - start_time
+    display_solution_summary(solution_length, elapsed_time, mode)
+    return True
+
 def solve_multiple_instances(num_disks: int, mode: str, args: argparse.Namespace, num_instances: int):
     """
     Solves multiple puzzle instances and reports averaged statistics.
@@ -173,7 +272,7 @@ def solve_multiple_instances(num_disks: int, mode: str, args: argparse.Namespace
             display_puzzle_states(initial_state, target_state)
         
         # Let HanoiDriver handle the multi-instance comparison
-        driver = HanoiDriver(initial_state, target_state)
+        driver = HanoiDriver(initial_state, target_state, options=build_driver_options(args))
         start_time = time.time()
         solution_path = driver.solve_with_algorithm(max_lift=args.max_lift, algorithm=args.search, profile=num_instances, timeout=args.timeout)
         end_time = time.time()
@@ -197,7 +296,7 @@ def solve_multiple_instances(num_disks: int, mode: str, args: argparse.Namespace
             display_puzzle_states(initial_state, target_state)
         
         # Solve the puzzle
-        driver = HanoiDriver(initial_state, target_state)
+        driver = HanoiDriver(initial_state, target_state, options=build_driver_options(args))
         start_time = time.time()
         solution_path = driver.solve_with_algorithm(max_lift=args.max_lift, algorithm=args.search, profile=1, timeout=args.timeout)  # Always profile for multi-instance
         end_time = time.time()
@@ -246,7 +345,13 @@ def solve_custom_instance(args: argparse.Namespace):
         display_puzzle_states(initial_state, target_state)
         
         # Solve the puzzle
-        driver = HanoiDriver(initial_state, target_state)
+        driver = HanoiDriver(initial_state, target_state, options=build_driver_options(args))
+        if args.count_only:
+            count_optimal_moves(driver, args)
+            return
+        if args.stream and stream_classical_solution(driver, args, 'classic', initial_state):
+            return
+        
         start_time = time.time()
         solution_path = driver.solve_with_algorithm(max_lift=args.max_lift, algorithm=args.search, profile=args.profile, timeout=args.timeout)
         end_time = time.time()
@@ -257,7 +362,10 @@ def solve_custom_instance(args: argparse.Namespace):
             return
         
         # Display solution summary
-        print(f"\nShortest solution found in {elapsed_time:.4f} seconds: {len(solution_path)} moves required.")
+        if driver.lower_bound is not None:
+            display_anytime_summary(len(solution_path), elapsed_time, driver.lower_bound)
+        else:
+            print(f"\nShortest solution found in {elapsed_time:.4f} seconds: {len(solution_path)} moves required.")
         
         # Display solution based on verbosity level
         verbosity = determine_verbosity_level(solution_path, args.show)
@@ -50,19 +50,32 @@ Examples:
 
     parser.add_argument(
         '-s', '--search',
-        choices=['BFS', 'DFS', 'IDE', 'ASTAR', 'IDASTAR', 'GBFS', 'BIBFS', 'PBIBFS', 'CFORM', 'COMPARE'],
+        choices=['BFS', 'PBFS', 'EBFS', 'TABLE', 'DFS', 'IDE', 'ASTAR', 'ANYTIME', 'WASTAR', 'FOCAL', 'IDASTAR', 'GBFS', 'MM', 'BIBFS', 'PBIBFS', 'CFORM', 'CFORMK', 'EXACT', 'COMPARE'],
         default=None,
         metavar='ALGORITHM',
         help="""Choose the search algorithm to use:
   BFS:      Breadth-First Search (optimal, moderate memory)
+  PBFS:     Parallel BFS over --workers processes (optimal, multi-core, low memory)
+  EBFS:     External-memory BFS, layers on disk (optimal, bounded memory)
+  TABLE:    Descent along a saved distance table of the target (optimal, one BFS
+            per target, then no search; tables saved in --cache-dir; part of
+            COMPARE only when --cache-dir is given)
   DFS:      Depth-First Search (fast, low memory, non-optimal)
   IDE:      Iterative Deepening (optimal, low memory)
   ASTAR:    A* with heuristic (optimal, efficient search)
+  ANYTIME:  Anytime Repairing A*, weighted A* passes with decreasing weights
+            (a first solution fast, then optimal; the best one by --timeout)
+  WASTAR:   Weighted A*, ordered by g + w*h (at most --weight times optimal)
+  FOCAL:    Focal search, the nearest state within --weight times the best
+            f-score first (at most --weight times optimal)
   IDASTAR:  Iterative Deepening A* (optimal, very low memory)
   GBFS:     Greedy Best-First Search (fast, low memory, non-optimal)
+  MM:       Bidirectional A* meeting in the middle (optimal, efficient search)
   BIBFS:    Bidirectional BFS (optimal, faster than BFS)
   PBIBFS:   Parallel Bidirectional BFS (optimal, multi-core)
   CFORM:    Closed Form (optimal, for classical puzzles only)
+  CFORMK:   Closed Form multi-lift (optimal, for classical puzzles, any -l)
+  EXACT:    Exact Recursive (optimal, no search, for -l 1 only)
   COMPARE:  Run all applicable algorithms and compare results
 If not specified, the solver will auto-select an appropriate algorithm."""
     )
@@ -73,7 +86,121 @@ If not specified, the solver will auto-select an appropriate algorithm."""
         default=1,
         metavar='N',
         help="""The maximum number of disks that can be lifted in a single move.
-Defaults to 1. Using a value > 1 is incompatible with the CFORM solver."""
+Defaults to 1. Using a value > 1 is incompatible with the CFORM and EXACT solvers;
+classical puzzles with a value > 1 are solved by CFORMK."""
+    )
+
+    parser.add_argument(
+        '--state-engine',
+        choices=['tuple', 'bitboard'],
+        default='tuple',
+        help="""Choose the internal state representation used by the solvers:
+  tuple:    Tuple of three tuples of disks (default)
+  bitboard: Three per-peg bitmasks packed into a single integer
+            (faster move generation and hashing on large instances)"""
+    )
+
+    parser.add_argument(
+        '--visited',
+        choices=['set', 'bitmap'],
+        default='set',
+        help="""Choose how BFS, DFS and the bidirectional solvers detect repeated states:
+  set:    Hash set of generated states (default)
+  bitmap: One bit per possible state, indexed by the state's rank in 0..3^N-1
+          (3^N/8 bytes up front, far less memory on large searches)"""
+    )
+
+    parser.add_argument(
+        '--no-prune',
+        dest='prune_moves',
+        action='store_false',
+        help="""Let DFS, IDE and IDASTAR lift again the disks placed by the previous move.
+By default such moves are pruned: they either undo the previous move or could be
+merged with it, so they never shorten a solution."""
+    )
+
+    parser.add_argument(
+        '--no-strip',
+        dest='strip_settled',
+        action='store_false',
+        help="""Keep the settled disks in the puzzle given to the solvers. By default the largest
+disks that sit on the same peg in the initial and target states are dropped before
+solving: they never need to move, and each one divides the state space by 3."""
+    )
+
+    parser.add_argument(
+        '--lock-settled',
+        action='store_true',
+        help="""Make BFS, DFS, IDE, ASTAR, ANYTIME, WASTAR, FOCAL, IDASTAR and GBFS never move the
+largest disks again once they all sit on their target pegs, as the search reaches
+such states."""
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        metavar='N',
+        help="""The number of worker processes of the PBFS solver.
+Defaults to the number of CPUs; with 1 the search runs in the main process."""
+    )
+
+    parser.add_argument(
+        '--scratch-dir',
+        default=None,
+        metavar='DIR',
+        help="""Directory where the EBFS solver writes its layer and run files.
+Defaults to the system temporary directory; files are removed after the search."""
+    )
+
+    parser.add_argument(
+        '--buffer-size',
+        type=int,
+        default=1 << 20,
+        metavar='N',
+        help="""The number of states the EBFS solver holds in memory before it writes
+a sorted run to disk (default: 1048576)."""
+    )
+
+    parser.add_argument(
+        '--heuristic',
+        choices=['blocking', 'recursive', 'pdb'],
+        default='blocking',
+        help="""Choose the heuristic of the ASTAR, ANYTIME, WASTAR, FOCAL, IDASTAR, GBFS and MM
+solvers:
+  blocking:  Misplaced disks divided by the maximum lift (default)
+  recursive: Cost of clearing the way for the largest misplaced disk
+             (the exact distance with -l 1, a lower bound otherwise)
+  pdb:       Pattern databases: exact distances of the puzzle restricted to groups
+             of up to 8 disks, combined by max (built once, then saved in --cache-dir)"""
+    )
+
+    parser.add_argument(
+        '-w', '--weight',
+        type=float,
+        default=None,
+        metavar='W',
+        help="""Set the weight of the heuristic, at least 1. WASTAR and FOCAL return solutions
+at most W times longer than the shortest one, and report the bound they actually
+achieved (default: 2). ANYTIME starts its passes with this weight (default: 3)."""
+    )
+
+    parser.add_argument(
+        '--cache-dir',
+        default=None,
+        metavar='DIR',
+        help="""Directory where pattern databases and TABLE distance tables are saved
+and reused across runs.
+Defaults to ~/.cache/hanoi."""
+    )
+
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help="""Reuse the solutions of puzzles already solved by the same algorithm, with the same
+solver options, in this run or earlier ones, including puzzles equal up to renaming
+the pegs or swapping the initial and target states. Solutions are stored in
+--cache-dir/solutions.sqlite. Profiled runs (-p) and COMPARE always solve."""
     )
 
     parser.add_argument(
@@ -96,14 +223,38 @@ Using the same seed with the same parameters guarantees identical puzzles and ou
   states:  Show the summary, moves, and a full visualization of each intermediate state."""
     )
 
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help="""Stream the moves of a classical puzzle (with -l 1) as they are computed,
+one at a time and in constant memory, instead of building the whole solution first.
+Shows the moves by default; use --show summary to only print the move count."""
+    )
+
+    parser.add_argument(
+        '--count-only',
+        action='store_true',
+        help="""Only print the optimal number of moves, computed without search and without
+producing the moves. Available with -l 1 for any puzzle, and for classical puzzles with any -l."""
+    )
+
     parser.add_argument(
         '--timeout',
-        type=int,
+        type=float,
         default=30,
         metavar='S',
-        help="""Set timeout in seconds for algorithm execution.
-If any algorithm takes longer than S seconds, it will be terminated with an error.
-Defaults to 30 seconds. Applies to all modes including single algorithm execution."""
+        help="""Set timeout in seconds for algorithm execution (fractions allowed, e.g. 0.05).
+If any algorithm takes longer than S seconds, it will be terminated with an error,
+unless --anytime is given. Defaults to 30 seconds. Applies to all modes including
+single algorithm execution."""
+    )
+
+    parser.add_argument(
+        '--anytime',
+        action='store_true',
+        help="""When an algorithm reaches --timeout, return the best solution it has found so far,
+with a proven lower bound on the shortest length, instead of failing. ANYTIME and MM
+publish such solutions as they search; ANYTIME always behaves this way."""
     )
     
     parser.add_argument(
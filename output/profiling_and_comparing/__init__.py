@@ -22,6 +22,7 @@ from ..solution import (
     display_puzzle_header,
     display_puzzle_states,
     display_solution_summary,
+    display_anytime_summary,
     display_verbosity_warning,
     display_instance_progress,
     display_instance_result,
@@ -53,6 +54,7 @@ __all__ = [
     'display_puzzle_header',
     'display_puzzle_states',
     'display_solution_summary',
+    'display_anytime_summary',
     'display_verbosity_warning',
     'display_instance_progress',
     'display_instance_result',
@@ -11,16 +11,18 @@ multiple algorithms on Tower of Hanoi puzzles, showing performance metrics
 like timing, solution quality, and search efficiency.
 """
 
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
 from output.utils import calculate_column_widths, format_time_range
 
 
-def display_single_instance_comparison(results: List[Dict[str, Any]]):
+def display_single_instance_comparison(results: List[Dict[str, Any]], optimal_length: Optional[int] = None):
     """
     Display a formatted ASCII comparison table of algorithm results from a single instance.
     
     Args:
         results: List of algorithm result dictionaries
+        optimal_length: The proven optimal number of moves, if known; otherwise
+                        the shortest solution found is reported as optimal
     """
     # Prepare table data - include both successful and timed-out results
     successful_results = [r for r in results if r.get('success', False)]
@@ -109,7 +111,7 @@ def display_single_instance_comparison(results: List[Dict[str, Any]]):
     print("="*table_width)
     
     # Display summary statistics
-    _display_comparison_summary(successful_results, results, table_width)
+    _display_comparison_summary(successful_results, results, table_width, optimal_length)
 
 
 def display_multi_instance_comparison(algorithm_results: Dict[str, Dict[str, Any]], num_instances: int):
@@ -285,9 +287,21 @@ def display_multi_instance_comparison(algorithm_results: Dict[str, Dict[str, Any
     print("- Iterations: maximum search depth (iterative deepening variants only)")
     print("- [min-max]: range of values across instances where applicable")
     print("="*table_width)
+    
+    # Report the optimality check for the instances whose optimum is known without search
+    verified_algorithms = {name: results for name, results in displayable_algorithms.items()
+                           if results.get('verified_instances', 0) > 0}
+    if verified_algorithms:
+        optimal_names = [name for name, results in verified_algorithms.items() if results['suboptimal_instances'] == 0]
+        suboptimal_names = [f"{name} ({results['suboptimal_instances']}/{results['verified_instances']} instances)"
+                            for name, results in verified_algorithms.items() if results['suboptimal_instances'] > 0]
+        print(f"🎯 Verified optimal: {', '.join(optimal_names) or 'none'}")
+        if suboptimal_names:
+            print(f"📏 Non-optimal:      {', '.join(suboptimal_names)}")
 
 
-def _display_comparison_summary(successful_results: List[Dict[str, Any]], all_results: List[Dict[str, Any]], table_width: int):
+def _display_comparison_summary(successful_results: List[Dict[str, Any]], all_results: List[Dict[str, Any]], table_width: int,
+                                optimal_length: Optional[int] = None):
     """
     Display summary statistics for single instance comparison.
     
@@ -295,19 +309,30 @@ def _display_comparison_summary(successful_results: List[Dict[str, Any]], all_re
         successful_results: List of successful algorithm results
         all_results: List of all algorithm results (including failed ones)
         table_width: Width of the table for consistent borders
+        optimal_length: The proven optimal number of moves, if known
     """
     print("\n📊 SUMMARY:")
     
     # Find best performers
     fastest = min(successful_results, key=lambda x: x['solve_time'])
-    optimal_results = [r for r in successful_results if r['solution_length'] == min(r['solution_length'] for r in successful_results)]
+    shortest_length = min(r['solution_length'] for r in successful_results)
+    reference_length = optimal_length if optimal_length is not None else shortest_length
+    optimal_results = [r for r in successful_results if r['solution_length'] == reference_length]
     most_efficient = max((r for r in successful_results if r['efficiency'] > 0), 
                        key=lambda x: x['efficiency'], default=None)
     least_memory = min((r for r in successful_results if r['nodes_generated'] > 0), 
                       key=lambda x: x['nodes_generated'], default=None)
     
     print(f"⚡ Fastest:          {fastest['algorithm']} ({fastest['solve_time']:.4f}s)")
-    print(f"🎯 Optimal:          {', '.join(r['algorithm'] for r in optimal_results)} ({optimal_results[0]['solution_length']} moves)")
+    if optimal_length is None:
+        print(f"🎯 Optimal:          {', '.join(r['algorithm'] for r in optimal_results)} ({reference_length} moves)")
+    else:
+        # The optimum was computed independently, so every result is checked against it
+        verified = ', '.join(r['algorithm'] for r in optimal_results) or "none"
+        print(f"🎯 Optimal:          {verified} ({optimal_length} moves, verified)")
+        suboptimal_results = [r for r in successful_results if r['solution_length'] != optimal_length]
+        if suboptimal_results:
+            print(f"📏 Non-optimal:      {', '.join(r['algorithm'] for r in suboptimal_results)}")
     
     if most_efficient:
         print(f"🏅 Most Efficient:   {most_efficient['algorithm']} ({most_efficient['efficiency']:.1f}% efficiency)")
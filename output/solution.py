@@ -3,15 +3,16 @@
 # This is free and unencumbered software released into the public domain.
 # For more information, please refer to the LICENSE file or <https://unlicense.org>
 
-from typing import List, Tuple, Any, Optional
+from typing import List, Sequence, Tuple, Any, Optional
 
 
-def display_solution_moves(solution_path: List[Tuple[int, int, int]]):
+def display_solution_moves(solution_path: Sequence[Tuple[int, int, int]]):
     """
     Display the solution as a list of moves.
     
     Args:
-        solution_path: List of tuples representing moves (from_peg, to_peg, num_disks)
+        solution_path: Sequence of tuples representing moves (from_peg, to_peg, num_disks),
+                       e.g. a list, a `CompressedSolution` or a lazy move stream
     """
     print("\nSolution:")
     for i, move in enumerate(solution_path):
@@ -20,12 +21,12 @@ def display_solution_moves(solution_path: List[Tuple[int, int, int]]):
         print(f"  Move {i+1}: {num_d} {disk_str} from peg {from_p} to peg {to_p}")
 
 
-def display_solution_states(solution_path: List[Tuple[int, int, int]], initial_state: Any):
+def display_solution_states(solution_path: Sequence[Tuple[int, int, int]], initial_state: Any):
     """
     Display the solution with intermediate states.
     
     Args:
-        solution_path: List of tuples representing moves (from_peg, to_peg, num_disks)
+        solution_path: Sequence of tuples representing moves (from_peg, to_peg, num_disks)
         initial_state: The initial HanoiState to start from
     """
     print("\nSolution (with intermediate states):")
@@ -79,6 +80,20 @@ def display_solution_summary(solution_length: int, elapsed_time: float, mode: st
     print(f"\nShortest solution {summary_verb} in {elapsed_time:.4f} seconds: {solution_length} moves required.")
 
 
+def display_anytime_summary(solution_length: int, elapsed_time: float, lower_bound: int):
+    """
+    Display a summary of a solution not proven shortest, returned at the deadline
+    or by a bounded suboptimal search.
+    
+    Args:
+        solution_length: Number of moves in the best solution found
+        elapsed_time: Time taken to find the solution
+        lower_bound: Proven lower bound on the number of moves of a shortest solution
+    """
+    print(f"\nBest solution found in {elapsed_time:.4f} seconds: {solution_length} moves "
+          f"(the shortest solution needs at least {lower_bound} moves).")
+
+
 def display_verbosity_warning():
     """Display a warning about output being suppressed due to length."""
     print("(Output suppressed as it exceeds 100 moves. Use --show [moves|states] to see it.)")
@@ -137,7 +152,7 @@ def display_fastest_solution_details(fastest_instance: dict, show_moves: bool =
             print(f"     Move {i+1}: {num_d} {disk_str} from peg {from_p} to peg {to_p}")
 
 
-def determine_verbosity_level(solution_path: List[Tuple[int, int, int]], show_arg: Optional[str] = None) -> str:
+def determine_verbosity_level(solution_path: Sequence[Tuple[int, int, int]], show_arg: Optional[str] = None) -> str:
     """
     Determine the level of detail to show based on user args or smart defaults.
     
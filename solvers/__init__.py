@@ -8,14 +8,18 @@ This package contains the various solver strategy implementations.
 
 Solvers are organized by their fundamental algorithmic approach:
 - blind_search: Uninformed search algorithms (BFS, DFS, etc.)
-- informed_search: Heuristic-guided search algorithms (A*, IDA*)  
-- closed_form: Closed form solution algorithms (ClosedFormSolver)
+- informed_search: Heuristic-guided search algorithms (A*, IDA*, MM)  
+- closed_form: Closed form solution algorithms (ClosedFormSolver, ExactSolver,
+  MultiLiftClosedFormSolver)
 """
 from .base_solver import BaseSolver
 
 # Import from organized subdirectories
 from .blind_search import (
     GeneralBFSSolver,
+    ParallelBFSSolver,
+    ExternalBFSSolver,
+    DistanceTableSolver,
     DFSSolver, 
     BidirectionalBFSSolver,
     ParallelBidirectionalBFSSolver,
@@ -23,25 +27,40 @@ from .blind_search import (
 )
 from .informed_search import (
     AStarSolver,
+    AnytimeAStarSolver,
+    WeightedAStarSolver,
+    FocalSearchSolver,
     IDAStarSolver,
-    GreedyBestFirstSolver
+    GreedyBestFirstSolver,
+    MMSolver
 )
 from .closed_form import (
-    ClosedFormSolver
+    ClosedFormSolver,
+    ExactSolver,
+    MultiLiftClosedFormSolver
 )
 
 __all__ = [
     'BaseSolver', 
     # Blind search algorithms
     'GeneralBFSSolver', 
+    'ParallelBFSSolver',
+    'ExternalBFSSolver',
+    'DistanceTableSolver',
     'DFSSolver',
     'BidirectionalBFSSolver', 
     'ParallelBidirectionalBFSSolver', 
     'IterativeDeepeningSolver',
     # Informed search algorithms  
     'AStarSolver', 
+    'AnytimeAStarSolver',
+    'WeightedAStarSolver',
+    'FocalSearchSolver',
     'IDAStarSolver',
     'GreedyBestFirstSolver',
+    'MMSolver',
     # No-search algorithms
-    'ClosedFormSolver'
+    'ClosedFormSolver',
+    'ExactSolver',
+    'MultiLiftClosedFormSolver'
 ] 
\ No newline at end of file
@@ -13,9 +13,10 @@ defining the common interface and shared functionality for solving Tower of Hano
 import abc
 import os
 import time
-from typing import List, Tuple, Set, Optional, Any
+from typing import Iterator, List, Tuple, Set, Optional, Any
 
 from .hanoi_state import HanoiState
+from .bitboard_state import BitboardHanoiState
 from output.profiling_and_comparing import display_search_statistics
 
 class BaseSolver(abc.ABC):
@@ -45,6 +46,11 @@ class BaseSolver(abc.ABC):
         self._stats_iterations: int = 0
         self._stats_cutoff_bounds: List[Any] = []
         self._stats_solution_length: int = 0
+        self._stats_lower_bound: int = 0
+        self._stats_incumbent: Optional[List[Tuple[int, int, int]]] = None
+
+        # The target peg of each disk, largest first, computed on the first use of `lock_settled`
+        self._settled_order: Optional[List[Tuple[int, int]]] = None
 
     @abc.abstractmethod
     def _solve_internal(self, max_liftable_disks: int = 1) -> List[tuple[int, int, int]]:
@@ -63,7 +69,7 @@ class BaseSolver(abc.ABC):
         """
         raise NotImplementedError
     
-    def solve(self, max_liftable_disks: int = 1) -> List[tuple[int, int, int]]:
+    def solve(self, max_liftable_disks: int = 1, **options: Any) -> List[tuple[int, int, int]]:
         """
         Solves the Tower of Hanoi puzzle with statistics tracking.
         
@@ -72,6 +78,7 @@ class BaseSolver(abc.ABC):
 
         Args:
             max_liftable_disks: Maximum number of disks that can be lifted at once.
+            **options: Solver-specific keyword arguments, forwarded to `_solve_internal`.
 
         Returns:
             A list of moves representing the solution path.
@@ -84,7 +91,7 @@ class BaseSolver(abc.ABC):
         
         try:
             # Call the actual solver implementation
-            solution = self._solve_internal(max_liftable_disks)
+            solution = self._solve_internal(max_liftable_disks, **options)
             
             # Record solution length
             self._stats_solution_length = len(solution)
@@ -113,6 +120,8 @@ class BaseSolver(abc.ABC):
         self._stats_iterations = 0
         self._stats_cutoff_bounds = []
         self._stats_solution_length = 0
+        self._stats_lower_bound = 0
+        self._stats_incumbent = None
     
     def _stats_start_timing(self) -> None:
         """Start timing the solve process."""
@@ -140,6 +149,52 @@ class BaseSolver(abc.ABC):
         if bound is not None:
             self._stats_cutoff_bounds.append(bound)
     
+    def _stats_record_lower_bound(self, bound: int) -> None:
+        """
+        Raise the proven lower bound on the length of a shortest solution.
+
+        Searches publish it as they go, so that a run stopped at a deadline still
+        tells how far its best solution can be from optimal.
+        """
+        if bound > self._stats_lower_bound:
+            self._stats_lower_bound = bound
+    
+    def _stats_record_incumbent(self, solution: List[Tuple[int, int, int]]) -> None:
+        """
+        Keep a solution found during the search, if shorter than the current incumbent.
+
+        The list is published in a single assignment, so another thread may read
+        the incumbent while the search goes on (see `get_incumbent`).
+        """
+        if self._stats_incumbent is None or len(solution) < len(self._stats_incumbent):
+            self._stats_incumbent = solution
+    
+    @staticmethod
+    def suboptimality_bound(solution_length: int, lower_bound: int) -> float:
+        """
+        Computes how many times longer than a shortest solution a solution can be.
+        
+        Args:
+            solution_length: The number of moves of the solution.
+            lower_bound: A proven lower bound on the length of a shortest solution.
+            
+        Returns:
+            The ratio of the two lengths, 1.0 for a solution proven shortest.
+        """
+        if solution_length <= lower_bound:
+            return 1.0
+        return solution_length / lower_bound if lower_bound else float('inf')
+    
+    def get_incumbent(self) -> Optional[List[Tuple[int, int, int]]]:
+        """
+        Get the best solution found so far by an anytime search.
+        
+        Returns:
+            The shortest solution published by the running or last search, or None
+            if the search has not published any (only anytime searches do).
+        """
+        return self._stats_incumbent
+    
     def _display_search_statistics(self) -> None:
         """Display comprehensive search statistics."""
         if self._stats_start_time is None or self._stats_end_time is None:
@@ -172,6 +227,10 @@ class BaseSolver(abc.ABC):
         Returns:
             A list of tuples (from_peg, to_peg, num_disks) representing all legal moves.
         """
+        # Bitboard states generate their moves with integer bit operations
+        if isinstance(current_state, BitboardHanoiState):
+            return current_state.get_possible_moves(max_liftable_disks)
+        
         moves = []
         num_pegs = len(current_state.pegs)
         
@@ -197,6 +256,118 @@ class BaseSolver(abc.ABC):
                         
         return moves
     
+    @staticmethod
+    def _is_redundant_move(move: Tuple[int, int, int], last_move: Optional[Tuple[int, int, int]]) -> bool:
+        """
+        Tells whether a move lifts again exactly the disks placed by the previous move.
+
+        Moving the same disks twice in a row either undoes the first move or
+        can be replaced by a single move from where they were: the disks they
+        land on, and the disk below them at the start, are the same in both
+        cases. Such a pair is never part of a shortest solution, and the
+        replacement move is never redundant itself: it lifts the same disks as
+        the first move of the pair, which was not redundant either. Pruning
+        these moves therefore keeps every state reachable at its optimal
+        distance.
+
+        Args:
+            move: The (from_peg, to_peg, num_disks) move to check.
+            last_move: The move that produced the current state, or None at the root.
+
+        Returns:
+            True if the move can be pruned.
+        """
+        return last_move is not None and move[0] == last_move[1] and move[2] == last_move[2]
+
+    def _settled_disks_per_peg(self, state) -> List[int]:
+        """
+        Counts the settled disks of a state on each peg.
+
+        The settled disks are the largest disks, as long as each one sits on its
+        peg of the target state. They are at the bottom of their pegs, below
+        every other disk, so only the settled disks and the first unsettled one
+        are looked at.
+
+        Args:
+            state: The state to check against the target state.
+
+        Returns:
+            The number of settled disks on each of the three pegs.
+        """
+        if self._settled_order is None:
+            self._settled_order = self._target_pegs_by_size()
+
+        counts = [0, 0, 0]
+        if isinstance(state, BitboardHanoiState):
+            # Disks are mask bits of their ranks, the largest disk being the highest bit
+            masks = state.masks
+            for disk_rank, peg_idx in self._settled_order:
+                if not masks[peg_idx] >> disk_rank & 1:
+                    break
+                counts[peg_idx] += 1
+        else:
+            # Pegs list their disks bottom first: the next settled disk sits just above the settled ones
+            pegs = state.pegs
+            for disk, peg_idx in self._settled_order:
+                peg = pegs[peg_idx]
+                if len(peg) <= counts[peg_idx] or peg[counts[peg_idx]] != disk:
+                    break
+                counts[peg_idx] += 1
+        return counts
+
+    def _target_pegs_by_size(self) -> List[Tuple[int, int]]:
+        """
+        Lists the 0-indexed target peg of every disk, largest disk first.
+
+        Returns:
+            (disk, peg) pairs, where disk is the mask bit of the disk for bitboard
+            states and its label otherwise.
+        """
+        target_state = self.target_state
+        if isinstance(target_state, BitboardHanoiState):
+            return [(disk_rank, peg_idx) for disk_rank in range(target_state.number_of_disks - 1, -1, -1)
+                    for peg_idx, mask in enumerate(target_state.masks) if mask >> disk_rank & 1]
+        return sorted(((disk, peg_idx) for peg_idx, peg in enumerate(target_state.pegs) for disk in peg),
+                      reverse=True)
+
+    def _get_successors(self, current_state, max_liftable_disks: int = 1,
+                        last_move: Optional[Tuple[int, int, int]] = None,
+                        lock_settled: bool = False) -> Iterator[Tuple[Tuple[int, int, int], Any]]:
+        """
+        Lazily generates all legal moves from a given state with their outcome.
+
+        This is the move generator used by the search-based solvers. Unlike
+        `_get_possible_moves` followed by `apply_move`, it never produces an
+        illegal move and builds each next state without re-validating it.
+
+        Args:
+            current_state: The current Hanoi state to expand.
+            max_liftable_disks: The maximum number of disks that can be lifted at once.
+            last_move: The move that produced the current state. When given, the
+                       moves lifting those same disks again are pruned (see
+                       `_is_redundant_move`).
+            lock_settled: If True, the moves lifting a settled disk are pruned (see
+                          `_settled_disks_per_peg`). The puzzle from a state without
+                          its settled disks has the same distance to the target, and
+                          solving it never moves them, so every state keeps an
+                          optimal path to the target.
+
+        Returns:
+            An iterator of (move, next_state) pairs, where move is
+            (from_peg, to_peg, num_disks).
+        """
+        successors = current_state.successors(max_liftable_disks)
+        if lock_settled:
+            # The disks that can still move on each peg, above the settled ones
+            settled = self._settled_disks_per_peg(current_state)
+            movable = [len(peg) - settled[peg_index] for peg_index, peg in enumerate(current_state.pegs)]
+            successors = ((move, next_state) for move, next_state in successors
+                          if move[2] <= movable[move[0] - 1])
+        if last_move is None:
+            return successors
+        return ((move, next_state) for move, next_state in successors
+                if not self._is_redundant_move(move, last_move))
+
     def get_stats(self) -> dict:
         """
         Get statistics about the last solve operation.
@@ -214,7 +385,10 @@ class BaseSolver(abc.ABC):
             'nodes_generated': self._stats_nodes_generated,
             'max_data_structure_size': self._stats_max_data_structure_size,
             'iterations': self._stats_iterations,
-            'cutoff_bounds': self._stats_cutoff_bounds.copy() if self._stats_cutoff_bounds else []
+            'cutoff_bounds': self._stats_cutoff_bounds.copy() if self._stats_cutoff_bounds else [],
+            'lower_bound': self._stats_lower_bound,
+            'suboptimality_bound': (None if self._stats_incumbent is None else
+                                    self.suboptimality_bound(len(self._stats_incumbent), self._stats_lower_bound))
         }
     
  
\ No newline at end of file
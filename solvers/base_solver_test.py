@@ -0,0 +1,35 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+import unittest
+
+from .bitboard_state import BitboardHanoiState
+from .blind_search.bfs_solver import GeneralBFSSolver
+from .hanoi_state import HanoiState
+
+def settled_disks_per_peg(state, target_state):
+    # The largest disks, as long as each one sits on its target peg
+    peg_of = {disk: peg_idx for peg_idx, peg in enumerate(state.pegs) for disk in peg}
+    target_peg_of = {disk: peg_idx for peg_idx, peg in enumerate(target_state.pegs) for disk in peg}
+    counts = [0, 0, 0]
+    for disk in sorted(peg_of, reverse=True):
+        if peg_of[disk] != target_peg_of[disk]:
+            break
+        counts[peg_of[disk]] += 1
+    return counts
+
+class TestSettledDisks(unittest.TestCase):
+    def test_counts_match_definition(self):
+        for labels in ((1, 2, 3, 4, 5), (2, 4, 7, 8, 11)):
+            states = [HanoiState.unrank(rank, len(labels), labels) for rank in range(3 ** len(labels))]
+            for target_state in states[::7]:
+                for convert in (lambda state: state, BitboardHanoiState.from_state):
+                    solver = GeneralBFSSolver(convert(states[0]), convert(target_state))
+                    for state in states:
+                        self.assertEqual(solver._settled_disks_per_peg(convert(state)),
+                                         settled_disks_per_peg(state, target_state))
+
+if __name__ == '__main__':
+    unittest.main()
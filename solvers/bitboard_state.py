@@ -0,0 +1,381 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+"""
+Bitboard state representation for Tower of Hanoi puzzles.
+
+This module provides an alternative state engine to `HanoiState`. Each peg is
+stored as an integer bitmask over dense disk ranks, so finding the top disk,
+checking the legality of a move and applying it are a handful of integer bit
+operations, and the whole state packs into a single hashable integer.
+"""
+
+from typing import Iterator, List, Optional, Tuple, Union
+
+from .hanoi_state import HanoiState
+
+
+# Base-3 value of every byte read as a set of digits: bit i contributes 3^i
+_TERNARY_OF_BYTE = tuple(sum(3 ** i for i in range(8) if byte >> i & 1) for byte in range(256))
+
+
+def _ternary_of_mask(mask: int) -> int:
+    """
+    Reads a bitmask as a base-3 number whose digits are its bits.
+
+    Args:
+        mask: A non-negative bitmask.
+
+    Returns:
+        The sum of 3^i over all set bits i of the mask.
+    """
+    value = 0
+    scale = 1
+    while mask:
+        value += _TERNARY_OF_BYTE[mask & 0xFF] * scale
+        mask >>= 8
+        scale *= 6561  # 3^8
+    return value
+
+
+class BitboardHanoiState:
+    """
+    Represents a single, immutable Tower of Hanoi state as three bitmasks.
+
+    Disk labels are normalized to dense ranks 1..n when the state is built:
+    the i-th smallest disk is stored as bit (i - 1) of the mask of the peg it
+    sits on. Since disks on a peg are always stacked by size, the lowest set bit
+    of a mask is the top disk of that peg, and the whole peg content can be
+    recovered from the mask alone. The original labels are kept aside, so that
+    `pegs` and `render` show the same disks the user specified.
+
+    The class exposes the same interface as `HanoiState` (`pegs`,
+    `number_of_disks`, `apply_move`, `successors`, `rank`, `unrank`,
+    `render`, `get_classical_peg_if_any`),
+    so every solver can run on it unchanged.
+
+    Attributes:
+        masks (tuple[int, int, int]): The bitmask of disk ranks on each peg.
+        number_of_disks (int): The total number of disks in this puzzle state.
+        labels (tuple[int, ...]): The original disk label of each rank, smallest first.
+        key (int): The three masks packed into a single integer.
+    """
+    __slots__ = ('masks', 'number_of_disks', 'labels', 'key', '_pegs')
+
+    def __init__(self, masks: Tuple[int, int, int], number_of_disks: int,
+                 labels: Optional[Tuple[int, ...]] = None):
+        """
+        Initializes a new bitboard state.
+
+        Args:
+            masks: A tuple of three bitmasks, one per peg, where bit i is set if
+                   the disk of rank i + 1 sits on that peg.
+            number_of_disks: The total number of disks in the puzzle.
+            labels: The original label of each disk rank, smallest first.
+                    Defaults to the dense labels 1..n.
+
+        Raises:
+            ValueError: If the number of pegs is not exactly 3.
+        """
+        if len(masks) != 3:
+            raise ValueError("There must be exactly 3 pegs.")
+
+        self.masks = masks
+        self.number_of_disks = number_of_disks
+        self.labels = labels if labels is not None else tuple(range(1, number_of_disks + 1))
+        self.key = masks[0] | (masks[1] << number_of_disks) | (masks[2] << (2 * number_of_disks))
+        self._pegs = None
+
+    @classmethod
+    def from_pegs(cls, pegs: Tuple[Tuple[int, ...], ...],
+                  labels: Optional[Tuple[int, ...]] = None) -> 'BitboardHanoiState':
+        """
+        Creates a bitboard state from a tuple-of-tuples peg layout.
+
+        Disk labels are normalized to dense ranks: the smallest disk becomes
+        rank 1, the next one rank 2, and so on, whatever the original labels.
+
+        Args:
+            pegs: A tuple of three tuples of disk labels, largest disk first.
+            labels: The sorted disk labels to rank against. If None, they are
+                    derived from the disks found on the pegs.
+
+        Returns:
+            A `BitboardHanoiState` instance with the same layout.
+        """
+        if len(pegs) != 3:
+            raise ValueError("There must be exactly 3 pegs.")
+        if labels is None:
+            labels = tuple(sorted(disk for peg in pegs for disk in peg))
+
+        rank_of = {label: rank for rank, label in enumerate(labels)}
+        masks = [0, 0, 0]
+        for peg_idx, peg in enumerate(pegs):
+            for disk in peg:
+                masks[peg_idx] |= 1 << rank_of[disk]
+
+        return cls((masks[0], masks[1], masks[2]), len(labels), labels)
+
+    @classmethod
+    def from_state(cls, state: Union[HanoiState, 'BitboardHanoiState']) -> 'BitboardHanoiState':
+        """
+        Converts any state exposing `pegs` into a bitboard state.
+
+        Args:
+            state: The state to convert.
+
+        Returns:
+            The equivalent `BitboardHanoiState` (the state itself if it already is one).
+        """
+        if isinstance(state, cls):
+            return state
+        return cls.from_pegs(state.pegs)
+
+    @classmethod
+    def unrank(cls, rank: int, number_of_disks: int,
+               disk_labels: Optional[Tuple[int, ...]] = None) -> 'BitboardHanoiState':
+        """
+        Rebuilds the state with a given rank, as computed by `rank`.
+
+        Args:
+            rank: The rank of the state, between 0 and 3^n - 1.
+            number_of_disks: The number of disks in the puzzle.
+            disk_labels: The disk labels, smallest first. Defaults to 1..n.
+
+        Returns:
+            The `BitboardHanoiState` instance with the given rank.
+
+        Raises:
+            ValueError: If the rank is out of range for the number of disks.
+        """
+        if not (0 <= rank < 3 ** number_of_disks):
+            raise ValueError(f"Rank {rank} is out of range for {number_of_disks} disks.")
+
+        masks = [0, 0, 0]
+        for disk_rank in range(number_of_disks):
+            rank, digit = divmod(rank, 3)
+            masks[digit] |= 1 << disk_rank
+
+        return cls((masks[0], masks[1], masks[2]), number_of_disks, disk_labels)
+
+    def to_state(self) -> HanoiState:
+        """
+        Converts this bitboard state back into a tuple-based `HanoiState`.
+
+        Returns:
+            The equivalent `HanoiState`, using the original disk labels.
+        """
+        return HanoiState(self.pegs)
+
+    @property
+    def pegs(self) -> Tuple[Tuple[int, ...], ...]:
+        """
+        The peg layout as a tuple of three tuples, largest disk first.
+
+        The layout is computed on first access and cached, as it is only needed
+        for rendering and for code that has no bitboard fast path.
+        """
+        if self._pegs is None:
+            labels = self.labels
+            self._pegs = tuple(
+                tuple(labels[rank] for rank in range(self.number_of_disks - 1, -1, -1) if mask >> rank & 1)
+                for mask in self.masks
+            )
+        return self._pegs
+
+    def disk_labels(self) -> Tuple[int, ...]:
+        """
+        Returns the labels of all disks in this state, smallest first.
+        """
+        return self.labels
+
+    def rank(self) -> int:
+        """
+        Computes the dense perfect rank of this state.
+
+        The rank matches `HanoiState.rank`: base-3 digit i is the peg holding
+        the disk of rank i + 1. It is computed a byte at a time from the masks
+        of pegs 2 and 3 through a lookup table.
+
+        Returns:
+            The rank of the state, between 0 and 3^n - 1.
+        """
+        return _ternary_of_mask(self.masks[1]) + 2 * _ternary_of_mask(self.masks[2])
+
+    def render(self) -> str:
+        """
+        Generates an ASCII art representation of the current state.
+
+        Returns:
+            A string containing the rendered view of the pegs and disks.
+        """
+        from output.rendering_towers.render_hanoi_towers import render_hanoi_towers
+        return render_hanoi_towers(self.pegs)
+
+    def apply_move(self, from_peg: int, to_peg: int, how_many_disks: int = 1) -> 'BitboardHanoiState':
+        """
+        Applies a move and returns a new, resulting BitboardHanoiState object.
+
+        Args:
+            from_peg: The 1-indexed source peg number.
+            to_peg: The 1-indexed target peg number.
+            how_many_disks: The number of disks to move from top of the source peg.
+
+        Returns:
+            A new `BitboardHanoiState` instance representing the board after the move.
+
+        Raises:
+            ValueError: If peg numbers are invalid, source and target are the
+                        same, not enough disks are on the source peg, or the move
+                        is illegal (placing a larger disk on a smaller one).
+        """
+        if not (1 <= from_peg <= 3 and 1 <= to_peg <= 3):
+            raise ValueError("Peg numbers must be between 1 and 3.")
+        if from_peg == to_peg:
+            raise ValueError("Source and target pegs cannot be the same.")
+
+        from_peg_idx = from_peg - 1
+        to_peg_idx = to_peg - 1
+        source = self.masks[from_peg_idx]
+        target = self.masks[to_peg_idx]
+
+        # Peel the lifted block off the source mask, smallest disk first
+        lifted = 0
+        bottom = 0
+        for _ in range(how_many_disks):
+            if not source:
+                raise ValueError(f"Not enough disks on peg {from_peg} to move.")
+            bottom = source & -source
+            lifted |= bottom
+            source ^= bottom
+
+        if target and bottom > (target & -target):
+            raise ValueError("Cannot place a larger disk on a smaller one.")
+
+        new_masks = list(self.masks)
+        new_masks[from_peg_idx] = source
+        new_masks[to_peg_idx] = target | lifted
+
+        return BitboardHanoiState((new_masks[0], new_masks[1], new_masks[2]), self.number_of_disks, self.labels)
+
+    def get_possible_moves(self, max_liftable_disks: int = 1) -> List[Tuple[int, int, int]]:
+        """
+        Calculates all legal moves from this state using bit operations.
+
+        Args:
+            max_liftable_disks: The maximum number of disks that can be lifted at once.
+
+        Returns:
+            A list of tuples (from_peg, to_peg, num_disks) representing all legal
+            moves, in the same order as `BaseSolver._get_possible_moves`.
+        """
+        moves = []
+        masks = self.masks
+
+        for i in range(3):
+            source = masks[i]
+            if not source:
+                continue
+
+            for j in range(3):
+                if i == j:
+                    continue
+
+                target = masks[j]
+                target_top = target & -target
+                remaining = source
+
+                for k in range(1, max_liftable_disks + 1):
+                    if not remaining:
+                        break
+                    bottom = remaining & -remaining
+                    remaining ^= bottom
+                    # Lifting more disks only makes the bottom disk larger
+                    if target and bottom > target_top:
+                        break
+                    moves.append((i + 1, j + 1, k))
+
+        return moves
+
+    def successors(self, max_liftable_disks: int = 1) -> Iterator[Tuple[Tuple[int, int, int], 'BitboardHanoiState']]:
+        """
+        Lazily generates all legal moves from this state with their outcome.
+
+        The bitboard counterpart of `HanoiState.successors`: moves are legal by
+        construction, so the new masks are derived without re-validation.
+
+        Args:
+            max_liftable_disks: The maximum number of disks that can be lifted at once.
+
+        Yields:
+            Tuples (move, next_state), where move is (from_peg, to_peg, num_disks).
+        """
+        masks = self.masks
+        number_of_disks = self.number_of_disks
+        labels = self.labels
+
+        for i in range(3):
+            source = masks[i]
+            if not source:
+                continue
+
+            for j in range(3):
+                if i == j:
+                    continue
+
+                target = masks[j]
+                target_top = target & -target
+                remaining = source
+                lifted = 0
+
+                for k in range(1, max_liftable_disks + 1):
+                    if not remaining:
+                        break
+                    bottom = remaining & -remaining
+                    # Lifting more disks only makes the bottom disk larger
+                    if target and bottom > target_top:
+                        break
+                    remaining ^= bottom
+                    lifted |= bottom
+
+                    new_masks = [masks[0], masks[1], masks[2]]
+                    new_masks[i] = remaining
+                    new_masks[j] = target | lifted
+                    yield (i + 1, j + 1, k), BitboardHanoiState(
+                        (new_masks[0], new_masks[1], new_masks[2]), number_of_disks, labels)
+
+    def __hash__(self):
+        """
+        Returns the hash of the packed integer key.
+        """
+        return hash(self.key)
+
+    def __eq__(self, other):
+        """
+        Checks for equality between two BitboardHanoiState instances.
+        """
+        return (isinstance(other, BitboardHanoiState) and self.key == other.key
+                and self.number_of_disks == other.number_of_disks)
+
+    def get_classical_peg_if_any(self) -> Union[int, None]:
+        """
+        Checks if the state is a "classical" configuration.
+
+        A classical configuration is one where all disks of the puzzle are
+        stacked on a single peg and the disks are labelled 1..n.
+
+        Returns:
+            The 1-indexed number of the peg holding all the disks if it's a
+            classical configuration, otherwise None.
+        """
+        if self.labels != tuple(range(1, self.number_of_disks + 1)):
+            return None
+
+        full = (1 << self.number_of_disks) - 1
+        for peg_idx, mask in enumerate(self.masks):
+            if mask == full:
+                return peg_idx + 1
+
+        return None
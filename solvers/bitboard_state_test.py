@@ -0,0 +1,74 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+import unittest
+
+from .bitboard_state import BitboardHanoiState
+from .hanoi_state import HanoiState
+
+class TestBitboardHanoiState(unittest.TestCase):
+    def all_states(self, num_disks):
+        return [HanoiState.unrank(rank, num_disks) for rank in range(3 ** num_disks)]
+
+    def test_pegs_round_trip(self):
+        for num_disks in range(1, 6):
+            for state in self.all_states(num_disks):
+                bitboard = BitboardHanoiState.from_state(state)
+                self.assertEqual(bitboard.pegs, state.pegs)
+                self.assertEqual(bitboard.to_state(), state)
+                self.assertEqual(bitboard.rank(), state.rank())
+                self.assertEqual(BitboardHanoiState.unrank(state.rank(), num_disks), bitboard)
+                self.assertEqual(bitboard.get_classical_peg_if_any(), state.get_classical_peg_if_any())
+
+    def test_non_consecutive_labels(self):
+        state = HanoiState(((9, 4), (), (7,)))
+        bitboard = BitboardHanoiState.from_state(state)
+        self.assertEqual(bitboard.pegs, state.pegs)
+        self.assertEqual(bitboard.disk_labels(), (4, 7, 9))
+        self.assertEqual(bitboard.to_state(), state)
+        self.assertEqual(bitboard.apply_move(1, 2).pegs, ((9,), (4,), (7,)))
+
+    def test_successors_match_hanoi_state(self):
+        for num_disks in range(1, 6):
+            for max_lift in (1, 2, 3, num_disks):
+                for state in self.all_states(num_disks):
+                    bitboard = BitboardHanoiState.from_state(state)
+                    expected = [(move, next_state.pegs) for move, next_state in state.successors(max_lift)]
+                    actual = [(move, next_state.pegs) for move, next_state in bitboard.successors(max_lift)]
+                    self.assertEqual(actual, expected)
+                    self.assertEqual(bitboard.get_possible_moves(max_lift), [move for move, _ in expected])
+
+    def test_apply_move_matches_hanoi_state(self):
+        for num_disks in range(1, 5):
+            for state in self.all_states(num_disks):
+                bitboard = BitboardHanoiState.from_state(state)
+                for from_peg in (1, 2, 3):
+                    for to_peg in (1, 2, 3):
+                        for how_many in range(1, num_disks + 1):
+                            try:
+                                expected = state.apply_move(from_peg, to_peg, how_many)
+                            except ValueError:
+                                with self.assertRaises(ValueError):
+                                    bitboard.apply_move(from_peg, to_peg, how_many)
+                                continue
+                            self.assertEqual(bitboard.apply_move(from_peg, to_peg, how_many).pegs, expected.pegs)
+
+    def test_hashing_and_equality(self):
+        states = self.all_states(4)
+        bitboards = {BitboardHanoiState.from_state(state) for state in states}
+        self.assertEqual(len(bitboards), len(states))
+        for state in states:
+            first = BitboardHanoiState.from_state(state)
+            second = BitboardHanoiState.from_pegs(state.pegs)
+            self.assertEqual(first, second)
+            self.assertEqual(hash(first), hash(second))
+            self.assertIn(second, bitboards)
+            self.assertNotEqual(first, state)
+
+        # The same masks over a different number of disks are different states
+        self.assertNotEqual(BitboardHanoiState.unrank(0, 2), BitboardHanoiState.unrank(0, 3))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -11,12 +11,18 @@ ends simultaneously.
 """
 
 from .bfs_solver import GeneralBFSSolver
+from .parallel_bfs_solver import ParallelBFSSolver
+from .external_bfs_solver import ExternalBFSSolver
+from .distance_table_solver import DistanceTableSolver
 from .dfs_solver import DFSSolver
 from .iterative_deepening_solver import IterativeDeepeningSolver
 from .bidirectional_search import BidirectionalBFSSolver, ParallelBidirectionalBFSSolver
 
 __all__ = [
     'GeneralBFSSolver',
+    'ParallelBFSSolver',
+    'ExternalBFSSolver',
+    'DistanceTableSolver',
     'DFSSolver', 
     'BidirectionalBFSSolver',
     'ParallelBidirectionalBFSSolver',
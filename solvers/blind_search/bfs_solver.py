@@ -6,15 +6,10 @@
 """
 Implements the general-purpose BFS solver for any valid Tower of Hanoi puzzle.
 """
-from typing import List, Deque, TYPE_CHECKING, Tuple, Set
+from typing import List, Deque, Tuple
 from collections import deque
 from ..base_solver import BaseSolver
-
-if TYPE_CHECKING:
-    import sys
-    import os
-    sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-    from ..hanoi_state import HanoiState
+from ..search_nodes import create_arena
 
 class GeneralBFSSolver(BaseSolver):
     """
@@ -24,12 +19,17 @@ class GeneralBFSSolver(BaseSolver):
     valid, solvable puzzle configuration. It is more general but less
     performant than the recursive solver for classical puzzles.
     """
-    def _solve_internal(self, max_liftable_disks: int = 1) -> List[Tuple[int, int, int]]:
+    def _solve_internal(self, max_liftable_disks: int = 1, visited: str = 'set',
+                        lock_settled: bool = False) -> List[Tuple[int, int, int]]:
         """
         Performs breadth-first search to find the shortest solution.
         
         Args:
             max_liftable_disks: The max number of disks that can be lifted at once.
+            visited: Duplicate detection structure, 'set' (hash set of states) or
+                     'bitmap' (one bit per state rank, for large instances).
+            lock_settled: If True, never move the largest disks again once they sit on their
+                          target pegs (see `BaseSolver._get_successors`).
             
         Returns:
             A list of moves representing the shortest solution path.
@@ -37,9 +37,9 @@ class GeneralBFSSolver(BaseSolver):
         Raises:
             RuntimeError: If no solution is found (should not happen for valid puzzles).
         """
-        # Initialize queue with the initial state
-        queue: Deque[Tuple['HanoiState', List[Tuple[int, int, int]]]] = deque([(self.initial_state, [])])
-        visited: Set['HanoiState'] = set()
+        # Every generated node is stored once in the arena; the queue only holds node indices
+        arena = create_arena(self.initial_state, visited)
+        queue: Deque[int] = deque([0])
         
         # Track initial state generation
         self._stats_node_generated()
@@ -48,36 +48,26 @@ class GeneralBFSSolver(BaseSolver):
             # Track maximum queue size
             self._stats_data_structure_size(len(queue))
             
-            current_state, path = queue.popleft()
-            
-            # Skip if we've already visited this state
-            if current_state in visited:
-                continue
-            
-            # Mark as visited and count as explored
-            visited.add(current_state)
+            node = queue.popleft()
+            current_state = arena.states[node]
             self._stats_node_explored()
             
+            # Every state closer to the initial state has been expanded without reaching the target
+            depth = arena.depth(node)
+            if depth > self._stats_lower_bound:
+                self._stats_record_lower_bound(depth)
+            
             # Check if we've reached the target
             if current_state == self.target_state:
-                return path
-            
-            # Generate all possible moves from the current state
-            possible_moves = self._get_possible_moves(current_state, max_liftable_disks)
+                return arena.path_to(node)
             
-            for from_peg, to_peg, num_disks in possible_moves:
-                try:
-                    next_state = current_state.apply_move(from_peg, to_peg, num_disks)
-                    
-                    # Skip if already visited
-                    if next_state not in visited:
-                        new_path = path + [(from_peg, to_peg, num_disks)]
-                        queue.append((next_state, new_path))
-                        self._stats_node_generated()
-                        
-                except ValueError:
-                    # Invalid move, skip
-                    continue
+            # Generate all successors of the current state
+            for move, next_state in self._get_successors(current_state, max_liftable_disks, lock_settled=lock_settled):
+                # Duplicates are detected at generation time
+                child = arena.add_if_new(next_state, node, move)
+                if child is not None:
+                    queue.append(child)
+                    self._stats_node_generated()
         
         # Should never reach here for valid Tower of Hanoi puzzles
         raise RuntimeError("BFS search completed without finding a solution. This indicates a bug.")
@@ -11,11 +11,11 @@ searches from both the initial state forward and the target state backward
 until the two search frontiers meet.
 """
 
-from collections import deque
 from typing import List, Tuple, Dict, Any, Optional
 
 from ...base_solver import BaseSolver
 from ...hanoi_state import HanoiState
+from ...search_nodes import SearchNodeArena, create_arena
 
 class BidirectionalBFSSolver(BaseSolver):
     """
@@ -24,6 +24,18 @@ class BidirectionalBFSSolver(BaseSolver):
     This solver searches simultaneously from both the initial state (forward)
     and the target state (backward) until the two search frontiers meet.
     This can significantly reduce the search space compared to unidirectional BFS.
+    
+    The search is layer-synchronous: each step expands one full layer of the
+    direction whose frontier is smaller, and checks every newly generated
+    state against all the states known to the other direction. Each direction
+    stores parent pointers only, in a node arena, and the solution is rebuilt
+    from both sides of the best meeting state.
+    
+    Termination is optimal: once the forward search has generated every state
+    within d_f moves of the initial state and the backward search every state
+    within d_b moves of the target, every solution of at most d_f + d_b moves
+    passes through a state known to both, so a meeting cost at most d_f + d_b
+    is the shortest solution.
     """
     
     def __init__(self, initial_state: HanoiState, target_state: HanoiState):
@@ -40,96 +52,127 @@ class BidirectionalBFSSolver(BaseSolver):
         self._forward_path = []
         self._backward_path = []
         
-    def _solve_internal(self, max_liftable_disks: int = 1) -> List[Tuple[int, int, int]]:
+    def _solve_internal(self, max_liftable_disks: int = 1, visited: str = 'set') -> List[Tuple[int, int, int]]:
         """
-        Solve the puzzle using bidirectional BFS.
+        Solve the puzzle using layer-synchronous bidirectional BFS.
         
         Args:
             max_liftable_disks: Maximum number of disks that can be lifted at once.
+            visited: Duplicate detection structure, 'set' (hash set of states) or
+                     'bitmap' (one bit per state rank, for large instances).
             
         Returns:
-            A list of moves representing the solution path.
+            A list of moves representing the shortest solution path.
+            
+        Raises:
+            RuntimeError: If the searches never meet (should not happen for valid puzzles).
         """
-        # Initialize forward and backward search frontiers
-        forward_queue = deque([(self.initial_state, [])])
-        backward_queue = deque([(self.target_state, [])])
+        # Each direction stores its nodes in an arena; the frontiers only hold node indices
+        forward_arena = create_arena(self.initial_state, visited)
+        backward_arena = create_arena(self.target_state, visited)
+        forward_frontier = [0]
+        backward_frontier = [0]
+        forward_depth = backward_depth = 0
         
-        # Track visited states and their paths
-        forward_visited = {self.initial_state: []}
-        backward_visited = {self.target_state: []}
+        # Track initial and target state generation
+        self._stats_node_generated()
+        self._stats_node_generated()
         
-        # Alternate between forward and backward search
-        forward_turn = True
+        if self.initial_state == self.target_state:
+            return self._meet(forward_arena, 0, backward_arena, 0)
         
-        while forward_queue or backward_queue:
+        # Best meeting found so far: (cost, forward node, backward node)
+        best: Optional[Tuple[int, int, int]] = None
+        
+        while forward_frontier and backward_frontier:
             # Update statistics
-            self._stats_data_structure_size(len(forward_queue) + len(backward_queue))
+            self._stats_data_structure_size(len(forward_frontier) + len(backward_frontier))
             
-            if forward_turn and forward_queue:
-                # Forward search step
-                current_state, path = forward_queue.popleft()
-                self._stats_node_explored()
-                
-                # Check if we've met the backward search
-                if current_state in backward_visited:
-                    # Found intersection!
-                    backward_path = backward_visited[current_state]
-                    return self._construct_solution_path(path, backward_path)
-                
-                # Generate moves from current state
-                moves = self._get_possible_moves(current_state, max_liftable_disks)
-                
-                for move in moves:
-                    from_peg, to_peg, num_disks = move
-                    
-                    try:
-                        new_state = current_state.apply_move(from_peg, to_peg, num_disks)
-                        
-                        if new_state not in forward_visited:
-                            forward_visited[new_state] = path + [move]
-                            forward_queue.append((new_state, path + [move]))
-                            self._stats_node_generated()
-                            
-                    except ValueError:
-                        # Invalid move, skip
-                        continue
-                        
+            # Expand one full layer of the smaller frontier
+            if len(forward_frontier) <= len(backward_frontier):
+                forward_frontier, meeting = self._expand_layer(
+                    forward_arena, forward_frontier, backward_arena, max_liftable_disks)
+                forward_depth += 1
+                if meeting is not None:
+                    node, other_node = meeting
+                    cost = forward_depth + backward_arena.depth(other_node)
+                    if best is None or cost < best[0]:
+                        best = (cost, node, other_node)
             else:
-                # Backward search step
-                if backward_queue:
-                    current_state, path = backward_queue.popleft()
-                    self._stats_node_explored()
-                    
-                    # Check if we've met the forward search
-                    if current_state in forward_visited:
-                        # Found intersection!
-                        forward_path = forward_visited[current_state]
-                        return self._construct_solution_path(forward_path, path)
-                    
-                    # Generate moves from current state (backward)
-                    moves = self._get_possible_moves(current_state, max_liftable_disks)
-                    
-                    for move in moves:
-                        from_peg, to_peg, num_disks = move
-                        
-                        try:
-                            new_state = current_state.apply_move(from_peg, to_peg, num_disks)
-                            
-                            if new_state not in backward_visited:
-                                backward_visited[new_state] = path + [move]
-                                backward_queue.append((new_state, path + [move]))
-                                self._stats_node_generated()
-                                
-                        except ValueError:
-                            # Invalid move, skip
-                            continue
+                # Moves are reversible, so predecessors are generated like successors
+                backward_frontier, meeting = self._expand_layer(
+                    backward_arena, backward_frontier, forward_arena, max_liftable_disks)
+                backward_depth += 1
+                if meeting is not None:
+                    node, other_node = meeting
+                    cost = backward_depth + forward_arena.depth(other_node)
+                    if best is None or cost < best[0]:
+                        best = (cost, other_node, node)
             
-            # Alternate between forward and backward search
-            forward_turn = not forward_turn
+            # Every solution of at most forward_depth + backward_depth moves has been seen
+            if best is not None and best[0] <= forward_depth + backward_depth:
+                return self._meet(forward_arena, best[1], backward_arena, best[2])
         
         # No solution found
         raise RuntimeError("No solution found")
     
+    def _expand_layer(self, arena: SearchNodeArena, frontier: List[int], other_arena: SearchNodeArena,
+                      max_liftable_disks: int) -> Tuple[List[int], Optional[Tuple[int, int]]]:
+        """
+        Generates the next layer of a search direction, checking it against the other direction.
+        
+        Args:
+            arena: The node arena of the search direction.
+            frontier: The nodes of the current layer of the search direction.
+            other_arena: The node arena of the opposite direction.
+            max_liftable_disks: Maximum number of disks that can be lifted at once.
+            
+        Returns:
+            A (next_frontier, meeting) tuple, where meeting is the pair (node,
+            other_node) of the first generated state known to the other
+            direction, or None if there is none and the layer is complete.
+        """
+        next_frontier: List[int] = []
+        
+        for node in frontier:
+            current_state = arena.states[node]
+            self._stats_node_explored()
+            
+            for move, new_state in self._get_successors(current_state, max_liftable_disks):
+                child = arena.add_if_new(new_state, node, move)
+                if child is None:
+                    continue
+                next_frontier.append(child)
+                self._stats_node_generated()
+                
+                # Check intersections as soon as states are generated. Meetings closer to the
+                # other end would have been found in earlier layers, so every meeting of this
+                # layer has the same cost, and the first one ends the layer
+                other_node = other_arena.node_of(new_state)
+                if other_node is not None:
+                    return next_frontier, (child, other_node)
+        
+        return next_frontier, None
+    
+    def _meet(self, forward_arena: SearchNodeArena, forward_node: int,
+              backward_arena: SearchNodeArena, backward_node: int) -> List[Tuple[int, int, int]]:
+        """
+        Builds the solution through a state reached by both searches.
+        
+        Args:
+            forward_arena: The node arena of the forward search.
+            forward_node: The meeting node in the forward arena.
+            backward_arena: The node arena of the backward search.
+            backward_node: The meeting node in the backward arena.
+            
+        Returns:
+            Complete solution path from initial to target state.
+        """
+        self._meeting_point = forward_arena.states[forward_node]
+        self._forward_path = forward_arena.path_to(forward_node)
+        self._backward_path = backward_arena.path_to(backward_node)
+        return self._construct_solution_path(self._forward_path, self._backward_path)
+    
     def _construct_solution_path(self, forward_path: List[Tuple[int, int, int]], 
                                backward_path: List[Tuple[int, int, int]]) -> List[Tuple[int, int, int]]:
         """
@@ -173,58 +216,6 @@ class BidirectionalBFSSolver(BaseSolver):
         })
         return base_stats
     
-    def _expand_forward(self, queue: deque, visited: Dict, max_liftable_disks: int) -> None:
-        """Expands one level of the forward search."""
-        if not queue:
-            return
-            
-        current_state, path = queue.popleft()
-        possible_moves = self._get_possible_moves(current_state, max_liftable_disks)
-        
-        for from_peg, to_peg, num_disks in possible_moves:
-            try:
-                next_state = current_state.apply_move(from_peg, to_peg, num_disks)
-                if next_state not in visited:
-                    new_path = path + [(from_peg, to_peg, num_disks)]
-                    visited[next_state] = new_path
-                    queue.append((next_state, new_path))
-            except ValueError:
-                continue
-    
-    def _expand_backward(self, queue: deque, visited: Dict, max_liftable_disks: int) -> None:
-        """Expands one level of the backward search."""
-        if not queue:
-            return
-            
-        current_state, path = queue.popleft()
-        possible_moves = self._get_possible_moves(current_state, max_liftable_disks)
-        
-        for from_peg, to_peg, num_disks in possible_moves:
-            try:
-                next_state = current_state.apply_move(from_peg, to_peg, num_disks)
-                if next_state not in visited:
-                    # For backward search, we store the reverse move
-                    new_path = [(to_peg, from_peg, num_disks)] + path
-                    visited[next_state] = new_path
-                    queue.append((next_state, new_path))
-            except ValueError:
-                continue
-    
-    def _find_intersection(self, forward_visited: Dict, backward_visited: Dict) -> Optional['HanoiState']:
-        """Finds if forward and backward searches have met at a common state."""
-        common_states = set(forward_visited.keys()) & set(backward_visited.keys())
-        if common_states:
-            return next(iter(common_states))  # Return any common state
-        return None
-    
-    def _reconstruct_path(self, intersection: 'HanoiState', forward_visited: Dict, backward_visited: Dict) -> List[tuple[int, int, int]]:
-        """Reconstructs the complete path from initial to target via the intersection."""
-        forward_path = forward_visited[intersection]
-        backward_path = backward_visited[intersection]
-        
-        # The backward path is already reversed, so we can concatenate directly
-        return forward_path + backward_path
-    
     def _reverse_path(self, path: List[Tuple[int, int, int]]) -> List[Tuple[int, int, int]]:
         """
         Reverses a path by swapping source and destination pegs and reversing order.
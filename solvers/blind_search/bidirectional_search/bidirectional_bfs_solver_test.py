@@ -0,0 +1,36 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+import unittest
+
+from ...hanoi_state import HanoiState
+from ...testing import SolverTestCase, bfs_distances, replay
+from .bidirectional_bfs_solver import BidirectionalBFSSolver
+
+class TestBidirectionalBFSSolver(SolverTestCase):
+    def test_optimal(self):
+        num_disks = 5
+        target_state = HanoiState.unrank(3 ** num_disks // 3, num_disks)
+        for max_lift in (1, 2, 3):
+            for visited in ('set', 'bitmap'):
+                self.assertOptimal(
+                    lambda initial_state: BidirectionalBFSSolver(initial_state, target_state)._solve_internal(
+                        max_lift, visited=visited),
+                    target_state, max_lift, range(3 ** num_disks))
+
+    def test_non_consecutive_labels(self):
+        initial_state = HanoiState(((9, 4), (), (7,)))
+        target_state = HanoiState(((), (9, 7, 4), ()))
+        for visited in ('set', 'bitmap'):
+            solution = BidirectionalBFSSolver(initial_state, target_state)._solve_internal(visited=visited)
+            self.assertEqual(len(solution), bfs_distances(initial_state)[target_state])
+            self.assertEqual(replay(solution, initial_state), target_state)
+
+    def test_same_initial_and_target(self):
+        state = HanoiState.classic_init(4, on_peg=2)
+        self.assertEqual(BidirectionalBFSSolver(state, state)._solve_internal(), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,7 +9,6 @@ Implements a parallel bidirectional BFS solver using multi-threading.
 from typing import List, Dict, Optional, TYPE_CHECKING, Tuple, Any
 from collections import deque
 import threading
-import time
 import sys
 import os
 
@@ -17,6 +16,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from solvers.base_solver import BaseSolver
+from solvers.search_nodes import SearchNodeArena, create_arena
 
 if TYPE_CHECKING:
     from ...hanoi_state import HanoiState
@@ -27,58 +27,69 @@ class ParallelBidirectionalBFSSolver(BaseSolver):
     
     This solver runs forward and backward searches in separate threads to
     exploit multi-core hardware while avoiding the overhead of inter-process
-    communication. It uses thread-safe data structures for coordination.
+    communication. Each thread checks every state it inserts against the
+    opposite search, so meetings are found as they happen; the solve stops,
+    through an event, once no undiscovered meeting can beat the best one.
     """
     
     def __init__(self, initial_state: 'HanoiState', target_state: 'HanoiState'):
         super().__init__(initial_state, target_state)
         
-        # Thread-safe shared data structures
-        self._forward_visited = {}  # Dict[HanoiState, List[move]]
-        self._backward_visited = {}  # Dict[HanoiState, List[move]]
+        # Thread-safe shared data structures (node arenas with parent pointers)
+        self._forward_arena: Optional[SearchNodeArena] = None
+        self._backward_arena: Optional[SearchNodeArena] = None
         self._forward_lock = threading.Lock()
         self._backward_lock = threading.Lock()
         
-        # Solution sharing
-        self._solution = None
-        self._solution_lock = threading.Lock()
+        # Best meeting so far, as (cost, forward node, backward node), and the depth
+        # each direction is expanding (every state closer to its root is generated)
+        self._best_meeting: Optional[Tuple[int, int, int]] = None
+        self._expanding_depths = [0, 0]
+        self._meeting_lock = threading.Lock()
         
-        # Thread coordination
+        # Thread coordination: set once the best meeting is optimal, the searches
+        # are exhausted or the solve is abandoned
         self._solution_found = threading.Event()
-        self._threads_finished = threading.Event()
         
         # Statistics from both threads
         self._forward_stats = {'generated': 0, 'explored': 0, 'max_queue_size': 0}
         self._backward_stats = {'generated': 0, 'explored': 0, 'max_queue_size': 0}
         self._stats_lock = threading.Lock()
     
-    def _solve_internal(self, max_liftable_disks: int = 1) -> List[Tuple[int, int, int]]:
+    def _solve_internal(self, max_liftable_disks: int = 1, visited: str = 'set',
+                        timeout: Optional[float] = None) -> List[Tuple[int, int, int]]:
         """
         Performs parallel bidirectional BFS to find the optimal solution.
         
         Args:
             max_liftable_disks: The max number of disks that can be lifted at once.
+            visited: Duplicate detection structure, 'set' (hash set of states) or
+                     'bitmap' (one bit per state rank, for large instances).
+            timeout: Seconds to wait for the searches before giving up, or None
+                     to wait until they finish. The driver passes its own timeout.
             
         Returns:
             A list of moves representing the shortest solution path.
+            
+        Raises:
+            RuntimeError: If the searches time out or end without meeting.
         """
-        # Reset state for this solve
-        self._forward_visited.clear()
-        self._backward_visited.clear()
-        self._solution = None
+        # Reset state for this solve, rooting each arena at its start state
+        self._forward_arena = create_arena(self.initial_state, visited)
+        self._backward_arena = create_arena(self.target_state, visited)
+        self._best_meeting = None
+        self._expanding_depths = [0, 0]
         self._solution_found.clear()
-        self._threads_finished.clear()
         self._forward_stats = {'generated': 0, 'explored': 0, 'max_queue_size': 0}
         self._backward_stats = {'generated': 0, 'explored': 0, 'max_queue_size': 0}
         
-        # Initialize visited dictionaries with start states
-        self._forward_visited[self.initial_state] = []
-        self._backward_visited[self.target_state] = []
-        
         # Track initial state generation
         self._stats_node_generated()  # Initial state
         self._stats_node_generated()  # Target state
         
+        if self.initial_state == self.target_state:
+            return []
+        
         # Create and start threads
         forward_thread = threading.Thread(
             target=self._search_forward,
@@ -95,214 +106,162 @@ class ParallelBidirectionalBFSSolver(BaseSolver):
         forward_thread.start()
         backward_thread.start()
         
-        # Adaptive intersection checking with exponentially increasing intervals
-        timeout = 60.0  # 60 second timeout
-        check_interval = 1e-6  # Start at 1 microsecond
-        interval_multiplier = 1.2  # Increase by 20% each time
-        max_interval = 1.0  # Cap at 1 second
-        start_time = time.time()
+        # The searches signal the event themselves: no polling
+        finished = self._solution_found.wait(timeout)
         
-        while time.time() - start_time < timeout:
-            # Check if both threads are still alive
-            if not forward_thread.is_alive() and not backward_thread.is_alive():
-                break
-                
-            # Check for intersections
-            if self._check_for_intersections():
-                # Found intersections, signal threads to stop
-                self._solution_found.set()
-                break
-                
-            # Sleep for current interval
-            time.sleep(check_interval)
-            
-            # Increase interval for next check (adaptive timing)
-            check_interval = min(check_interval * interval_multiplier, max_interval)
-        
-        # Signal threads to stop if they haven't already
+        # Signal threads to stop if they haven't already, and wait for them
         self._solution_found.set()
-        
-        # Wait for threads to finish
-        forward_thread.join(timeout=5.0)
-        backward_thread.join(timeout=5.0)
-        
-        # Find optimal solution among all intersections
-        optimal_solution = self._find_optimal_solution()
+        forward_thread.join()
+        backward_thread.join()
         
         # Collect final statistics
-        with self._stats_lock:
-            for _ in range(self._forward_stats['generated']):
-                self._stats_node_generated()
-            for _ in range(self._forward_stats['explored']):
-                self._stats_node_explored()
-            for _ in range(self._backward_stats['generated']):
-                self._stats_node_generated()
-            for _ in range(self._backward_stats['explored']):
-                self._stats_node_explored()
+        self._stats_nodes_generated += self._forward_stats['generated'] + self._backward_stats['generated']
+        self._stats_nodes_explored += self._forward_stats['explored'] + self._backward_stats['explored']
+        self._stats_data_structure_size(self._forward_stats['max_queue_size'] + self._backward_stats['max_queue_size'])
+        
+        if not finished:
+            raise RuntimeError(f"Parallel bidirectional BFS timed out after {timeout} seconds.")
+        if self._best_meeting is None:
+            raise RuntimeError("Parallel bidirectional BFS completed without finding a solution. This indicates a bug.")
         
-        # Return solution or raise error
-        if optimal_solution is not None:
-            return optimal_solution
-        else:
-            raise RuntimeError("Parallel bidirectional BFS timed out without finding a solution.")
+        # The backward path leads from the target to the meeting state: reverse it and invert its moves
+        _, forward_node, backward_node = self._best_meeting
+        forward_path = self._forward_arena.path_to(forward_node)
+        backward_path = self._backward_arena.path_to(backward_node)
+        return forward_path + [(to_p, from_p, num_d) for from_p, to_p, num_d in reversed(backward_path)]
     
-    def _check_for_intersections(self) -> bool:
+    def _search_forward(self, max_liftable_disks: int) -> None:
         """
-        Check if there are any intersections between forward and backward searches.
+        Forward search thread that explores from initial state toward target.
         
-        Returns:
-            True if intersections are found, False otherwise.
+        Args:
+            max_liftable_disks: Maximum number of disks that can be lifted at once.
         """
-        try:
-            # Quick check without full intersection computation
-            with self._forward_lock:
-                forward_states = set(self._forward_visited.keys())
-            with self._backward_lock:
-                backward_states = set(self._backward_visited.keys())
-            
-            return bool(forward_states & backward_states)
-        except:
-            return False
+        self._search_direction(0, self._forward_arena, self._forward_lock,
+                               self._backward_arena, self._backward_lock,
+                               self._forward_stats, max_liftable_disks)
     
-    def _find_optimal_solution(self) -> Optional[List[Tuple[int, int, int]]]:
+    def _search_backward(self, max_liftable_disks: int) -> None:
         """
-        Find the optimal solution among all intersection states.
+        Backward search thread that explores from target state toward initial.
         
-        Returns:
-            The optimal solution path, or None if no intersections found.
+        Args:
+            max_liftable_disks: Maximum number of disks that can be lifted at once.
         """
-        try:
-            # Get snapshots of both visited dictionaries
-            with self._forward_lock:
-                forward_visited = dict(self._forward_visited)
-            with self._backward_lock:
-                backward_visited = dict(self._backward_visited)
-            
-            # Find all intersection states
-            forward_states = set(forward_visited.keys())
-            backward_states = set(backward_visited.keys())
-            intersection_states = forward_states & backward_states
-            
-            if not intersection_states:
-                return None
-            
-            # Find the intersection state that gives the shortest total path
-            best_total_length = float('inf')
-            best_solution = None
-            
-            for state in intersection_states:
-                forward_path = forward_visited[state]
-                backward_path = backward_visited[state]
-                total_length = len(forward_path) + len(backward_path)
-                
-                if total_length < best_total_length:
-                    best_total_length = total_length
-                    # Reverse the backward path moves
-                    reversed_backward = [(to_p, from_p, num_d) for from_p, to_p, num_d in reversed(backward_path)]
-                    best_solution = forward_path + reversed_backward
-            
-            return best_solution
-            
-        except Exception as e:
-            return None
+        # Moves are reversible, so predecessors are generated like successors
+        self._search_direction(1, self._backward_arena, self._backward_lock,
+                               self._forward_arena, self._forward_lock,
+                               self._backward_stats, max_liftable_disks)
     
-    def _search_forward(self, max_liftable_disks: int) -> None:
+    def _search_direction(self, direction: int, arena: SearchNodeArena, lock: threading.Lock,
+                          other_arena: SearchNodeArena, other_lock: threading.Lock,
+                          stats: Dict[str, int], max_liftable_disks: int) -> None:
         """
-        Forward search thread that explores from initial state toward target.
+        Runs a BFS from the root of an arena until a solution is signalled.
+        
+        Every new state is looked up in the opposite arena as soon as it is
+        inserted. Of two threads inserting the same state, the second one to
+        insert it sees the first one's node, so no meeting is missed.
         
         Args:
+            direction: 0 for the forward search, 1 for the backward search.
+            arena: The node arena of this search direction.
+            lock: The lock protecting the arena.
+            other_arena: The node arena of the opposite search direction.
+            other_lock: The lock protecting the opposite arena.
+            stats: The statistics dictionary of this search direction.
             max_liftable_disks: Maximum number of disks that can be lifted at once.
         """
+        queue = deque([0])
+        local_generated = 0
+        local_explored = 0
+        local_max_queue_size = 1  # Track local maximum queue size
+        expanding_depth = 0
+        
         try:
-            queue = deque([(self.initial_state, [])])
-            local_generated = 0
-            local_explored = 0
-            local_max_queue_size = 1  # Track local maximum queue size
-            
             while queue and not self._solution_found.is_set():
                 # Update local maximum queue size (no synchronization needed)
                 local_max_queue_size = max(local_max_queue_size, len(queue))
-                current_state, path = queue.popleft()
+                node = queue.popleft()
+                
+                # Starting a new layer: every state up to this depth is now generated
+                depth = arena.depth(node)
+                if depth > expanding_depth:
+                    expanding_depth = depth
+                    self._publish_progress(direction, depth)
+                
+                current_state = arena.states[node]
                 local_explored += 1
                 
                 # Generate successors
-                possible_moves = self._get_possible_moves(current_state, max_liftable_disks)
-                for from_peg, to_peg, num_disks in possible_moves:
-                    if self._solution_found.is_set():
-                        break
-                        
-                    try:
-                        next_state = current_state.apply_move(from_peg, to_peg, num_disks)
-                        
-                        # Check if we've seen this state in forward search
-                        with self._forward_lock:
-                            if next_state not in self._forward_visited:
-                                new_path = path + [(from_peg, to_peg, num_disks)]
-                                self._forward_visited[next_state] = new_path
-                                queue.append((next_state, new_path))
-                                local_generated += 1
-                                
-                    except ValueError:
+                for move, next_state in self._get_successors(current_state, max_liftable_disks):
+                    # Check if we've seen this state in this search direction
+                    with lock:
+                        child = arena.add_if_new(next_state, node, move)
+                    if child is None:
                         continue
+                    queue.append(child)
+                    local_generated += 1
+                    
+                    # Check if the opposite search already reached it
+                    with other_lock:
+                        other_node = other_arena.node_of(next_state)
+                        other_depth = None if other_node is None else other_arena.depth(other_node)
+                    if other_node is not None:
+                        self._report_meeting(direction, depth + 1 + other_depth, child, other_node)
+        finally:
+            # An exhausted search has generated every reachable state
+            self._publish_progress(direction, float('inf'))
             
             # Update statistics
             with self._stats_lock:
-                self._forward_stats['generated'] += local_generated
-                self._forward_stats['explored'] += local_explored
-                self._forward_stats['max_queue_size'] = local_max_queue_size
-                
-        except Exception as e:
-            # Signal other thread to stop
-            self._solution_found.set()
+                stats['generated'] += local_generated
+                stats['explored'] += local_explored
+                stats['max_queue_size'] = local_max_queue_size
     
-    def _search_backward(self, max_liftable_disks: int) -> None:
+    def _report_meeting(self, direction: int, cost: int, node: int, other_node: int) -> None:
         """
-        Backward search thread that explores from target state toward initial.
+        Records a meeting of the two searches if it beats the best one so far.
         
         Args:
-            max_liftable_disks: Maximum number of disks that can be lifted at once.
+            direction: The direction that found the meeting.
+            cost: The length of the solution through the meeting state.
+            node: The meeting node in the arena of that direction.
+            other_node: The meeting node in the opposite arena.
         """
-        try:
-            queue = deque([(self.target_state, [])])
-            local_generated = 0
-            local_explored = 0
-            local_max_queue_size = 1  # Track local maximum queue size
-            
-            while queue and not self._solution_found.is_set():
-                # Update local maximum queue size (no synchronization needed)
-                local_max_queue_size = max(local_max_queue_size, len(queue))
-                current_state, path = queue.popleft()
-                local_explored += 1
-                
-                # Generate predecessors (reverse moves)
-                possible_moves = self._get_possible_moves(current_state, max_liftable_disks)
-                for from_peg, to_peg, num_disks in possible_moves:
-                    if self._solution_found.is_set():
-                        break
-                        
-                    try:
-                        # For backward search, we apply the reverse move to get predecessors
-                        prev_state = current_state.apply_move(to_peg, from_peg, num_disks)
-                        
-                        # Check if we've seen this state in backward search
-                        with self._backward_lock:
-                            if prev_state not in self._backward_visited:
-                                new_path = [(from_peg, to_peg, num_disks)] + path
-                                self._backward_visited[prev_state] = new_path
-                                queue.append((prev_state, new_path))
-                                local_generated += 1
-                                
-                    except ValueError:
-                        continue
-            
-            # Update statistics
-            with self._stats_lock:
-                self._backward_stats['generated'] += local_generated
-                self._backward_stats['explored'] += local_explored
-                self._backward_stats['max_queue_size'] = local_max_queue_size
-                
-        except Exception as e:
-            # Signal other thread to stop
+        with self._meeting_lock:
+            if self._best_meeting is None or cost < self._best_meeting[0]:
+                forward_node, backward_node = (node, other_node) if direction == 0 else (other_node, node)
+                self._best_meeting = (cost, forward_node, backward_node)
+                self._check_optimality()
+    
+    def _publish_progress(self, direction: int, depth: float) -> None:
+        """
+        Records that a direction has generated every state up to a depth.
+        
+        Args:
+            direction: The direction making progress.
+            depth: The depth up to which the direction has generated every state,
+                   infinite once its search is exhausted.
+        """
+        with self._meeting_lock:
+            self._expanding_depths[direction] = depth
+            self._check_optimality()
+    
+    def _check_optimality(self) -> None:
+        """
+        Signals the end of the solve once no undiscovered meeting can beat the best one.
+        
+        With every state up to depth a generated forwards and up to depth b
+        backwards, any path of length at most a + b goes through a state seen
+        by both searches, whose meeting is already recorded. Must be called
+        with the meeting lock held.
+        """
+        forward_depth, backward_depth = self._expanding_depths
+        if self._best_meeting is not None:
+            if self._best_meeting[0] <= forward_depth + backward_depth + 1:
+                self._solution_found.set()
+        elif forward_depth == backward_depth == float('inf'):
             self._solution_found.set()
     
     def get_stats(self) -> Dict[str, Any]:
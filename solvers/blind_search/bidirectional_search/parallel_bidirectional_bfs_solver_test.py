@@ -0,0 +1,31 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+import unittest
+
+from ...hanoi_state import HanoiState
+from ...testing import SolverTestCase
+from .parallel_bidirectional_bfs_solver import ParallelBidirectionalBFSSolver
+
+class TestParallelBidirectionalBFSSolver(SolverTestCase):
+    def test_optimal(self):
+        num_disks = 5
+        target_state = HanoiState.unrank(3 ** num_disks // 2, num_disks)
+        for max_lift in (1, 2, 3):
+            for visited in ('set', 'bitmap'):
+                self.assertOptimal(
+                    lambda initial_state: ParallelBidirectionalBFSSolver(initial_state, target_state)._solve_internal(
+                        max_lift, visited=visited),
+                    target_state, max_lift, range(0, 3 ** num_disks, 5))
+
+    def test_timeout_stops_the_search(self):
+        num_disks = 16
+        solver = ParallelBidirectionalBFSSolver(HanoiState.unrank(0, num_disks),
+                                                HanoiState.unrank(3 ** num_disks - 1, num_disks))
+        with self.assertRaises(RuntimeError):
+            solver._solve_internal(1, timeout=0.1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,15 +6,10 @@
 """
 Implements a depth-first search solver for the Tower of Hanoi problem.
 """
-from typing import List, Tuple, Set, Optional, TYPE_CHECKING
+from typing import List, Tuple, Optional
 from collections import deque
 from ..base_solver import BaseSolver
-
-if TYPE_CHECKING:
-    import sys
-    import os
-    sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-    from ..hanoi_state import HanoiState
+from ..search_nodes import create_arena
 
 class DFSSolver(BaseSolver):
     """
@@ -26,13 +21,20 @@ class DFSSolver(BaseSolver):
     an iterative stack-based approach to avoid Python's recursion limits.
     """
     
-    def _solve_internal(self, max_liftable_disks: int = 1, max_depth: Optional[int] = None) -> List[Tuple[int, int, int]]:
+    def _solve_internal(self, max_liftable_disks: int = 1, max_depth: Optional[int] = None,
+                        visited: str = 'set', prune_moves: bool = True,
+                        lock_settled: bool = False) -> List[Tuple[int, int, int]]:
         """
         Performs depth-first search to find a solution.
         
         Args:
             max_liftable_disks: The max number of disks that can be lifted at once.
             max_depth: Maximum depth to search (None = no limit).
+            visited: Duplicate detection structure, 'set' (hash set of states) or
+                     'bitmap' (one bit per state rank, for large instances).
+            prune_moves: If True, never lift again the disks placed by the previous move.
+            lock_settled: If True, never move the largest disks again once they sit on their
+                          target pegs (see `BaseSolver._get_successors`).
             
         Returns:
             A list of moves representing a solution path (not necessarily shortest).
@@ -41,9 +43,9 @@ class DFSSolver(BaseSolver):
             RuntimeError: If no solution is found within the maximum depth.
         """
         # Use iterative DFS with explicit stack
-        # Stack contains: (current_state, path_so_far, depth)
-        stack = deque([(self.initial_state, [], 0)])
-        visited = set()
+        # Nodes live in the arena; the stack contains: (node_index, depth)
+        arena = create_arena(self.initial_state, visited)
+        stack = deque([(0, 0)])
         
         # Track initial state generation
         self._stats_node_generated()
@@ -52,41 +54,31 @@ class DFSSolver(BaseSolver):
             # Track maximum stack size
             self._stats_data_structure_size(len(stack))
             
-            current_state, path, depth = stack.pop()
+            node, depth = stack.pop()
+            current_state = arena.states[node]
             
             # Check if we've reached the target
             if current_state == self.target_state:
-                return path
+                return arena.path_to(node)
             
             # Check depth limit
             if max_depth is not None and depth >= max_depth:
                 continue
-                
-            # Skip if we've already visited this state
-            if current_state in visited:
-                continue
-                
-            # Mark as visited and count as explored
-            visited.add(current_state)
+            
+            # Count as explored (duplicates never reach the stack)
             self._stats_node_explored()
             
-            # Get all possible moves from current state
-            possible_moves = self._get_possible_moves(current_state, max_liftable_disks)
+            # Get all successors of the current state, without those undoing or extending the last move
+            last_move = arena.last_move(node) if prune_moves else None
+            successors = list(self._get_successors(current_state, max_liftable_disks, last_move, lock_settled))
             
-            # Add all valid next states to stack (in reverse order for consistent DFS behavior)
-            for from_peg, to_peg, num_disks in reversed(possible_moves):
-                try:
-                    next_state = current_state.apply_move(from_peg, to_peg, num_disks)
-                    
-                    # Only add if not already visited
-                    if next_state not in visited:
-                        new_path = path + [(from_peg, to_peg, num_disks)]
-                        stack.append((next_state, new_path, depth + 1))
-                        self._stats_node_generated()
-                        
-                except ValueError:
-                    # Invalid move, skip
-                    continue
+            # Add all new next states to stack (in reverse order for consistent DFS behavior)
+            for move, next_state in reversed(successors):
+                # Only add if never generated before
+                child = arena.add_if_new(next_state, node, move)
+                if child is not None:
+                    stack.append((child, depth + 1))
+                    self._stats_node_generated()
         
         # No solution found
         if max_depth is not None:
@@ -0,0 +1,51 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+"""
+Implements a solver that answers queries from a saved target-rooted distance table.
+
+The first query towards a target runs one breadth-first search from that
+target over the whole state space and saves the distance of every state,
+modulo 3 in two bits, to the cache directory (see `solvers.depth_table`).
+Every later query towards the same target, in this process or in any other
+one mapping the saved table, is answered by descending from the initial
+state to a neighbour one step closer to the target, with no search at all.
+"""
+from typing import List, Optional, Tuple
+from ..base_solver import BaseSolver
+from ..depth_table import load_distance_table
+
+class DistanceTableSolver(BaseSolver):
+    """
+    A solver that descends a table of distances to the target state.
+
+    Building the table costs a full breadth-first search and 3^n / 4 bytes,
+    paid once per target and lift limit; each query then takes time
+    proportional to the solution length. The solution is optimal.
+    """
+
+    def _solve_internal(self, max_liftable_disks: int = 1,
+                        cache_dir: Optional[str] = None) -> List[Tuple[int, int, int]]:
+        """
+        Follows the distance table of the target state from the initial state.
+
+        Args:
+            max_liftable_disks: The max number of disks that can be lifted at once.
+            cache_dir: The directory holding saved distance tables. Defaults to ~/.cache/hanoi.
+
+        Returns:
+            A list of moves representing the shortest solution path.
+        """
+        number_of_disks = len(self.initial_state.disk_labels())
+        target_rank = self.target_state.rank()
+        table = load_distance_table(number_of_disks, target_rank, max_liftable_disks, cache_dir)
+
+        solution = table.descend(self.initial_state.rank(), target_rank, max_liftable_disks,
+                                 type(self.initial_state))
+
+        # Each step of the descent expands one state of the solution path
+        self._stats_nodes_explored += len(solution)
+        self._stats_nodes_generated += len(solution) + 1
+        return solution
@@ -0,0 +1,43 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+import mmap
+import tempfile
+import unittest
+
+from .. import depth_table
+from ..hanoi_state import HanoiState
+from ..table_cache import LOADED_TABLES
+from ..testing import SolverTestCase
+from .distance_table_solver import DistanceTableSolver
+
+class TestDistanceTableSolver(SolverTestCase):
+    def setUp(self):
+        LOADED_TABLES.clear()
+        self.cache_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        LOADED_TABLES.clear()
+        self.cache_dir.cleanup()
+
+    def test_optimal_from_every_state(self):
+        num_disks = 5
+        target_state = HanoiState.unrank(3 ** num_disks // 5, num_disks)
+        for max_lift in (1, 2, 3):
+            self.assertOptimal(
+                lambda initial_state: DistanceTableSolver(initial_state, target_state)._solve_internal(
+                    max_lift, cache_dir=self.cache_dir.name),
+                target_state, max_lift, range(3 ** num_disks))
+
+    def test_saved_table_is_mapped(self):
+        target_rank = 100
+        built = depth_table.load_distance_table(6, target_rank, 2, self.cache_dir.name)
+        LOADED_TABLES.clear()
+        mapped = depth_table.load_distance_table(6, target_rank, 2, self.cache_dir.name)
+        self.assertIsInstance(mapped.cells, mmap.mmap)
+        self.assertEqual(bytes(mapped.cells), bytes(built.cells))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,340 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+"""
+Implements an external-memory BFS solver for the Tower of Hanoi problem.
+
+Search layers live on disk, as files of sorted state ranks, and duplicates
+are removed late: successors are collected in a bounded buffer, which is
+sorted and written as a run file whenever it fills up, and the runs are
+then merged into the next layer. Since moves are reversible, the successors
+of layer d can only fall in layers d - 1, d or d + 1, so merging them
+against the two previous layers is enough to drop every state seen before.
+Once the target state is reached, the solution is traced back by looking
+up, in each earlier layer, a neighbour of the current state.
+
+Memory stays bounded by the buffer size plus one read block per merged
+file, however large the search; disk usage is four or eight bytes per
+reached state. At most `MAX_MERGE_FAN_IN` runs are merged at once: a layer
+with more runs is first merged in several passes, each replacing groups of
+runs with a single longer run, so the number of open files stays bounded.
+"""
+from typing import Iterator, List, Optional, Tuple
+from array import array
+import heapq
+import os
+import tempfile
+import time
+from ..base_solver import BaseSolver
+
+# Default number of ranks held in memory before a sorted run is written
+DEFAULT_BUFFER_SIZE = 1 << 20
+
+# Smallest number of ranks read or written at once
+MIN_BLOCK_SIZE = 1 << 10
+
+# Largest number of run files merged at once, i.e. open at the same time
+MAX_MERGE_FAN_IN = 64
+
+def _read_ranks(path: Optional[str], typecode: str, block_size: int) -> Iterator[int]:
+    """
+    Streams the ranks stored in a file, one block at a time.
+
+    Args:
+        path: The file of packed ranks, or None for an empty stream.
+        typecode: The `array` typecode of packed ranks.
+        block_size: The number of ranks read at once.
+
+    Yields:
+        The ranks, in file order.
+    """
+    if path is None:
+        return
+    item_size = array(typecode).itemsize
+    with open(path, 'rb') as file:
+        while True:
+            data = file.read(block_size * item_size)
+            if not data:
+                return
+            block = array(typecode)
+            block.frombytes(data)
+            yield from block
+
+def _unique(ranks: Iterator[int]) -> Iterator[int]:
+    """Drops the repeated ranks of a sorted stream."""
+    previous = None
+    for rank in ranks:
+        if rank != previous:
+            yield rank
+            previous = rank
+
+class _RankWriter:
+    """Writes ranks to a file through a bounded buffer."""
+
+    def __init__(self, path: str, typecode: str, block_size: int):
+        """
+        Creates, or truncates, a file of packed ranks.
+
+        Args:
+            path: The file to write.
+            typecode: The `array` typecode of packed ranks.
+            block_size: The number of ranks buffered before each write.
+        """
+        self.file = open(path, 'wb')
+        self.block = array(typecode)
+        self.block_size = block_size
+        self.count = 0
+
+    def write(self, rank: int) -> None:
+        """Appends a rank to the file."""
+        self.block.append(rank)
+        self.count += 1
+        if len(self.block) >= self.block_size:
+            self.block.tofile(self.file)
+            del self.block[:]
+
+    def close(self) -> None:
+        """Flushes the buffer and closes the file."""
+        self.block.tofile(self.file)
+        self.file.close()
+
+class ExternalBFSSolver(BaseSolver):
+    """
+    A solver that uses breadth-first search with search layers stored on disk.
+
+    Duplicate detection is delayed until a whole layer has been generated,
+    and done by merging sorted files, so the search never holds more than a
+    fixed number of states in memory. The solution is optimal.
+    """
+
+    def _solve_internal(self, max_liftable_disks: int = 1, scratch_dir: Optional[str] = None,
+                        buffer_size: int = DEFAULT_BUFFER_SIZE,
+                        timeout: Optional[float] = None) -> List[Tuple[int, int, int]]:
+        """
+        Performs an external-memory breadth-first search to find the shortest solution.
+
+        Args:
+            max_liftable_disks: The max number of disks that can be lifted at once.
+            scratch_dir: The directory where layer and run files are written
+                         (in a temporary subdirectory, removed afterwards).
+                         Defaults to the system temporary directory.
+            buffer_size: The number of ranks held in memory before a sorted run
+                         is written to disk.
+            timeout: Seconds after which the search stops, checked between layers, or
+                     None to run until it finishes. The driver passes its own timeout.
+
+        Returns:
+            A list of moves representing the shortest solution path.
+
+        Raises:
+            ValueError: If the buffer size is not positive.
+            RuntimeError: If the search times out, or no solution is found (should
+                          not happen for valid puzzles).
+        """
+        if buffer_size < 1:
+            raise ValueError(f"The buffer size must be positive, got {buffer_size}.")
+        deadline = None if timeout is None else time.perf_counter() + timeout
+
+        # Track initial state generation
+        self._stats_node_generated()
+        if self.initial_state == self.target_state:
+            return []
+
+        number_of_disks = len(self.initial_state.disk_labels())
+        typecode = 'I' if 3 ** number_of_disks <= 1 << 32 else 'Q'
+        target_rank = self.target_state.rank()
+
+        # The scratch files are removed however the search ends, timeouts included
+        with tempfile.TemporaryDirectory(prefix='hanoi-bfs-', dir=scratch_dir) as directory:
+            layers: List[str] = [os.path.join(directory, 'layer-0')]
+            writer = _RankWriter(layers[0], typecode, MIN_BLOCK_SIZE)
+            writer.write(self.initial_state.rank())
+            writer.close()
+
+            while True:
+                if deadline is not None and time.perf_counter() > deadline:
+                    raise RuntimeError(f"External BFS timed out after {timeout} seconds.")
+                depth = len(layers)
+                path = os.path.join(directory, f'layer-{depth}')
+                size, found = self._next_layer(layers, path, directory, number_of_disks, max_liftable_disks,
+                                               typecode, buffer_size, target_rank)
+                self._stats_nodes_generated += size
+                self._stats_data_structure_size(size)
+                if size == 0:
+                    break
+                layers.append(path)
+                if found:
+                    return self._trace_back(layers, target_rank, number_of_disks, max_liftable_disks, typecode)
+
+        # Should never reach here for valid Tower of Hanoi puzzles
+        raise RuntimeError("External BFS completed without finding a solution. This indicates a bug.")
+
+    def _next_layer(self, layers: List[str], path: str, directory: str, number_of_disks: int,
+                    max_liftable_disks: int, typecode: str, buffer_size: int,
+                    target_rank: int) -> Tuple[int, bool]:
+        """
+        Expands the last layer and writes the new states to the next layer file.
+
+        Args:
+            layers: The files of the layers built so far, by depth.
+            path: The file of the next layer.
+            directory: The directory of the run files.
+            number_of_disks: The number of disks in the puzzle.
+            max_liftable_disks: The max number of disks that can be lifted at once.
+            typecode: The `array` typecode of packed ranks.
+            buffer_size: The number of ranks held in memory before a run is written.
+            target_rank: The rank of the target state.
+
+        Returns:
+            The size of the next layer, and whether it holds the target state.
+        """
+        state_class = type(self.initial_state)
+
+        # Generate the successors of the layer as sorted, duplicate-free runs
+        runs: List[str] = []
+        buffer = array(typecode)
+        for rank in _read_ranks(layers[-1], typecode, MIN_BLOCK_SIZE):
+            self._stats_node_explored()
+            state = state_class.unrank(rank, number_of_disks)
+            for _, next_state in state.successors(max_liftable_disks):
+                buffer.append(next_state.rank())
+            if len(buffer) >= buffer_size:
+                runs.append(self._write_run(buffer, directory, len(runs), typecode))
+                buffer = array(typecode)
+        if buffer:
+            runs.append(self._write_run(buffer, directory, len(runs), typecode))
+        runs = self._reduce_runs(runs, directory, typecode, buffer_size)
+
+        # Merge the runs, dropping the states of the current and previous layers
+        block_size = max(MIN_BLOCK_SIZE, buffer_size // (len(runs) + 2))
+        seen = heapq.merge(_read_ranks(layers[-1], typecode, block_size),
+                           _read_ranks(layers[-2] if len(layers) > 1 else None, typecode, block_size))
+        next_seen = next(seen, None)
+        writer = _RankWriter(path, typecode, block_size)
+        found = False
+        try:
+            for rank in _unique(heapq.merge(*(_read_ranks(run, typecode, block_size) for run in runs))):
+                while next_seen is not None and next_seen < rank:
+                    next_seen = next(seen, None)
+                if rank != next_seen:
+                    writer.write(rank)
+                    found = found or rank == target_rank
+        finally:
+            writer.close()
+            for run in runs:
+                os.remove(run)
+        return writer.count, found
+
+    def _reduce_runs(self, runs: List[str], directory: str, typecode: str, buffer_size: int) -> List[str]:
+        """
+        Merges groups of runs into longer runs until they can all be merged at once.
+
+        Args:
+            runs: The run files of the layer.
+            directory: The directory of the run files.
+            typecode: The `array` typecode of packed ranks.
+            buffer_size: The number of ranks held in memory, shared by the merged files.
+
+        Returns:
+            At most `MAX_MERGE_FAN_IN` run files holding the same ranks, without duplicates.
+        """
+        block_size = max(MIN_BLOCK_SIZE, buffer_size // (MAX_MERGE_FAN_IN + 1))
+        next_index = len(runs)
+        while len(runs) > MAX_MERGE_FAN_IN:
+            merged_runs = []
+            for start in range(0, len(runs), MAX_MERGE_FAN_IN):
+                group = runs[start:start + MAX_MERGE_FAN_IN]
+                path = os.path.join(directory, f'run-{next_index}')
+                next_index += 1
+                writer = _RankWriter(path, typecode, block_size)
+                try:
+                    for rank in _unique(heapq.merge(*(_read_ranks(run, typecode, block_size) for run in group))):
+                        writer.write(rank)
+                finally:
+                    writer.close()
+                for run in group:
+                    os.remove(run)
+                merged_runs.append(path)
+            runs = merged_runs
+        return runs
+
+    def _write_run(self, buffer: array, directory: str, index: int, typecode: str) -> str:
+        """
+        Sorts a buffer of ranks and writes it, without duplicates, to a run file.
+
+        Args:
+            buffer: The ranks to write.
+            directory: The directory of the run files.
+            index: The index of the run in the current layer.
+            typecode: The `array` typecode of packed ranks.
+
+        Returns:
+            The path of the run file.
+        """
+        path = os.path.join(directory, f'run-{index}')
+        with open(path, 'wb') as file:
+            array(typecode, _unique(iter(sorted(buffer)))).tofile(file)
+        return path
+
+    def _trace_back(self, layers: List[str], target_rank: int, number_of_disks: int,
+                    max_liftable_disks: int, typecode: str) -> List[Tuple[int, int, int]]:
+        """
+        Rebuilds the solution by finding, in each earlier layer, a neighbour of the current state.
+
+        Args:
+            layers: The files of all layers, the last one holding the target state.
+            target_rank: The rank of the target state.
+            number_of_disks: The number of disks in the puzzle.
+            max_liftable_disks: The max number of disks that can be lifted at once.
+            typecode: The `array` typecode of packed ranks.
+
+        Returns:
+            The list of moves from the initial state to the target state.
+
+        Raises:
+            RuntimeError: If a layer holds no neighbour of the current state.
+        """
+        moves: List[Tuple[int, int, int]] = []
+        state = type(self.initial_state).unrank(target_rank, number_of_disks)
+        for path in reversed(layers[:-1]):
+            for (from_peg, to_peg, num_disks), neighbour in state.successors(max_liftable_disks):
+                if self._layer_contains(path, neighbour.rank(), typecode):
+                    # Moves are reversible: the path goes from the neighbour back to the state
+                    moves.append((to_peg, from_peg, num_disks))
+                    state = neighbour
+                    break
+            else:
+                raise RuntimeError("External BFS layers hold no path to the target state.")
+
+        moves.reverse()
+        return moves
+
+    @staticmethod
+    def _layer_contains(path: str, rank: int, typecode: str) -> bool:
+        """
+        Looks up a rank in a layer file by binary search.
+
+        Args:
+            path: The sorted layer file.
+            rank: The rank to look up.
+            typecode: The `array` typecode of packed ranks.
+
+        Returns:
+            True if the layer holds the rank, False otherwise.
+        """
+        item_size = array(typecode).itemsize
+        with open(path, 'rb') as file:
+            low, high = 0, os.path.getsize(path) // item_size
+            while low < high:
+                middle = (low + high) // 2
+                file.seek(middle * item_size)
+                value = array(typecode, file.read(item_size))[0]
+                if value == rank:
+                    return True
+                if value < rank:
+                    low = middle + 1
+                else:
+                    high = middle
+        return False
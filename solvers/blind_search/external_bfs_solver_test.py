@@ -0,0 +1,50 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from ..hanoi_state import HanoiState
+from ..testing import SolverTestCase
+from . import external_bfs_solver
+from .external_bfs_solver import ExternalBFSSolver
+
+class TestExternalBFSSolver(SolverTestCase):
+    def check_optimal(self, num_disks, max_lift, buffer_size):
+        target_state = HanoiState.unrank(3 ** num_disks // 4, num_disks)
+        with tempfile.TemporaryDirectory() as scratch_dir:
+            self.assertOptimal(
+                lambda initial_state: ExternalBFSSolver(initial_state, target_state)._solve_internal(
+                    max_lift, scratch_dir=scratch_dir, buffer_size=buffer_size),
+                target_state, max_lift, range(0, 3 ** num_disks, 9))
+            # Layer and run files are removed after each search
+            self.assertEqual(os.listdir(scratch_dir), [])
+
+    def test_optimal_with_default_buffer(self):
+        for max_lift in (1, 2, 3):
+            self.check_optimal(5, max_lift, 1 << 20)
+
+    def test_optimal_with_tiny_buffer(self):
+        # Many runs per layer must merge into the same layers
+        for max_lift in (1, 2):
+            self.check_optimal(5, max_lift, 3)
+
+    def test_optimal_with_multi_pass_merge(self):
+        # Runs are merged two at a time, over several passes per layer
+        with mock.patch.object(external_bfs_solver, 'MAX_MERGE_FAN_IN', 2):
+            for max_lift in (1, 2):
+                self.check_optimal(5, max_lift, 3)
+
+    def test_timeout_removes_scratch_files(self):
+        with tempfile.TemporaryDirectory() as scratch_dir:
+            solver = ExternalBFSSolver(HanoiState.classic_init(8, on_peg=1), HanoiState.classic_init(8, on_peg=3))
+            with self.assertRaises(RuntimeError):
+                solver._solve_internal(1, scratch_dir=scratch_dir, timeout=0.0)
+            self.assertEqual(os.listdir(scratch_dir), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -11,11 +11,18 @@ for solving Tower of Hanoi puzzles. This algorithm combines the space efficiency
 depth-first search with the optimality guarantee of breadth-first search.
 """
 
-from collections import deque
+from collections import OrderedDict
 from typing import List, Tuple, Optional, Dict, Any
 
 from ..base_solver import BaseSolver
 from ..hanoi_state import HanoiState
+from ..search_nodes import SearchNodeArena
+
+# Default number of states kept in the table of shallowest depths
+DEFAULT_TABLE_SIZE = 1 << 18
+
+# Default number of search nodes kept to resume iterations from a boundary layer
+DEFAULT_BOUNDARY_SIZE = 1 << 16
 
 class IterativeDeepeningSolver(BaseSolver):
     """
@@ -24,6 +31,19 @@ class IterativeDeepeningSolver(BaseSolver):
     This solver uses iterative deepening search, which repeatedly performs
     depth-limited search with increasing depth limits until a solution is found.
     This combines the space efficiency of DFS with the optimality guarantee of BFS.
+    
+    Each depth-limited search keeps a single path of states, extended and
+    shortened in place, so it needs O(depth) memory. Two bounded structures
+    save work on top of that:
+    - a table of the shallowest depth at which the current iteration reached
+      each recently seen state: reaching it again at the same or a larger depth
+      cannot lead anywhere new, so it is skipped (least recently used states
+      are evicted when the table is full);
+    - a boundary layer: while the nodes at the top of the search tree fit in
+      the budget, every state first reached at the deepest stored depth is
+      kept, with its path, and the next iteration starts from those states
+      instead of regenerating the levels above them from the initial state.
+    With both set to 0, the search runs in O(depth) memory.
     """
     
     def __init__(self, initial_state: HanoiState, target_state: HanoiState):
@@ -38,17 +58,32 @@ class IterativeDeepeningSolver(BaseSolver):
         # Track the maximum depth reached during the search
         self._max_depth_reached = 0
         
-    def _solve_internal(self, max_liftable_disks: int = 1, quiet: bool = False) -> List[Tuple[int, int, int]]:
+    def _solve_internal(self, max_liftable_disks: int = 1, quiet: bool = False,
+                        prune_moves: bool = True, table_size: int = DEFAULT_TABLE_SIZE,
+                        boundary_size: int = DEFAULT_BOUNDARY_SIZE,
+                        lock_settled: bool = False) -> List[Tuple[int, int, int]]:
         """
         Solve the puzzle using iterative deepening search.
         
         Args:
             max_liftable_disks: Maximum number of disks that can be lifted at once.
             quiet: If True, suppress progress output during search.
+            prune_moves: If True, never lift again the disks placed by the previous move.
+            table_size: The maximum number of states in the table of shallowest depths (0 disables it).
+            boundary_size: The maximum number of search nodes kept to resume iterations
+                           from a boundary layer (0 always restarts from the initial state).
+            lock_settled: If True, never move the largest disks again once they sit on their
+                          target pegs (see `BaseSolver._get_successors`).
             
         Returns:
             A list of moves representing the solution path.
         """
+        # The stored top of the search tree: every state up to the boundary depth, with its path
+        arena = SearchNodeArena(self.initial_state)
+        boundary = [0]
+        boundary_depth = 0
+        table: 'OrderedDict[HanoiState, Tuple[int, int]]' = OrderedDict()
+        
         # Start with depth limit of 0 and increase until solution found
         depth_limit = 0
         
@@ -57,8 +92,17 @@ class IterativeDeepeningSolver(BaseSolver):
             if not quiet:
                 print(f"Trying depth limit {depth_limit}...")
             
+            # The shallower limits failed, so no solution is shorter than this one
+            self._stats_record_lower_bound(depth_limit)
+            
+            # Collect the next layer only if it can still fit in the budget
+            collect = depth_limit > boundary_depth and len(arena) < boundary_size
+            
             # Perform depth-limited search
-            result = self._depth_limited_search(depth_limit, max_liftable_disks)
+            result, layer = self._depth_limited_search(depth_limit, max_liftable_disks, prune_moves, arena,
+                                                       boundary, boundary_depth, table, table_size,
+                                                       boundary_size - len(arena) if collect else 0,
+                                                       lock_settled)
             
             # Record this iteration
             self._stats_add_iteration(depth_limit)
@@ -66,6 +110,11 @@ class IterativeDeepeningSolver(BaseSolver):
             if result is not None:
                 return result
             
+            # Move the boundary one layer down if the whole layer was stored
+            if layer is not None:
+                boundary = [arena.add(state, parent, move) for state, (parent, move) in layer.items()]
+                boundary_depth += 1
+            
             # Increase depth limit for next iteration
             depth_limit += 1
             
@@ -73,66 +122,120 @@ class IterativeDeepeningSolver(BaseSolver):
             if depth_limit > 1000:  # Arbitrary large limit
                 raise RuntimeError("Search depth limit exceeded (1000). Puzzle may be unsolvable.")
     
-    def _depth_limited_search(self, depth_limit: int, max_liftable_disks: int) -> Optional[List[Tuple[int, int, int]]]:
+    def _depth_limited_search(self, depth_limit: int, max_liftable_disks: int, prune_moves: bool,
+                              arena: SearchNodeArena, boundary: List[int], boundary_depth: int,
+                              table: 'OrderedDict[HanoiState, Tuple[int, int]]', table_size: int,
+                              layer_size: int, lock_settled: bool = False) -> Tuple[Optional[List[Tuple[int, int, int]]],
+                                                        Optional[Dict[HanoiState, Tuple[int, Tuple[int, int, int]]]]]:
         """
-        Perform depth-limited search up to the specified depth.
+        Perform depth-limited search up to the specified depth, from every state of the boundary layer.
+        
+        States stored in the arena above the current depth are skipped: the
+        boundary layer holds every state whose shortest path has exactly the
+        boundary depth, and the searches from those states reach whatever the
+        skipped state could reach, with no more moves.
         
         Args:
             depth_limit: Maximum depth to search.
             max_liftable_disks: Maximum number of disks that can be lifted at once.
+            prune_moves: If True, never lift again the disks placed by the previous move.
+            arena: The stored top of the search tree.
+            boundary: The arena nodes at the boundary depth, where the searches start.
+            boundary_depth: The depth of the boundary layer.
+            table: The table of shallowest depths, as (depth limit, depth) by state.
+            table_size: The maximum number of states in the table.
+            layer_size: The maximum number of states of the next layer to collect (0 collects nothing).
+            lock_settled: If True, never move the largest disks again once they sit on their target pegs.
             
         Returns:
-            A list of moves if solution found within depth limit, None otherwise.
+            A (solution, layer) tuple: the list of moves if a solution was found
+            within the depth limit (None otherwise), and the states first reached
+            one level below the boundary, with their parent node and move, if
+            they all fit in layer_size (None otherwise).
         """
-        # Use a stack to track path, state, and depth
-        stack = [(self.initial_state, [], 0)]  # (state, path, depth)
-        visited_at_depth = set()
+        layer: Optional[Dict[HanoiState, Tuple[int, Tuple[int, int, int]]]] = {} if layer_size > 0 else None
         
-        while stack:
-            current_state, path, depth = stack.pop()
-            
-            # Update statistics
-            self._stats_node_explored()
-            self._stats_data_structure_size(len(stack))
-            self._max_depth_reached = max(self._max_depth_reached, depth)
+        for root in boundary:
+            root_state = arena.states[root]
             
-            # Check if we've reached the target
-            if current_state == self.target_state:
-                return path
-            
-            # If we've reached the depth limit, don't expand further
-            if depth >= depth_limit:
+            # Check if we've reached the target. Stored boundary states were counted as
+            # explored when the previous iteration first reached them
+            if boundary_depth == 0:
+                self._stats_node_explored()
+            if root_state == self.target_state:
+                return arena.path_to(root), None
+            if boundary_depth >= depth_limit:
                 continue
             
-            # Generate all possible moves from current state
-            moves = self._get_possible_moves(current_state, max_liftable_disks)
+            # The path below the boundary: its moves and states, the same states as a set
+            # for cycle checks, and one successor iterator per state, root included
+            move_path: List[Tuple[int, int, int]] = []
+            state_path: List[HanoiState] = []
+            path_states = {root_state}
+            stack = [self._get_successors(root_state, max_liftable_disks,
+                                          arena.last_move(root) if prune_moves else None, lock_settled)]
             
-            for move in moves:
-                from_peg, to_peg, num_disks = move
+            while stack:
+                # Update statistics
+                depth = boundary_depth + len(stack)
+                self._stats_data_structure_size(len(stack) + len(table) + len(arena) + len(layer or ()))
+                self._max_depth_reached = max(self._max_depth_reached, depth)
                 
-                try:
-                    # Apply the move to get new state
-                    new_state = current_state.apply_move(from_peg, to_peg, num_disks)
-                    
-                    # Create state-depth key to avoid revisiting same state at same depth
-                    state_depth_key = (new_state, depth + 1)
-                    
-                    if state_depth_key not in visited_at_depth:
-                        visited_at_depth.add(state_depth_key)
-                        
-                        # Update statistics
-                        self._stats_node_generated()
-                        
-                        # Add to stack for exploration
-                        new_path = path + [move]
-                        stack.append((new_state, new_path, depth + 1))
-                        
-                except ValueError:
-                    # Move is invalid, skip it
+                step = next(stack[-1], None)
+                if step is None:
+                    # Successors exhausted: backtrack
+                    stack.pop()
+                    if state_path:
+                        path_states.discard(state_path.pop())
+                        move_path.pop()
                     continue
+                
+                move, new_state = step
+                
+                # Avoid cycles, states above the boundary, and states this iteration already
+                # reached at a lower or equal depth
+                if new_state in path_states:
+                    continue
+                known = arena.node_of(new_state)
+                if known is not None and arena.depths[known] < depth:
+                    continue
+                entry = table.get(new_state)
+                if entry is not None and entry[0] == depth_limit and entry[1] <= depth:
+                    continue
+                if table_size > 0:
+                    table[new_state] = (depth_limit, depth)
+                    table.move_to_end(new_state)
+                    if len(table) > table_size:
+                        table.popitem(last=False)
+                
+                # Update statistics
+                self._stats_node_generated()
+                self._stats_node_explored()
+                
+                # Check if we've reached the target
+                if new_state == self.target_state:
+                    return arena.path_to(root) + move_path + [move], None
+                
+                # Keep the first layer below the boundary while it fits
+                if layer is not None and depth == boundary_depth + 1 and new_state not in layer:
+                    if len(layer) < layer_size:
+                        layer[new_state] = (root, move)
+                    else:
+                        layer = None
+                
+                # If we've reached the depth limit, don't expand further
+                if depth >= depth_limit:
+                    continue
+                
+                # Descend into the successor
+                move_path.append(move)
+                state_path.append(new_state)
+                path_states.add(new_state)
+                stack.append(self._get_successors(new_state, max_liftable_disks,
+                                                  move if prune_moves else None, lock_settled))
         
         # No solution found within depth limit
-        return None
+        return None, layer
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -0,0 +1,42 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+import unittest
+
+from ..hanoi_state import HanoiState
+from ..testing import SolverTestCase
+from .iterative_deepening_solver import IterativeDeepeningSolver
+
+class TestIterativeDeepeningSolver(SolverTestCase):
+    def check_optimal(self, num_disks, max_lift, table_size, boundary_size):
+        target_state = HanoiState.unrank(2 * 3 ** (num_disks - 1), num_disks)
+        self.assertOptimal(
+            lambda initial_state: IterativeDeepeningSolver(initial_state, target_state)._solve_internal(
+                max_lift, quiet=True, table_size=table_size, boundary_size=boundary_size),
+            target_state, max_lift, range(0, 3 ** num_disks, 13))
+
+    def test_optimal_in_depth_memory(self):
+        for max_lift in (1, 2):
+            self.check_optimal(4, max_lift, 0, 0)
+
+    def test_optimal_with_tiny_table_and_boundary(self):
+        # Constant evictions and a boundary frozen near the top must never cost optimality
+        for max_lift in (1, 2, 3):
+            self.check_optimal(5, max_lift, 5, 20)
+
+    def test_optimal_with_default_budget(self):
+        for max_lift in (1, 2, 3):
+            self.check_optimal(5, max_lift, 1 << 18, 1 << 16)
+
+    def test_boundary_states_are_not_explored_again(self):
+        # Only the iterations starting from the initial state explore a state they did not generate
+        for boundary_size in (0, 1 << 16):
+            solver = IterativeDeepeningSolver(HanoiState.classic_init(5, on_peg=1), HanoiState.classic_init(5, on_peg=3))
+            solver._solve_internal(1, quiet=True, boundary_size=boundary_size)
+            self.assertLessEqual(solver._stats_nodes_explored - solver._stats_nodes_generated, solver._stats_iterations)
+            self.assertGreaterEqual(solver._stats_nodes_explored, solver._stats_nodes_generated)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,334 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+"""
+Implements a multi-process, layer-synchronous BFS solver for the Tower of Hanoi problem.
+
+States are partitioned among worker processes by rank, and the only search
+memory is a two-bit depth table (see `solvers.depth_table`) in a
+`multiprocessing.shared_memory` block that every worker maps. Each BFS
+layer runs in two phases in every worker:
+
+1. Expand: the worker generates the successors of its share of the
+   frontier, drops those already in the table (a read-only check),
+   buckets the ranks of the others by owning worker and puts each bucket
+   in the inbox queue of its owner.
+2. Insert: the worker takes the ranks it owns from its inbox, one bucket
+   per other worker, marks the new ones in the table and keeps them as its
+   share of the next frontier.
+
+Ranks go from worker to worker directly: the main process only starts
+each layer and adds up the counts the workers report, so it does not
+serialize the exchange. Workers do not wait for each other between the
+phases. A worker still expanding may thus find a state of the next layer
+already marked by its owner and drop it, which is right: the owner keeps it.
+
+Ownership is decided by the table byte of a rank, so no two workers ever
+write the same byte and the table needs no locks. Only packed integer
+ranks cross process boundaries, and the solution path is rebuilt from the
+depth table alone once the target state is marked.
+"""
+from typing import Any, List, Optional, Tuple
+from array import array
+from multiprocessing import shared_memory
+import multiprocessing
+import os
+import time
+from ..base_solver import BaseSolver
+from ..depth_table import DepthTable, byte_owner, table_size
+
+class _PartitionWorker:
+    """
+    The share of a parallel BFS owned by one worker: its frontier ranks and
+    its two search phases.
+    """
+
+    def __init__(self, table: DepthTable, index: int, workers: int, max_liftable_disks: int,
+                 state_class: Any, typecode: str, inboxes: Optional[List[Any]] = None):
+        """
+        Creates a worker with an empty frontier.
+
+        Args:
+            table: The depth table shared by all workers.
+            index: The index of this worker.
+            workers: The number of workers.
+            max_liftable_disks: The max number of disks that can be lifted at once.
+            state_class: The state representation used to generate successors.
+            typecode: The `array` typecode of packed ranks.
+            inboxes: The queue of received ranks of every worker, by index
+                     (not needed with a single worker).
+        """
+        self.table = table
+        self.index = index
+        self.workers = workers
+        self.max_liftable_disks = max_liftable_disks
+        self.state_class = state_class
+        self.typecode = typecode
+        self.inboxes = inboxes
+        self.frontier = array(typecode)
+        self._result: Any = None
+
+    def seed(self, ranks: bytes) -> None:
+        """Adds packed ranks to the frontier."""
+        self.frontier.frombytes(ranks)
+
+    def request_layer(self, depth: int, target_rank: int) -> None:
+        """Builds this worker's share of a layer, keeping its outcome for `result`."""
+        self._result = self.build_layer(depth, target_rank)
+
+    def result(self) -> Any:
+        """Returns the outcome of the last layer."""
+        return self._result
+
+    def build_layer(self, depth: int, target_rank: int) -> Tuple[int, int, bool]:
+        """
+        Runs both phases of a layer, exchanging ranks with the other workers directly.
+
+        Args:
+            depth: The depth of the layer being built.
+            target_rank: The rank of the target state.
+
+        Returns:
+            The number of expanded states, the number of new states, and whether
+            the target state is among them.
+        """
+        explored, buckets = self.expand()
+        chunks = [buckets[self.index]]
+        if self.workers > 1:
+            # Queues buffer what they are given, so every worker sends all its buckets before receiving
+            for owner, bucket in enumerate(buckets):
+                if owner != self.index:
+                    self.inboxes[owner].put(bucket)
+            inbox = self.inboxes[self.index]
+            chunks.extend(inbox.get() for _ in range(self.workers - 1))
+        inserted, found = self.insert(depth, chunks, target_rank)
+        return explored, inserted, found
+
+    def expand(self) -> Tuple[int, List[bytes]]:
+        """
+        Generates the unseen successors of the frontier, bucketed by owner.
+
+        Returns:
+            The number of expanded states, and one buffer of packed ranks per worker.
+        """
+        table, workers, number_of_disks = self.table, self.workers, self.table.number_of_disks
+        buckets = [array(self.typecode) for _ in range(workers)]
+        for rank in self.frontier:
+            state = self.state_class.unrank(rank, number_of_disks)
+            for _, next_state in state.successors(self.max_liftable_disks):
+                next_rank = next_state.rank()
+                if not table.is_seen(next_rank):
+                    buckets[byte_owner(next_rank, workers)].append(next_rank)
+        return len(self.frontier), [bucket.tobytes() for bucket in buckets]
+
+    def insert(self, depth: int, chunks: List[bytes], target_rank: int) -> Tuple[int, bool]:
+        """
+        Marks the new states among the received ranks, which become the next frontier.
+
+        Args:
+            depth: The depth of the layer being built.
+            chunks: Buffers of packed ranks owned by this worker.
+            target_rank: The rank of the target state.
+
+        Returns:
+            The number of new states, and whether the target state is among them.
+        """
+        frontier = array(self.typecode)
+        mark = self.table.mark
+        for chunk in chunks:
+            ranks = array(self.typecode)
+            ranks.frombytes(chunk)
+            for rank in ranks:
+                # Duplicates generated by several workers are dropped here, by their owner
+                if mark(rank, depth):
+                    frontier.append(rank)
+        self.frontier = frontier
+        return len(frontier), self.table.depth_mod_3(target_rank) is not None
+
+def _serve(connection: Any, shared_memory_name: str, number_of_disks: int, index: int,
+           workers: int, max_liftable_disks: int, state_class: Any, typecode: str,
+           inboxes: List[Any]) -> None:
+    """
+    Runs the search phases requested by the main process, in a worker process.
+
+    Args:
+        connection: The worker end of the pipe to the main process.
+        shared_memory_name: The name of the shared depth table.
+        number_of_disks: The number of disks in the puzzle.
+        index: The index of this worker.
+        workers: The number of workers.
+        max_liftable_disks: The max number of disks that can be lifted at once.
+        state_class: The state representation used to generate successors.
+        typecode: The `array` typecode of packed ranks.
+        inboxes: The queue of received ranks of every worker, by index.
+    """
+    block = shared_memory.SharedMemory(name=shared_memory_name)
+    worker = _PartitionWorker(DepthTable(number_of_disks, block.buf), index, workers,
+                              max_liftable_disks, state_class, typecode, inboxes)
+    try:
+        while True:
+            request = connection.recv()
+            if request[0] == 'layer':
+                connection.send(worker.build_layer(*request[1:]))
+            elif request[0] == 'seed':
+                worker.seed(request[1])
+            else:
+                break
+    finally:
+        # The table view must be released before the block can be closed
+        worker.table.cells = None
+        block.close()
+        connection.close()
+
+class ParallelBFSSolver(BaseSolver):
+    """
+    A solver that uses breadth-first search split across several processes.
+
+    Each BFS layer is expanded by all workers at once, each owning the states
+    whose depth table byte falls in its partition. Duplicate detection uses a
+    shared two-bit depth table instead of a hash set, so memory stays at
+    3^n / 4 bytes however many states are reached, and the solution path is
+    rebuilt from the table without parent pointers. The solution is optimal.
+    """
+
+    def _solve_internal(self, max_liftable_disks: int = 1, workers: Optional[int] = None,
+                        timeout: Optional[float] = None) -> List[Tuple[int, int, int]]:
+        """
+        Performs a parallel breadth-first search to find the shortest solution.
+
+        Args:
+            max_liftable_disks: The max number of disks that can be lifted at once.
+            workers: The number of worker processes. Defaults to the number of CPUs;
+                     with a single worker the search runs in the calling process.
+            timeout: Seconds after which the search stops, checked between layers, or
+                     None to run until it finishes. The driver passes its own timeout.
+
+        Returns:
+            A list of moves representing the shortest solution path.
+
+        Raises:
+            ValueError: If the number of workers is not positive.
+            RuntimeError: If the search times out, or no solution is found (should
+                          not happen for valid puzzles).
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError(f"The number of workers must be positive, got {workers}.")
+
+        # Track initial state generation
+        self._stats_node_generated()
+        if self.initial_state == self.target_state:
+            return []
+
+        number_of_disks = len(self.initial_state.disk_labels())
+        state_class = type(self.initial_state)
+        typecode = 'I' if 3 ** number_of_disks <= 1 << 32 else 'Q'
+
+        if workers == 1:
+            table = DepthTable(number_of_disks)
+            self._search(table, [_PartitionWorker(table, 0, 1, max_liftable_disks, state_class, typecode)],
+                         typecode, timeout)
+            return table.trace_back(self.target_state.rank(), self.initial_state.rank(), max_liftable_disks, state_class)
+
+        # Fresh shared memory blocks are zero-filled, i.e. an empty depth table
+        block = shared_memory.SharedMemory(create=True, size=table_size(number_of_disks))
+        table = DepthTable(number_of_disks, block.buf)
+        context = multiprocessing.get_context('spawn')
+        inboxes = [context.Queue() for _ in range(workers)]
+        processes, connections = [], []
+        try:
+            for index in range(workers):
+                connection, worker_connection = context.Pipe()
+                process = context.Process(target=_serve, daemon=True, args=(
+                    worker_connection, block.name, number_of_disks, index, workers,
+                    max_liftable_disks, state_class, typecode, inboxes))
+                process.start()
+                worker_connection.close()
+                processes.append(process)
+                connections.append(connection)
+
+            self._search(table, [_WorkerProxy(connection) for connection in connections], typecode, timeout)
+            return table.trace_back(self.target_state.rank(), self.initial_state.rank(), max_liftable_disks, state_class)
+        finally:
+            # Also reached on timeout: the workers and the shared table never outlive the solve
+            for connection in connections:
+                try:
+                    connection.send(('stop',))
+                except (BrokenPipeError, OSError):
+                    pass
+            for process in processes:
+                process.join(timeout=1)
+                if process.is_alive():
+                    process.terminate()
+            for connection in connections:
+                connection.close()
+            for inbox in inboxes:
+                inbox.close()
+            table.cells = None
+            block.close()
+            block.unlink()
+
+    def _search(self, table: DepthTable, workers: List[Any], typecode: str,
+                timeout: Optional[float] = None) -> int:
+        """
+        Runs the BFS layers until the target state is marked in the depth table.
+
+        Args:
+            table: The depth table shared by all workers.
+            workers: The workers, in-process or proxies to worker processes.
+            typecode: The `array` typecode of packed ranks.
+            timeout: Seconds after which the search stops, checked between layers, or None.
+
+        Returns:
+            The depth of the target state.
+
+        Raises:
+            RuntimeError: If the search times out, or the search space is exhausted
+                          without reaching the target.
+        """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        root_rank = self.initial_state.rank()
+        target_rank = self.target_state.rank()
+        table.mark(root_rank, 0)
+        workers[byte_owner(root_rank, len(workers))].seed(array(typecode, [root_rank]).tobytes())
+
+        depth = 0
+        while True:
+            if deadline is not None and time.perf_counter() > deadline:
+                raise RuntimeError(f"Parallel BFS timed out after {timeout} seconds.")
+
+            # Every worker expands its frontier and marks the new states it owns
+            depth += 1
+            for worker in workers:
+                worker.request_layer(depth, target_rank)
+            layer_size, found = 0, False
+            for worker in workers:
+                explored, inserted, worker_found = worker.result()
+                self._stats_nodes_explored += explored
+                layer_size += inserted
+                found = found or worker_found
+
+            self._stats_nodes_generated += layer_size
+            self._stats_data_structure_size(layer_size)
+            if found:
+                return depth
+            if layer_size == 0:
+                raise RuntimeError("Parallel BFS completed without finding a solution. This indicates a bug.")
+
+class _WorkerProxy:
+    """Forwards the search phases to a worker process through a pipe, like a `_PartitionWorker`."""
+
+    def __init__(self, connection: Any):
+        self.connection = connection
+
+    def seed(self, ranks: bytes) -> None:
+        self.connection.send(('seed', ranks))
+
+    def request_layer(self, depth: int, target_rank: int) -> None:
+        self.connection.send(('layer', depth, target_rank))
+
+    def result(self) -> Any:
+        return self.connection.recv()
@@ -0,0 +1,40 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+import multiprocessing
+import unittest
+
+from ..bitboard_state import BitboardHanoiState
+from ..hanoi_state import HanoiState
+from ..testing import SolverTestCase
+from .parallel_bfs_solver import ParallelBFSSolver
+
+class TestParallelBFSSolver(SolverTestCase):
+    def check_optimal(self, num_disks, max_lift, workers, ranks, convert=lambda state: state):
+        target_state = HanoiState.unrank(3 ** num_disks - 1, num_disks)
+        self.assertOptimal(
+            lambda initial_state: ParallelBFSSolver(convert(initial_state), convert(target_state))._solve_internal(
+                max_lift, workers=workers),
+            target_state, max_lift, ranks)
+
+    def test_optimal_in_process(self):
+        for max_lift in (1, 2, 3):
+            self.check_optimal(5, max_lift, 1, range(0, 3 ** 5, 7))
+
+    def test_optimal_with_worker_processes(self):
+        # Few instances: every solve starts its own worker processes
+        for max_lift in (1, 2):
+            self.check_optimal(6, max_lift, 3, (0, 200, 3 ** 6 - 2), BitboardHanoiState.from_state)
+
+    def test_timeout_stops_worker_processes(self):
+        initial_state = HanoiState.classic_init(9, on_peg=1)
+        target_state = HanoiState.classic_init(9, on_peg=3)
+        solver = ParallelBFSSolver(initial_state, target_state)
+        with self.assertRaises(RuntimeError):
+            solver._solve_internal(2, workers=2, timeout=0.0)
+        self.assertEqual(multiprocessing.active_children(), [])
+
+if __name__ == '__main__':
+    unittest.main()
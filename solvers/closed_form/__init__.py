@@ -1,13 +1,18 @@
 """
 No-search algorithms for Tower of Hanoi.
 
-This solver performs no search through the state space. Instead, it directly
-computes the optimal solution by exploiting the mathematical structure of
-classical Tower of Hanoi puzzles where the branching factor is effectively 1.
+These solvers perform no search through the state space. Instead, they directly
+compute the optimal solution by exploiting the mathematical structure of
+the puzzle: the classical recursion for tower-to-tower puzzles, with single
+or multi-disk lifts, and its generalization to arbitrary start and end states for single-disk lifts.
 """
 
 from .closed_form_solver import ClosedFormSolver
+from .exact_solver import ExactSolver
+from .multi_lift_solver import MultiLiftClosedFormSolver
 
 __all__ = [
-    'ClosedFormSolver'
+    'ClosedFormSolver',
+    'ExactSolver',
+    'MultiLiftClosedFormSolver'
 ] 
\ No newline at end of file
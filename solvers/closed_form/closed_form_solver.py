@@ -9,8 +9,13 @@ Implements the no-search solver for classical Tower of Hanoi puzzles.
 This solver performs no search whatsoever - it directly computes the 
 mathematically optimal solution using the well-known classical algorithm.
 """
-from typing import List, Tuple
+from typing import Iterator, Optional, Tuple
 from ..base_solver import BaseSolver
+from ..compressed_solution import (
+    CompressedSolution,
+    TowerTransfer,
+    stream_classical_moves,
+)
 
 class ClosedFormSolver(BaseSolver):
     """
@@ -19,7 +24,7 @@ class ClosedFormSolver(BaseSolver):
     This solver exploits the mathematical structure of classical Tower of Hanoi
     puzzles where the branching factor is effectively 1 - at each step, there is
     exactly one optimal next move. Instead of searching through possible paths,
-    it directly computes the sequence using the classical recursive formula.
+    it directly computes each move from its index in the solution.
     
     Characteristics:
     - No search through state space
@@ -28,22 +33,54 @@ class ClosedFormSolver(BaseSolver):
     - Optimal for classical puzzles only
     - Branching factor = 1 (no decision points)
     """
-    def _solve_internal(self, max_liftable_disks: int = 1) -> List[Tuple[int, int, int]]:
+    def _solve_internal(self, max_liftable_disks: int = 1) -> CompressedSolution:
         """
         Generates the optimal solution for a classical Tower of Hanoi puzzle.
         
         This method exploits the mathematical structure of the classical puzzle
-        to directly compute the optimal solution without any search.
+        to directly compute the optimal solution without any search. The
+        solution is a single tower transfer, returned as a `CompressedSolution`
+        that behaves like the list of its 2^n - 1 moves in O(1) memory.
         
         Args:
             max_liftable_disks: Ignored for classical puzzles (always 1).
             
         Returns:
-            A list of moves representing the optimal solution.
+            A `CompressedSolution` representing the optimal solution.
         """
-        # For classical puzzles, we can directly compute the solution
-        # The optimal solution follows a recursive pattern
+        tower = self._find_tower()
+        if tower is None:
+            return CompressedSolution()
         
+        # Track that we're generating nodes (even though no search is involved)
+        self._stats_node_generated()
+        return CompressedSolution([TowerTransfer(*tower)])
+    
+    def iter_moves(self) -> Iterator[Tuple[int, int, int]]:
+        """
+        Lazily generates the optimal solution, one move at a time.
+        
+        The moves are never stored, so the solution can be streamed to the
+        output in constant memory.
+        
+        Returns:
+            An iterator over the moves of the optimal solution.
+        """
+        tower = self._find_tower()
+        if tower is None:
+            return iter(())
+        
+        num_disks, from_peg, to_peg = tower
+        return self._count_generated(stream_classical_moves(num_disks, from_peg, to_peg))
+    
+    def _find_tower(self) -> Optional[Tuple[int, int, int]]:
+        """
+        Locates the tower to move in a classical puzzle.
+        
+        Returns:
+            A (num_disks, from_peg, to_peg) tuple with 1-indexed pegs, or None
+            if there is nothing to move.
+        """
         # Find which peg has all the disks initially
         from_peg = None
         num_disks = 0
@@ -55,7 +92,7 @@ class ClosedFormSolver(BaseSolver):
                 break
         
         if from_peg is None:
-            return []  # No disks to move
+            return None  # No disks to move
         
         # Find the target peg
         to_peg = None
@@ -64,44 +101,22 @@ class ClosedFormSolver(BaseSolver):
                 to_peg = peg_idx + 1  # Convert to 1-indexed
                 break
         
-        if to_peg is None:
-            return []  # No target specified
-        
-        # Find the auxiliary peg (the one that's neither source nor target)
-        all_pegs = {1, 2, 3}
-        aux_peg = list(all_pegs - {from_peg, to_peg})[0]
+        if to_peg is None or to_peg == from_peg:
+            return None  # No target specified, or nothing to move
         
-        # Generate the optimal solution recursively
-        return self._hanoi_recursive(num_disks, from_peg, to_peg, aux_peg)
+        return num_disks, from_peg, to_peg
     
-    def _hanoi_recursive(self, n: int, from_peg: int, to_peg: int, aux_peg: int) -> List[Tuple[int, int, int]]:
+    def _count_generated(self, moves: Iterator[Tuple[int, int, int]]) -> Iterator[Tuple[int, int, int]]:
         """
-        Recursively generates the optimal solution for moving n disks.
+        Passes moves through while tracking them as generated nodes.
         
         Args:
-            n: Number of disks to move.
-            from_peg: Source peg (1-indexed).
-            to_peg: Destination peg (1-indexed).
-            aux_peg: Auxiliary peg (1-indexed).
+            moves: The moves to pass through.
             
-        Returns:
-            List of moves to transfer n disks from from_peg to to_peg.
+        Yields:
+            The same moves, unchanged.
         """
-        # Track that we're generating nodes (even though no search is involved)
-        self._stats_node_generated()
-        
-        if n == 1:
-            return [(from_peg, to_peg, 1)]
-        
-        moves = []
-        
-        # Move n-1 disks from source to auxiliary peg
-        moves.extend(self._hanoi_recursive(n - 1, from_peg, aux_peg, to_peg))
-        
-        # Move the largest disk from source to destination
-        moves.append((from_peg, to_peg, 1))
-        
-        # Move n-1 disks from auxiliary to destination peg
-        moves.extend(self._hanoi_recursive(n - 1, aux_peg, to_peg, from_peg))
-        
-        return moves 
\ No newline at end of file
+        for move in moves:
+            # Track that we're generating nodes (even though no search is involved)
+            self._stats_node_generated()
+            yield move
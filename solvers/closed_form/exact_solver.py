@@ -0,0 +1,258 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+"""
+Implements the exact no-search solver for arbitrary puzzles with single-disk lifts.
+
+Between any two valid states, the disks larger than the largest disk that
+has to move never move at all. That disk (call it d) goes from its source peg
+to its target peg either directly, or through the third peg when that is
+cheaper; in both routes the smaller disks are first gathered into a tower,
+moved as a tower, and finally spread into their target layout. Gathering the
+k smallest disks of a state onto a peg is itself solved by recursion on the
+largest of them. Comparing the two candidate routes gives the optimal
+solution in O(n) time.
+"""
+from typing import List, Optional, Sequence, Tuple
+
+from ..base_solver import BaseSolver
+from ..compressed_solution import CompressedSolution, Move, SolutionPart, TowerTransfer
+
+
+def peg_positions(state) -> List[int]:
+    """
+    Lists the peg of every disk of a state, smallest disk first.
+
+    Args:
+        state: The state to read.
+
+    Returns:
+        The 1-indexed peg holding each disk, ordered by increasing disk size.
+    """
+    position_of = {disk: peg_idx + 1 for peg_idx, peg in enumerate(state.pegs) for disk in peg}
+    return [position_of[disk] for disk in sorted(position_of)]
+
+
+def gather_cost(positions: Sequence[int], k: int, peg: int) -> int:
+    """
+    Computes the optimal number of moves to stack the k smallest disks on a peg.
+
+    If disk k already sits on the peg, only the smaller disks have to be
+    gathered on it. Otherwise the smaller disks are gathered on the third peg,
+    disk k moves, and the tower of k - 1 disks follows in 2^(k-1) - 1 moves.
+
+    Args:
+        positions: The peg of every disk, smallest first.
+        k: The number of smallest disks to gather.
+        peg: The 1-indexed peg to gather them on.
+
+    Returns:
+        The number of moves of the optimal gathering.
+    """
+    cost = 0
+    for disk in range(k, 0, -1):
+        position = positions[disk - 1]
+        if position != peg:
+            cost += 1 << (disk - 1)  # 1 move for the disk, 2^(disk-1) - 1 for the tower on top
+            peg = 6 - position - peg
+    return cost
+
+
+def gather_parts(positions: Sequence[int], k: int, peg: int) -> List[SolutionPart]:
+    """
+    Builds the optimal moves that stack the k smallest disks on a peg.
+
+    Args:
+        positions: The peg of every disk, smallest first.
+        k: The number of smallest disks to gather.
+        peg: The 1-indexed peg to gather them on.
+
+    Returns:
+        The solution parts (explicit moves and tower transfers), in order.
+    """
+    # Walk from the largest disk down, recording the steps in reverse order
+    steps: List[List[SolutionPart]] = []
+    for disk in range(k, 0, -1):
+        position = positions[disk - 1]
+        if position != peg:
+            other_peg = 6 - position - peg
+            steps.append([(position, peg, 1), TowerTransfer(disk - 1, other_peg, peg)])
+            peg = other_peg
+
+    parts: List[SolutionPart] = []
+    for step in reversed(steps):
+        parts.extend(step)
+    return parts
+
+
+def reverse_parts(parts: Sequence[SolutionPart]) -> List[SolutionPart]:
+    """
+    Reverses a sequence of parts, so that it undoes the original one.
+
+    Args:
+        parts: The solution parts to reverse.
+
+    Returns:
+        The parts in reverse order, each one inverted.
+    """
+    reversed_parts: List[SolutionPart] = []
+    for part in reversed(parts):
+        if isinstance(part, TowerTransfer):
+            # The optimal transfer is unique, so played backwards it is the opposite transfer
+            reversed_parts.append(TowerTransfer(part.num_disks, part.to_peg, part.from_peg, part.max_lift))
+        else:
+            from_peg, to_peg, num_disks = part
+            reversed_parts.append((to_peg, from_peg, num_disks))
+    return reversed_parts
+
+
+def plan_route(initial_positions: Sequence[int],
+               target_positions: Sequence[int]) -> Optional[Tuple[int, int, bool]]:
+    """
+    Chooses how the largest disk that must move goes to its target peg.
+
+    Args:
+        initial_positions: The peg of every disk in the initial state, smallest first.
+        target_positions: The peg of every disk in the target state, smallest first.
+
+    Returns:
+        None if the states are identical, otherwise a (disk, cost, via_third_peg)
+        tuple: the 1-indexed size rank of the largest disk that must move, the
+        optimal number of moves, and whether that disk moves twice, through
+        the third peg, instead of once.
+    """
+    disk = len(initial_positions)
+    while disk > 0 and initial_positions[disk - 1] == target_positions[disk - 1]:
+        disk -= 1
+    if disk == 0:
+        return None
+
+    source = initial_positions[disk - 1]
+    target = target_positions[disk - 1]
+    third = 6 - source - target
+
+    # Direct route: smaller disks to the third peg, disk moves once, smaller disks to their targets
+    direct_cost = (gather_cost(initial_positions, disk - 1, third) + 1 +
+                   gather_cost(target_positions, disk - 1, third))
+
+    # Detour: disk goes through the third peg while the smaller disks move to the target, then back
+    detour_cost = (gather_cost(initial_positions, disk - 1, target) + 1 +
+                   (1 << (disk - 1)) - 1 + 1 +
+                   gather_cost(target_positions, disk - 1, source))
+
+    if detour_cost < direct_cost:
+        return disk, detour_cost, True
+    return disk, direct_cost, False
+
+
+def exact_distance(initial_state, target_state) -> int:
+    """
+    Computes the optimal number of single-disk moves between two states.
+
+    Args:
+        initial_state: The starting state.
+        target_state: The state to reach, with the same disks.
+
+    Returns:
+        The length of the shortest solution.
+    """
+    route = plan_route(peg_positions(initial_state), peg_positions(target_state))
+    return 0 if route is None else route[1]
+
+
+def optimal_parts(initial_positions: Sequence[int],
+                  target_positions: Sequence[int]) -> List[SolutionPart]:
+    """
+    Builds the optimal solution between two disk layouts.
+
+    Args:
+        initial_positions: The peg of every disk in the initial state, smallest first.
+        target_positions: The peg of every disk in the target state, smallest first.
+
+    Returns:
+        The solution parts (explicit moves and tower transfers), in order.
+    """
+    route = plan_route(initial_positions, target_positions)
+    if route is None:
+        return []
+
+    disk, _, via_third_peg = route
+    source = initial_positions[disk - 1]
+    target = target_positions[disk - 1]
+    third = 6 - source - target
+
+    if via_third_peg:
+        parts = gather_parts(initial_positions, disk - 1, target)
+        parts.append((source, third, 1))
+        parts.append(TowerTransfer(disk - 1, target, source))
+        parts.append((third, target, 1))
+        parts.extend(reverse_parts(gather_parts(target_positions, disk - 1, source)))
+    else:
+        parts = gather_parts(initial_positions, disk - 1, third)
+        parts.append((source, target, 1))
+        parts.extend(reverse_parts(gather_parts(target_positions, disk - 1, third)))
+    return parts
+
+
+def next_optimal_move(state, target_state) -> Optional[Move]:
+    """
+    Computes the first move of an optimal single-lift solution.
+
+    Only the first part of the optimal solution is expanded, so repeatedly
+    asking for the next move walks an optimal path in O(n) time per step,
+    with no search at all.
+
+    Args:
+        state: The current state.
+        target_state: The state to reach, with the same disks.
+
+    Returns:
+        The (from_peg, to_peg, num_disks) move, or None if the state is the target.
+    """
+    parts = optimal_parts(peg_positions(state), peg_positions(target_state))
+    return next(iter(CompressedSolution(parts)), None)
+
+
+class ExactSolver(BaseSolver):
+    """
+    A solver that computes optimal single-lift solutions between any two states.
+
+    Like the closed-form solver, it performs no search: the solution is built
+    by recursion on the largest disk that has to move, comparing the direct
+    route of that disk with the detour through the third peg. The result is a
+    `CompressedSolution` of O(n) parts, whose moves are only expanded when
+    they are iterated over.
+
+    Characteristics:
+    - No search through state space
+    - Optimal for any pair of states, when one disk is lifted at a time
+    - O(n) time and memory, whatever the solution length
+    """
+    def _solve_internal(self, max_liftable_disks: int = 1) -> CompressedSolution:
+        """
+        Builds the optimal solution from the initial to the target state.
+
+        Args:
+            max_liftable_disks: Must be 1; multi-disk lifts are not supported.
+
+        Returns:
+            A `CompressedSolution` representing the optimal solution.
+
+        Raises:
+            ValueError: If max_liftable_disks is not 1, or the two states do
+                        not hold the same disks.
+        """
+        if max_liftable_disks != 1:
+            raise ValueError("The exact solver only supports max_liftable_disks = 1")
+        if self.initial_state.disk_labels() != self.target_state.disk_labels():
+            raise ValueError("Initial and target states must hold the same disks")
+
+        parts = optimal_parts(peg_positions(self.initial_state), peg_positions(self.target_state))
+
+        # Each part is decided once, with no alternative explored
+        for _ in parts:
+            self._stats_node_generated()
+
+        return CompressedSolution(parts)
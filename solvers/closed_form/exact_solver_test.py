@@ -0,0 +1,65 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+import unittest
+
+from ..hanoi_state import HanoiState
+from ..testing import bfs_distances, replay
+from .exact_solver import ExactSolver, exact_distance, next_optimal_move
+
+class TestExactSolver(unittest.TestCase):
+    def test_matches_bfs_on_all_pairs(self):
+        # Every pair of 4-disk states, compared with the BFS distance
+        states = [HanoiState.unrank(rank, 4) for rank in range(3 ** 4)]
+        for initial_state in states:
+            distances = bfs_distances(initial_state)
+            for target_state in states:
+                solution = ExactSolver(initial_state, target_state)._solve_internal()
+                self.assertEqual(len(solution), distances[target_state])
+                self.assertEqual(exact_distance(initial_state, target_state), distances[target_state])
+                self.assertEqual(replay(solution, initial_state), target_state)
+
+    def test_detour_through_third_peg(self):
+        # The largest disk is better off moving twice: 5 moves instead of 7
+        initial_state = HanoiState(((3,), (2, 1), ()))
+        target_state = HanoiState(((2, 1), (3,), ()))
+        solution = ExactSolver(initial_state, target_state)._solve_internal()
+        self.assertEqual(len(solution), 5)
+        self.assertEqual(len(solution), bfs_distances(initial_state)[target_state])
+        self.assertEqual(replay(solution, initial_state), target_state)
+
+    def test_non_consecutive_labels(self):
+        initial_state = HanoiState(((9, 4), (7,), ()))
+        target_state = HanoiState(((), (), (9, 7, 4)))
+        solution = ExactSolver(initial_state, target_state)._solve_internal()
+        self.assertEqual(len(solution), bfs_distances(initial_state)[target_state])
+        self.assertEqual(replay(solution, initial_state), target_state)
+
+    def test_large_instance(self):
+        initial_state = HanoiState.classic_init(40, on_peg=1)
+        target_state = HanoiState.classic_init(40, on_peg=3)
+        solution = ExactSolver(initial_state, target_state)._solve_internal()
+        self.assertEqual(len(solution), 2 ** 40 - 1)
+        self.assertEqual(solution.state_after(len(solution), initial_state), target_state)
+
+    def test_next_optimal_move_follows_an_optimal_path(self):
+        initial_state = HanoiState(((5, 2), (4, 1), (3,)))
+        target_state = HanoiState(((), (5, 3), (4, 2, 1)))
+        distances = bfs_distances(target_state)
+        state = initial_state
+        while state != target_state:
+            next_state = state.apply_move(*next_optimal_move(state, target_state))
+            self.assertEqual(distances[next_state], distances[state] - 1)
+            state = next_state
+        self.assertIsNone(next_optimal_move(target_state, target_state))
+
+    def test_rejects_multi_disk_lifts(self):
+        state = HanoiState.classic_init(3)
+        with self.assertRaises(ValueError):
+            ExactSolver(state, state)._solve_internal(max_liftable_disks=2)
+
+
+if __name__ == '__main__':
+    unittest.main()
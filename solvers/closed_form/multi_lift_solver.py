@@ -0,0 +1,103 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+"""
+Implements the no-search solver for classical puzzles with multi-disk lifts.
+
+When up to K disks can be lifted at once, moving a tower of n disks still
+follows the classical recursion: the top n - j disks go to the auxiliary peg,
+the bottom j disks (j <= K) move in a single lift, and the top n - j disks
+follow them. The optimal cost therefore obeys
+
+    T(0) = 0,    T(n) = min over 1 <= j <= min(n, K) of 2 * T(n - j) + 1
+
+which is solved here by a memoized recurrence over (disks remaining, K).
+"""
+from typing import Dict, Tuple
+
+from .closed_form_solver import ClosedFormSolver
+from ..compressed_solution import CompressedSolution, TowerTransfer
+
+# Memo of the recurrence: (disks remaining, K) -> (optimal cost, bottom block size)
+_TRANSFER_MEMO: Dict[Tuple[int, int], Tuple[int, int]] = {}
+
+
+def optimal_transfer(num_disks: int, max_lift: int) -> Tuple[int, int]:
+    """
+    Solves the multi-lift tower recurrence for a tower of a given height.
+
+    The memo is filled bottom-up, so arbitrarily tall towers never hit the
+    recursion limit, and every (disks remaining, K) pair is computed once
+    across all the calls.
+
+    Args:
+        num_disks: The number of disks in the tower.
+        max_lift: The maximum number of disks lifted by a single move.
+
+    Returns:
+        A (cost, block) tuple: the optimal number of moves to transfer the
+        tower, and how many bottom disks the optimal transfer lifts together
+        (0 for an empty tower).
+
+    Raises:
+        ValueError: If max_lift is not positive.
+    """
+    if max_lift < 1:
+        raise ValueError("The maximum lift must be positive.")
+
+    _TRANSFER_MEMO.setdefault((0, max_lift), (0, 0))
+    for remaining in range(1, num_disks + 1):
+        if (remaining, max_lift) in _TRANSFER_MEMO:
+            continue
+        best_cost, best_block = None, 0
+        # Larger bottom blocks leave fewer disks on top, so ties go to the largest block
+        for block in range(min(remaining, max_lift), 0, -1):
+            cost = 2 * _TRANSFER_MEMO[(remaining - block, max_lift)][0] + 1
+            if best_cost is None or cost < best_cost:
+                best_cost, best_block = cost, block
+        _TRANSFER_MEMO[(remaining, max_lift)] = (best_cost, best_block)
+
+    return _TRANSFER_MEMO[(num_disks, max_lift)]
+
+
+class MultiLiftClosedFormSolver(ClosedFormSolver):
+    """
+    A solver that directly computes optimal classical solutions with multi-disk lifts.
+
+    The recurrence always lifts the largest possible bottom block, so the
+    tower is cut into blocks of K disks counted from the bottom, with the
+    remainder on top, and the blocks are moved like the disks of a classical
+    tower. The solution is a single `TowerTransfer` over those blocks, which
+    answers any move of the solution by index without storing the moves.
+
+    Characteristics:
+    - No search through state space
+    - Optimal for classical puzzles, with any maximum lift
+    - O(n) time and O(1) solution memory, whatever the solution length
+    """
+    def _solve_internal(self, max_liftable_disks: int = 1) -> CompressedSolution:
+        """
+        Generates the optimal solution for a classical puzzle with multi-disk lifts.
+
+        Args:
+            max_liftable_disks: The maximum number of disks lifted by a single move.
+
+        Returns:
+            A `CompressedSolution` representing the optimal solution.
+
+        Raises:
+            ValueError: If max_liftable_disks is not positive.
+        """
+        tower = self._find_tower()
+        if tower is None:
+            return CompressedSolution()
+
+        num_disks, from_peg, to_peg = tower
+        # The transfer of blocks of the optimal size has exactly the optimal cost
+        _, block = optimal_transfer(num_disks, max_liftable_disks)
+
+        # Track that we're generating nodes (even though no search is involved)
+        self._stats_node_generated()
+        return CompressedSolution([TowerTransfer(num_disks, from_peg, to_peg, max_lift=block)])
@@ -0,0 +1,37 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+import unittest
+
+from ..hanoi_state import HanoiState
+from ..testing import bfs_distances, replay
+from .multi_lift_solver import MultiLiftClosedFormSolver, optimal_transfer
+
+class TestMultiLiftClosedFormSolver(unittest.TestCase):
+    def test_matches_bfs(self):
+        for max_lift in (1, 2, 3, 4):
+            for num_disks in range(1, 8):
+                for from_peg, to_peg in ((1, 3), (2, 1)):
+                    initial_state = HanoiState.classic_init(num_disks, on_peg=from_peg)
+                    target_state = HanoiState.classic_init(num_disks, on_peg=to_peg)
+                    distance = bfs_distances(initial_state, max_lift)[target_state]
+                    solution = MultiLiftClosedFormSolver(initial_state, target_state)._solve_internal(max_lift)
+                    self.assertEqual(optimal_transfer(num_disks, max_lift)[0], distance)
+                    self.assertEqual(len(solution), distance)
+                    moves = list(solution)
+                    self.assertTrue(all(lifted <= max_lift for _, _, lifted in moves))
+                    self.assertEqual(replay(moves, initial_state), target_state)
+
+    def test_optimal_transfer_of_tall_tower(self):
+        # The tower is cut into 5 blocks of 4 disks: 2^5 - 1 moves
+        self.assertEqual(optimal_transfer(20, 4), (31, 4))
+        self.assertEqual(optimal_transfer(5000, 1)[0], 2 ** 5000 - 1)
+
+    def test_invalid_max_lift(self):
+        with self.assertRaises(ValueError):
+            optimal_transfer(3, 0)
+
+if __name__ == '__main__':
+    unittest.main()
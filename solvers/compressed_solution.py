@@ -0,0 +1,493 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+"""
+Grammar-compressed representation of Tower of Hanoi solutions.
+
+Optimal solutions are highly self-similar: moving a tower of n disks is the
+transfer of n - 1 disks, one move, and another transfer of n - 1 disks. A
+`CompressedSolution` keeps that structure instead of the flat move list: it
+is a short sequence of parts, where each part is either an explicit move or a
+`TowerTransfer` standing for all the moves of a classical transfer. This
+takes O(n) memory, yet the object behaves like a read-only list of moves:
+it supports `len()`, indexing, slicing and iteration, and `state_after` computes
+the state reached after any number of moves without replaying them.
+"""
+
+from bisect import bisect_right
+from collections.abc import Sequence
+from typing import Any, Iterable, Iterator, List, Tuple, Union
+
+Move = Tuple[int, int, int]
+
+
+def classical_move(k: int, num_disks: int, from_peg: int, to_peg: int) -> Move:
+    """
+    Computes the k-th move of the optimal classical solution directly.
+
+    The optimal solution has a Gray-code structure: move k displaces the disk
+    whose index is the number of trailing zeros of k plus one, so the smallest
+    disk moves every other step. With pegs relabelled so that the tower starts
+    on peg 0, move k goes from peg (k & (k - 1)) % 3 to peg ((k | (k - 1)) + 1) % 3,
+    and the tower ends up on peg 2 for odd n and on peg 1 for even n.
+
+    Args:
+        k: The 1-indexed move number, between 1 and 2^n - 1.
+        num_disks: The number of disks in the tower.
+        from_peg: The 1-indexed peg holding the tower initially.
+        to_peg: The 1-indexed peg the tower has to reach.
+
+    Returns:
+        The k-th move as a (from_peg, to_peg, num_disks) tuple.
+
+    Raises:
+        ValueError: If k is out of range.
+    """
+    if not (1 <= k < 2 ** num_disks):
+        raise ValueError(f"Move number {k} is out of range for {num_disks} disks.")
+
+    aux_peg = 6 - from_peg - to_peg
+    peg_of = (from_peg, aux_peg, to_peg) if num_disks % 2 else (from_peg, to_peg, aux_peg)
+    return (peg_of[(k & (k - 1)) % 3], peg_of[((k | (k - 1)) + 1) % 3], 1)
+
+
+def stream_classical_moves(num_disks: int, from_peg: int, to_peg: int,
+                           first: int = 1) -> Iterator[Move]:
+    """
+    Lazily generates the optimal solution of a classical puzzle.
+
+    Each move is computed from its index as in `classical_move`, so the stream
+    runs in constant memory and the first move is available immediately, even
+    for towers whose solution could never be held in memory.
+
+    Args:
+        num_disks: The number of disks in the tower.
+        from_peg: The 1-indexed peg holding the tower initially.
+        to_peg: The 1-indexed peg the tower has to reach.
+        first: The 1-indexed number of the first move to generate.
+
+    Yields:
+        The moves of the optimal solution, as (from_peg, to_peg, num_disks) tuples.
+    """
+    aux_peg = 6 - from_peg - to_peg
+    peg_of = (from_peg, aux_peg, to_peg) if num_disks % 2 else (from_peg, to_peg, aux_peg)
+
+    for k in range(first, 2 ** num_disks):
+        yield (peg_of[(k & (k - 1)) % 3], peg_of[((k | (k - 1)) + 1) % 3], 1)
+
+
+class TowerTransfer:
+    """
+    The optimal classical transfer of a tower of disks.
+
+    The tower is made of the `num_disks` smallest disks of the puzzle, which
+    must sit on top of `from_peg`. With single-disk lifts the transfer takes
+    2^num_disks - 1 moves. When up to `max_lift` disks can be lifted at once,
+    the tower is cut into ceil(num_disks / max_lift) blocks, counted from the
+    bottom: every block holds `max_lift` disks except the top one, which holds
+    the rest. The blocks then behave as the disks of a classical transfer,
+    each one always lifted as a whole, so the transfer takes 2^blocks - 1 moves.
+
+    Attributes:
+        num_disks (int): The number of disks in the tower.
+        from_peg (int): The 1-indexed peg holding the tower initially.
+        to_peg (int): The 1-indexed peg the tower is moved to.
+        max_lift (int): The maximum number of disks lifted by a single move.
+    """
+    __slots__ = ('num_disks', 'from_peg', 'to_peg', 'max_lift')
+
+    def __init__(self, num_disks: int, from_peg: int, to_peg: int, max_lift: int = 1):
+        """
+        Initializes a tower transfer.
+
+        Args:
+            num_disks: The number of disks in the tower.
+            from_peg: The 1-indexed peg holding the tower initially.
+            to_peg: The 1-indexed peg the tower is moved to.
+            max_lift: The maximum number of disks lifted by a single move.
+
+        Raises:
+            ValueError: If the pegs are invalid or identical, or max_lift is not positive.
+        """
+        if not (1 <= from_peg <= 3 and 1 <= to_peg <= 3) or from_peg == to_peg:
+            raise ValueError("A tower transfer needs two distinct pegs between 1 and 3.")
+        if max_lift < 1:
+            raise ValueError("The maximum lift of a tower transfer must be positive.")
+        self.num_disks = num_disks
+        self.from_peg = from_peg
+        self.to_peg = to_peg
+        self.max_lift = max_lift
+
+    @property
+    def num_blocks(self) -> int:
+        """The number of blocks the tower is moved in."""
+        return -(-self.num_disks // self.max_lift)
+
+    def __len__(self) -> int:
+        """Returns the number of moves of the transfer."""
+        return 2 ** self.num_blocks - 1
+
+    def __repr__(self) -> str:
+        if self.max_lift == 1:
+            return f"TowerTransfer({self.num_disks}, {self.from_peg}, {self.to_peg})"
+        return f"TowerTransfer({self.num_disks}, {self.from_peg}, {self.to_peg}, max_lift={self.max_lift})"
+
+    def __eq__(self, other: Any) -> bool:
+        return (isinstance(other, TowerTransfer) and
+                (self.num_disks, self.from_peg, self.to_peg, self.max_lift) ==
+                (other.num_disks, other.from_peg, other.to_peg, other.max_lift))
+
+    def _block_size(self, block: int) -> int:
+        """
+        Returns the number of disks in a block, block 1 being the top one.
+        """
+        if block == 1:
+            return self.num_disks - (self.num_blocks - 1) * self.max_lift
+        return self.max_lift
+
+    def move(self, index: int) -> Move:
+        """
+        Returns the move at a 0-indexed position of the transfer.
+        """
+        from_peg, to_peg, _ = classical_move(index + 1, self.num_blocks, self.from_peg, self.to_peg)
+        if self.max_lift == 1:
+            return (from_peg, to_peg, 1)
+        # Move k displaces the block whose index is the number of trailing zeros of k plus one
+        k = index + 1
+        return (from_peg, to_peg, self._block_size((k & -k).bit_length()))
+
+    def moves(self, start: int = 0) -> Iterator[Move]:
+        """
+        Iterates over the moves of the transfer, starting at a 0-indexed position.
+        """
+        moves = stream_classical_moves(self.num_blocks, self.from_peg, self.to_peg, start + 1)
+        if self.max_lift == 1:
+            return moves
+        return self._sized_moves(moves, start + 1)
+
+    def _sized_moves(self, moves: Iterator[Move], first: int) -> Iterator[Move]:
+        """
+        Replaces the single-disk counts of block moves with the block sizes.
+        """
+        top_size = self._block_size(1)
+        k = first
+        for from_peg, to_peg, _ in moves:
+            yield (from_peg, to_peg, top_size if k & 1 else self.max_lift)
+            k += 1
+
+    def positions_after(self, done: int) -> List[int]:
+        """
+        Computes where the tower disks are after a number of its moves.
+
+        The largest block of a tower only moves once, halfway through the
+        transfer, so its peg follows from comparing the number of moves done
+        with 2^(blocks-1); the rest of the tower is then a smaller transfer
+        either towards the auxiliary peg or from it. This takes O(n) steps.
+
+        Args:
+            done: The number of moves of the transfer already played.
+
+        Returns:
+            The 1-indexed peg of each tower disk, largest disk first.
+        """
+        source, target = self.from_peg, self.to_peg
+        auxiliary = 6 - source - target
+        positions = []
+
+        for block in range(self.num_blocks, 0, -1):
+            half = 1 << (block - 1)
+            if done < half:
+                # The smaller blocks are still on their way to the auxiliary peg
+                positions.extend([source] * self._block_size(block))
+                target, auxiliary = auxiliary, target
+            else:
+                # The block has moved; the smaller blocks go from the auxiliary peg to the target
+                positions.extend([target] * self._block_size(block))
+                done -= half
+                source, auxiliary = auxiliary, source
+
+        return positions
+
+
+SolutionPart = Union[Move, TowerTransfer]
+
+
+class CompressedSolution(Sequence):
+    """
+    A read-only sequence of moves stored as a short list of parts.
+
+    Each part is either an explicit (from_peg, to_peg, num_disks) move or a
+    `TowerTransfer`. The object can be used wherever a list of moves is
+    expected: `len()`, indexing (O(log parts + 1)), iteration, `in` and
+    equality with lists all work on the expanded moves. Slicing returns a lazy
+    view over the same parts, so even slices of 2^40-move solutions are free.
+
+    Lengths beyond `sys.maxsize` exceed what `len()` can return; the `length`
+    attribute always holds the exact number of moves.
+
+    Attributes:
+        parts (tuple): The explicit moves and tower transfers, in order.
+        length (int): The number of moves in the sequence.
+    """
+
+    def __init__(self, parts: Iterable[SolutionPart] = ()):
+        """
+        Initializes a compressed solution from its parts.
+
+        Args:
+            parts: Explicit moves and `TowerTransfer` objects, in order.
+                   Empty transfers are dropped.
+        """
+        self.parts: Tuple[SolutionPart, ...] = tuple(
+            part for part in parts if not (isinstance(part, TowerTransfer) and part.num_disks == 0)
+        )
+
+        # Index of the first move of each part, plus the total length at the end
+        self._starts: List[int] = [0]
+        for part in self.parts:
+            self._starts.append(self._starts[-1] + self._part_length(part))
+
+        self._window = range(self._starts[-1])
+        self.length = self._starts[-1]
+
+    @staticmethod
+    def _part_length(part: SolutionPart) -> int:
+        """Returns the number of moves in a part."""
+        return len(part) if isinstance(part, TowerTransfer) else 1
+
+    def _view(self, window: range) -> 'CompressedSolution':
+        """
+        Creates a lazy view over a range of move indices of this solution.
+        """
+        view = CompressedSolution.__new__(CompressedSolution)
+        view.parts = self.parts
+        view._starts = self._starts
+        view._window = window
+        view.length = len(window)
+        return view
+
+    def __len__(self) -> int:
+        """Returns the number of moves in the sequence."""
+        return self.length
+
+    def __repr__(self) -> str:
+        window = self._window
+        if window == range(self._starts[-1]):
+            return f"CompressedSolution({list(self.parts)!r})"
+        return f"CompressedSolution({list(self.parts)!r})[{window.start}:{window.stop}:{window.step}]"
+
+    def _move_at(self, index: int) -> Move:
+        """
+        Returns the move at an absolute index into the parts.
+        """
+        part_idx = bisect_right(self._starts, index) - 1
+        part = self.parts[part_idx]
+        if isinstance(part, TowerTransfer):
+            return part.move(index - self._starts[part_idx])
+        return part
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Move, 'CompressedSolution']:
+        """
+        Returns a move, or a lazy view for a slice.
+
+        Args:
+            index: An integer index (negative values count from the end) or a slice.
+
+        Returns:
+            The move at the index, or a `CompressedSolution` view of the slice.
+
+        Raises:
+            IndexError: If an integer index is out of range.
+        """
+        if isinstance(index, slice):
+            return self._view(self._window[index])
+        if not -self.length <= index < self.length:
+            raise IndexError("solution index out of range")
+        return self._move_at(self._window[index])
+
+    def __iter__(self) -> Iterator[Move]:
+        """
+        Iterates over the moves, expanding tower transfers lazily.
+        """
+        window = self._window
+        if window.step != 1:
+            for index in window:
+                yield self._move_at(index)
+            return
+
+        position = window.start
+        if position >= window.stop:
+            return
+        part_idx = bisect_right(self._starts, position) - 1
+        remaining = len(window)
+
+        while remaining > 0:
+            part = self.parts[part_idx]
+            offset = position - self._starts[part_idx]
+            if isinstance(part, TowerTransfer):
+                for move in part.moves(offset):
+                    yield move
+                    remaining -= 1
+                    if remaining == 0:
+                        return
+            else:
+                yield part
+                remaining -= 1
+            part_idx += 1
+            position = self._starts[part_idx]
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Compares the expanded moves with another sequence of moves.
+        """
+        if isinstance(other, CompressedSolution):
+            if self.length != other.length:
+                return False
+        elif isinstance(other, (list, tuple)):
+            if self.length != len(other):
+                return False
+        else:
+            return NotImplemented
+        return all(a == b for a, b in zip(self, other))
+
+    def state_after(self, k: int, initial_state: Any) -> Any:
+        """
+        Computes the state reached after the first k moves of the sequence.
+
+        Explicit moves are applied one by one, whole tower transfers relocate
+        their tower at once, and a transfer cut in the middle places its disks
+        with `TowerTransfer.positions_after`. The cost is O(n) per part.
+
+        Args:
+            k: The number of moves to play, between 0 and the sequence length.
+            initial_state: The state before the first move of the sequence.
+
+        Returns:
+            The resulting state, in the same representation as `initial_state`.
+
+        Raises:
+            ValueError: If k is out of range, the sequence is a strided slice,
+                        or a move is illegal from the given state.
+        """
+        if not 0 <= k <= self.length:
+            raise ValueError(f"Move count {k} is out of range for a solution of {self.length} moves.")
+        if self._window.step != 1:
+            raise ValueError("Cannot compute intermediate states of a strided slice.")
+
+        start = self._window.start
+        pegs = self._play(start, start + k, [list(peg) for peg in initial_state.pegs],
+                          sorted(disk for peg in initial_state.pegs for disk in peg))
+        return self._make_state(pegs, initial_state)
+
+    def is_valid(self, initial_state: Any, target_state: Any) -> bool:
+        """
+        Checks symbolically that the sequence turns one state into another.
+
+        Every explicit move is checked with `apply_move`, and every tower
+        transfer is checked once: its tower must consist of the smallest disks
+        of the puzzle, all stacked on top of the source peg. Under that
+        condition the transfer only ever places a disk on a larger one, so
+        its moves never need to be replayed.
+
+        Args:
+            initial_state: The state before the first move.
+            target_state: The state that the moves must reach.
+
+        Returns:
+            True if every move is legal and the final state is the target.
+        """
+        try:
+            final_state = self.state_after(self.length, initial_state)
+        except ValueError:
+            return False
+        return tuple(final_state.pegs) == tuple(target_state.pegs)
+
+    def _play(self, start: int, stop: int, pegs: List[List[int]], labels: List[int]) -> List[List[int]]:
+        """
+        Plays the moves with absolute indices in [start, stop) on mutable pegs.
+
+        Args:
+            start: The absolute index of the first move to play.
+            stop: The absolute index after the last move to play.
+            pegs: The pegs before move `start`, largest disk first; updated in place.
+            labels: All disk labels of the puzzle, smallest first.
+
+        Returns:
+            The updated pegs.
+
+        Raises:
+            ValueError: If a move is illegal.
+        """
+        if start >= stop:
+            return pegs
+
+        part_idx = bisect_right(self._starts, start) - 1
+        while part_idx < len(self.parts) and self._starts[part_idx] < stop:
+            part = self.parts[part_idx]
+            part_start = self._starts[part_idx]
+            done_before = max(start - part_start, 0)
+            done_after = min(stop, self._starts[part_idx + 1]) - part_start
+
+            if isinstance(part, TowerTransfer):
+                self._play_transfer(part, done_before, done_after, pegs, labels)
+            else:
+                self._play_move(part, pegs)
+            part_idx += 1
+
+        return pegs
+
+    @staticmethod
+    def _play_move(move: Move, pegs: List[List[int]]) -> None:
+        """
+        Applies an explicit move to mutable pegs, checking that it is legal.
+        """
+        from_peg, to_peg, num_disks = move
+        if not (1 <= from_peg <= 3 and 1 <= to_peg <= 3) or from_peg == to_peg:
+            raise ValueError(f"Invalid pegs in move {move}.")
+        source, target = pegs[from_peg - 1], pegs[to_peg - 1]
+        if num_disks < 1 or len(source) < num_disks:
+            raise ValueError(f"Not enough disks on peg {from_peg} to move.")
+        if target and source[-num_disks] > target[-1]:
+            raise ValueError("Cannot place a larger disk on a smaller one.")
+        target.extend(source[-num_disks:])
+        del source[-num_disks:]
+
+    @staticmethod
+    def _play_transfer(transfer: TowerTransfer, done_before: int, done_after: int,
+                       pegs: List[List[int]], labels: List[int]) -> None:
+        """
+        Advances a tower transfer from one point of its progress to another.
+
+        The tower disks are the `num_disks` smallest disks of the puzzle; their
+        pegs before the played moves must match the transfer's progress, and
+        their pegs afterwards only depend on the number of moves done.
+        """
+        if transfer.num_disks > len(labels):
+            raise ValueError(f"Cannot transfer {transfer.num_disks} disks in a {len(labels)}-disk puzzle.")
+
+        tower = labels[:transfer.num_disks]
+        tower_set = set(tower)
+        peg_of = {disk: peg_idx + 1 for peg_idx, peg in enumerate(pegs) for disk in peg if disk in tower_set}
+        if [peg_of[disk] for disk in reversed(tower)] != transfer.positions_after(done_before):
+            raise ValueError(f"The disks are not where {transfer!r} expects them.")
+
+        # The tower disks are the smallest ones, so they sit on top of the pegs
+        for peg in pegs:
+            while peg and peg[-1] in tower_set:
+                peg.pop()
+
+        for disk, peg in zip(reversed(tower), transfer.positions_after(done_after)):
+            pegs[peg - 1].append(disk)
+
+    @staticmethod
+    def _make_state(pegs: List[List[int]], like_state: Any) -> Any:
+        """
+        Builds a state of the same representation as another one from mutable pegs.
+        """
+        peg_tuples = (tuple(pegs[0]), tuple(pegs[1]), tuple(pegs[2]))
+        if hasattr(like_state, 'labels'):
+            # Bitboard states keep their disk labels aside
+            return type(like_state).from_pegs(peg_tuples, like_state.labels)
+        return type(like_state)(peg_tuples)
@@ -0,0 +1,112 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+import random
+import unittest
+
+from .closed_form.exact_solver import optimal_parts, peg_positions
+from .compressed_solution import CompressedSolution, TowerTransfer, classical_move, stream_classical_moves
+from .hanoi_state import HanoiState
+from .testing import replay
+
+def transfer_moves(block_sizes, from_peg, to_peg):
+    # The recursive transfer of blocks listed from the top one down
+    if not block_sizes:
+        return []
+    aux_peg = 6 - from_peg - to_peg
+    return (transfer_moves(block_sizes[:-1], from_peg, aux_peg) + [(from_peg, to_peg, block_sizes[-1])] +
+            transfer_moves(block_sizes[:-1], aux_peg, to_peg))
+
+def tower_moves(num_disks, from_peg, to_peg, max_lift):
+    blocks = [max_lift] * (num_disks // max_lift)
+    if num_disks % max_lift:
+        blocks.append(num_disks % max_lift)
+    return transfer_moves(blocks[::-1], from_peg, to_peg)
+
+class TestClassicalMoves(unittest.TestCase):
+    def test_moves_match_recursive_solution(self):
+        for num_disks in range(1, 9):
+            for from_peg, to_peg in ((1, 3), (1, 2), (3, 1), (2, 3)):
+                moves = tower_moves(num_disks, from_peg, to_peg, 1)
+                for k, move in enumerate(moves, start=1):
+                    self.assertEqual(classical_move(k, num_disks, from_peg, to_peg), move)
+                self.assertEqual(list(stream_classical_moves(num_disks, from_peg, to_peg)), moves)
+                self.assertEqual(list(stream_classical_moves(num_disks, from_peg, to_peg, first=len(moves) // 2 + 1)),
+                                 moves[len(moves) // 2:])
+
+    def test_move_number_out_of_range(self):
+        for k in (0, 2 ** 4):
+            with self.assertRaises(ValueError):
+                classical_move(k, 4, 1, 3)
+
+class TestCompressedSolution(unittest.TestCase):
+    def check_against_moves(self, solution, moves, initial_state):
+        self.assertEqual(len(solution), len(moves))
+        self.assertEqual(list(solution), moves)
+        self.assertEqual(solution, moves)
+        for index in range(-len(moves), len(moves)):
+            self.assertEqual(solution[index], moves[index])
+        for index in (len(moves), -len(moves) - 1):
+            with self.assertRaises(IndexError):
+                solution[index]
+
+        bounds = sorted({0, 1, len(moves) // 3, len(moves) // 2, len(moves) - 1, len(moves)})
+        for start in bounds + [-2]:
+            for stop in bounds + [-1, None]:
+                for step in (1, 2, 3, -1):
+                    view = solution[start:stop:step]
+                    self.assertEqual(len(view), len(moves[start:stop:step]))
+                    self.assertEqual(list(view), moves[start:stop:step])
+
+        state = initial_state
+        for done, move in enumerate(moves):
+            self.assertEqual(solution.state_after(done, initial_state), state)
+            state = state.apply_move(*move)
+        self.assertEqual(solution.state_after(len(moves), initial_state), state)
+
+        # Views compute their states from the state before their first move
+        start = len(moves) // 3
+        view = solution[start:]
+        middle_state = solution.state_after(start, initial_state)
+        for done in range(len(view) + 1):
+            self.assertEqual(view.state_after(done, middle_state), solution.state_after(start + done, initial_state))
+        return state
+
+    def test_tower_transfers(self):
+        for num_disks in range(1, 7):
+            for max_lift in (1, 2, 3):
+                initial_state = HanoiState.classic_init(num_disks, on_peg=1)
+                moves = tower_moves(num_disks, 1, 3, max_lift)
+                solution = CompressedSolution([TowerTransfer(num_disks, 1, 3, max_lift)])
+                final_state = self.check_against_moves(solution, moves, initial_state)
+                self.assertEqual(final_state, HanoiState.classic_init(num_disks, on_peg=3))
+                self.assertTrue(solution.is_valid(initial_state, final_state))
+                self.assertFalse(solution.is_valid(initial_state, initial_state))
+
+    def test_mixed_parts(self):
+        random.seed(6)
+        for num_disks in (3, 5, 6):
+            for _ in range(10):
+                initial_state = HanoiState.random_init(num_disks)
+                target_state = HanoiState.random_init(num_disks)
+                solution = CompressedSolution(optimal_parts(peg_positions(initial_state),
+                                                            peg_positions(target_state)))
+                moves = [move for part in solution.parts for move in
+                         (tower_moves(part.num_disks, part.from_peg, part.to_peg, part.max_lift)
+                          if isinstance(part, TowerTransfer) else [part])]
+                self.assertEqual(replay(moves, initial_state), target_state)
+                self.check_against_moves(solution, moves, initial_state)
+                self.assertTrue(solution.is_valid(initial_state, target_state))
+
+    def test_transfer_of_misplaced_tower_is_invalid(self):
+        # The three smallest disks are not all on the source peg
+        initial_state = HanoiState(((4, 3), (2, 1), ()))
+        solution = CompressedSolution([TowerTransfer(3, 1, 3)])
+        with self.assertRaises(ValueError):
+            solution.state_after(len(solution), initial_state)
+        self.assertFalse(solution.is_valid(initial_state, HanoiState(((4,), (), (3, 2, 1)))))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,247 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+"""
+Two-bit tables of breadth-first depths, modulo 3, indexed by state rank.
+
+A breadth-first search only needs to know, for each state, whether it has
+been reached and its depth modulo 3: a move changes the depth of a state by
+at most one, so among the neighbours of a state at depth d, those at depth
+d - 1 are exactly the ones whose stored value is (d - 1) mod 3. Following
+such neighbours from any reached state rebuilds a shortest path back to the
+root without storing a single parent pointer.
+
+Each state takes two bits (0 for "not reached", 1 + depth mod 3 otherwise),
+so the table for n disks takes 3^n / 4 bytes. Its buffer can be any buffer,
+e.g. a `bytearray`, the buffer of a `multiprocessing.shared_memory` block
+shared by several processes, or a read-only `mmap` of a saved table.
+
+A table built by a breadth-first search from a target state answers every
+later query towards that target: descending from any state to the neighbour
+one step closer, until the target is reached, follows a shortest solution in
+time proportional to its length. Such distance tables are saved to a cache
+directory and mapped from there by later runs.
+"""
+
+from array import array
+from typing import Any, List, Optional, Tuple
+
+from .hanoi_state import HanoiState
+from .table_cache import load_table
+
+# Cell value of the states not reached yet
+UNSEEN = 0
+
+
+def table_size(number_of_disks: int) -> int:
+    """
+    Computes the number of bytes of a depth table.
+
+    Args:
+        number_of_disks: The number of disks in the puzzle.
+
+    Returns:
+        The size of the table covering every state with that many disks.
+    """
+    return (3 ** number_of_disks + 3) // 4
+
+
+class DepthTable:
+    """
+    Depth modulo 3 of every reached state, two bits per state rank.
+
+    Attributes:
+        number_of_disks (int): The number of disks in the puzzle.
+        cells: The buffer holding four cells per byte.
+    """
+
+    def __init__(self, number_of_disks: int, buffer: Optional[Any] = None):
+        """
+        Wraps a buffer as a depth table, or allocates an empty one.
+
+        Args:
+            number_of_disks: The number of disks in the puzzle.
+            buffer: A writable buffer of at least `table_size(number_of_disks)`
+                    bytes, all zero for an empty table. Defaults to a new `bytearray`.
+
+        Raises:
+            ValueError: If the buffer is too small.
+        """
+        size = table_size(number_of_disks)
+        if buffer is None:
+            buffer = bytearray(size)
+        elif len(buffer) < size:
+            raise ValueError(f"A depth table for {number_of_disks} disks needs {size} bytes.")
+        self.number_of_disks = number_of_disks
+        self.cells = buffer
+
+    def depth_mod_3(self, rank: int) -> Optional[int]:
+        """
+        Returns the stored depth of a state, modulo 3.
+
+        Args:
+            rank: The rank of the state.
+
+        Returns:
+            The depth modulo 3, or None if the state has not been reached.
+        """
+        cell = (self.cells[rank >> 2] >> ((rank & 3) << 1)) & 3
+        return None if cell == UNSEEN else cell - 1
+
+    def is_seen(self, rank: int) -> bool:
+        """Checks whether a state has been reached."""
+        return bool((self.cells[rank >> 2] >> ((rank & 3) << 1)) & 3)
+
+    def mark(self, rank: int, depth: int) -> bool:
+        """
+        Records the depth of a state, unless it was already reached.
+
+        Writers must not share bytes: concurrent processes may only mark ranks
+        that differ in `rank >> 2` (see `byte_owner`).
+
+        Args:
+            rank: The rank of the state.
+            depth: The depth of the state.
+
+        Returns:
+            True if the state had not been reached before, False otherwise.
+        """
+        byte = rank >> 2
+        shift = (rank & 3) << 1
+        value = self.cells[byte]
+        if (value >> shift) & 3:
+            return False
+        self.cells[byte] = value | ((depth % 3 + 1) << shift)
+        return True
+
+    def descend(self, rank: int, root_rank: int, max_liftable_disks: int,
+                state_class: Any = HanoiState) -> List[Tuple[int, int, int]]:
+        """
+        Follows a shortest path from a reached state down to the root of the search.
+
+        Args:
+            rank: The rank of the reached state.
+            root_rank: The rank of the root of the search.
+            max_liftable_disks: The maximum number of disks lifted by a single move.
+            state_class: The state representation used to generate neighbours.
+
+        Returns:
+            The list of (from_peg, to_peg, num_disks) moves leading to the root.
+
+        Raises:
+            RuntimeError: If the state was not reached, or the table holds no path down from it.
+        """
+        depth = self.depth_mod_3(rank)
+        if depth is None:
+            raise RuntimeError("The depth table does not hold this state.")
+
+        moves: List[Tuple[int, int, int]] = []
+        state = state_class.unrank(rank, self.number_of_disks)
+        while rank != root_rank:
+            # The neighbours one step closer to the root are the only ones at depth - 1 (mod 3)
+            depth = (depth - 1) % 3
+            for move, neighbour in state.successors(max_liftable_disks):
+                neighbour_rank = neighbour.rank()
+                if self.depth_mod_3(neighbour_rank) == depth:
+                    moves.append(move)
+                    state, rank = neighbour, neighbour_rank
+                    break
+            else:
+                raise RuntimeError("The depth table holds no shortest path down from this state.")
+        return moves
+
+    def trace_back(self, rank: int, root_rank: int, max_liftable_disks: int,
+                   state_class: Any = HanoiState) -> List[Tuple[int, int, int]]:
+        """
+        Rebuilds a shortest path from the root of the search to a reached state.
+
+        Args:
+            rank: The rank of the reached state.
+            root_rank: The rank of the root of the search.
+            max_liftable_disks: The maximum number of disks lifted by a single move.
+            state_class: The state representation used to generate neighbours.
+
+        Returns:
+            The list of (from_peg, to_peg, num_disks) moves, root first.
+        """
+        # Moves are reversible: invert the path down from the state, in reverse order
+        return [(to_peg, from_peg, num_disks) for from_peg, to_peg, num_disks in
+                reversed(self.descend(rank, root_rank, max_liftable_disks, state_class))]
+
+
+def byte_owner(rank: int, workers: int) -> int:
+    """
+    Assigns each state to one of several writers, so that writers never share a byte.
+
+    Args:
+        rank: The rank of the state.
+        workers: The number of writers.
+
+    Returns:
+        The index of the writer that owns the state.
+    """
+    return (rank >> 2) % workers
+
+
+def build_distance_table(number_of_disks: int, target_rank: int, max_liftable_disks: int) -> DepthTable:
+    """
+    Computes the distance to a target state, modulo 3, of every state.
+
+    The breadth-first search runs from the target (moves are reversible, so
+    this is the backward search towards it) and only keeps the current layer
+    of ranks besides the table.
+
+    Args:
+        number_of_disks: The number of disks in the puzzle.
+        target_rank: The rank of the target state.
+        max_liftable_disks: The maximum number of disks lifted by a single move.
+
+    Returns:
+        The depth table of the search.
+    """
+    table = DepthTable(number_of_disks)
+    typecode = 'I' if 3 ** number_of_disks <= 1 << 32 else 'Q'
+    table.mark(target_rank, 0)
+    layer = array(typecode, [target_rank])
+    depth = 0
+    while layer:
+        depth += 1
+        next_layer = array(typecode)
+        for rank in layer:
+            for _, next_state in HanoiState.unrank(rank, number_of_disks).successors(max_liftable_disks):
+                next_rank = next_state.rank()
+                if table.mark(next_rank, depth):
+                    next_layer.append(next_rank)
+        layer = next_layer
+    return table
+
+
+def load_distance_table(number_of_disks: int, target_rank: int, max_liftable_disks: int,
+                        cache_dir: Optional[str] = None) -> DepthTable:
+    """
+    Gets a distance table, from memory, from the cache directory or by building it.
+
+    Saved tables are mapped read-only with `mmap`, so that several processes
+    answering queries towards the same target share one copy in memory (see
+    `solvers.table_cache.load_table`).
+
+    Args:
+        number_of_disks: The number of disks in the puzzle.
+        target_rank: The rank of the target state.
+        max_liftable_disks: The maximum number of disks lifted by a single move.
+        cache_dir: The directory holding saved tables. Defaults to ~/.cache/hanoi.
+
+    Returns:
+        The depth table of a breadth-first search from the target state.
+    """
+    # Lifting more disks than the puzzle holds makes no difference
+    max_liftable_disks = min(max_liftable_disks, number_of_disks)
+    cells = load_table(
+        ('distances', number_of_disks, max_liftable_disks, target_rank),
+        f"distances_{number_of_disks}disks_lift{max_liftable_disks}_target{target_rank}.bin",
+        table_size(number_of_disks),
+        lambda: build_distance_table(number_of_disks, target_rank, max_liftable_disks).cells,
+        cache_dir)
+    return DepthTable(number_of_disks, cells)
@@ -4,7 +4,7 @@
 # For more information, please refer to the LICENSE file or <https://unlicense.org>
 
 import random
-from typing import Union, List, Tuple
+from typing import Iterator, Union, List, Tuple
 
 class HanoiState:
     """
@@ -101,6 +101,62 @@ class HanoiState:
             
         return cls(tuple(tuple(p) for p in pegs))
 
+    @classmethod
+    def _from_trusted_pegs(cls, pegs: Tuple[Tuple[int, ...], ...], number_of_disks: int) -> 'HanoiState':
+        """
+        Creates a `HanoiState` without validating or re-counting the pegs.
+
+        This is reserved for code that derives the new pegs from an existing,
+        valid state (such as `successors`), where the checks performed by
+        `__init__` are known to hold already.
+
+        Args:
+            pegs: A tuple of three tuples of disks, largest disk first.
+            number_of_disks: The total number of disks on the pegs.
+
+        Returns:
+            A `HanoiState` instance wrapping the given pegs.
+        """
+        state = cls.__new__(cls)
+        state.pegs = pegs
+        state._hash = None
+        state.number_of_disks = number_of_disks
+        return state
+
+    @classmethod
+    def unrank(cls, rank: int, number_of_disks: int,
+               disk_labels: Union[Tuple[int, ...], None] = None) -> 'HanoiState':
+        """
+        Rebuilds the state with a given rank, as computed by `rank`.
+
+        Args:
+            rank: The rank of the state, between 0 and 3^n - 1.
+            number_of_disks: The number of disks in the puzzle.
+            disk_labels: The disk labels, smallest first. Defaults to 1..n.
+
+        Returns:
+            The `HanoiState` instance with the given rank.
+
+        Raises:
+            ValueError: If the rank is out of range for the number of disks.
+        """
+        if not (0 <= rank < 3 ** number_of_disks):
+            raise ValueError(f"Rank {rank} is out of range for {number_of_disks} disks.")
+        if disk_labels is None:
+            disk_labels = tuple(range(1, number_of_disks + 1))
+
+        # Base-3 digit i of the rank is the peg of the i-th smallest disk
+        digits = []
+        for _ in range(number_of_disks):
+            rank, digit = divmod(rank, 3)
+            digits.append(digit)
+
+        pegs: List[List[int]] = [[], [], []]
+        for disk_rank in range(number_of_disks - 1, -1, -1):
+            pegs[digits[disk_rank]].append(disk_labels[disk_rank])
+
+        return cls._from_trusted_pegs((tuple(pegs[0]), tuple(pegs[1]), tuple(pegs[2])), number_of_disks)
+
     def render(self) -> str:
         """
         Generates an ASCII art representation of the current state.
@@ -156,6 +212,83 @@ class HanoiState:
 
         return HanoiState(tuple(tuple(p) for p in new_pegs_list))
 
+    def disk_labels(self) -> Tuple[int, ...]:
+        """
+        Returns the labels of all disks in this state, smallest first.
+        """
+        return tuple(sorted(disk for peg in self.pegs for disk in peg))
+
+    def rank(self) -> int:
+        """
+        Computes the dense perfect rank of this state.
+
+        A valid state is fully described by the peg each disk sits on, so states
+        with n disks map one-to-one onto the integers 0..3^n - 1: base-3 digit i
+        of the rank is the 0-indexed peg holding the i-th smallest disk. The
+        rank is meant for compact visited sets and tables indexed by state.
+
+        Returns:
+            The rank of the state, between 0 and 3^n - 1.
+        """
+        labels = self.disk_labels()
+        rank = 0
+
+        if not labels or labels[-1] == len(labels):
+            # Distinct positive labels whose maximum is n are exactly 1..n
+            for peg_idx in (1, 2):
+                for disk in self.pegs[peg_idx]:
+                    rank += peg_idx * 3 ** (disk - 1)
+        else:
+            position = {label: idx for idx, label in enumerate(labels)}
+            for peg_idx in (1, 2):
+                for disk in self.pegs[peg_idx]:
+                    rank += peg_idx * 3 ** position[disk]
+
+        return rank
+
+    def successors(self, max_liftable_disks: int = 1) -> Iterator[Tuple[Tuple[int, int, int], 'HanoiState']]:
+        """
+        Lazily generates all legal moves from this state with their outcome.
+
+        This fuses move generation and move application: every yielded move is
+        legal by construction, so the resulting state is built without the
+        validation done by `apply_move`. Only the two pegs touched by a move are
+        rebuilt; the third peg tuple is shared with this state. Moves are
+        yielded in the same order as `BaseSolver._get_possible_moves`.
+
+        Args:
+            max_liftable_disks: The maximum number of disks that can be lifted at once.
+
+        Yields:
+            Tuples (move, next_state), where move is (from_peg, to_peg, num_disks).
+        """
+        pegs = self.pegs
+        number_of_disks = self.number_of_disks
+        trusted = HanoiState._from_trusted_pegs
+
+        for i in range(3):
+            source_tower = pegs[i]
+            if not source_tower:
+                continue
+            max_lift = min(max_liftable_disks, len(source_tower))
+
+            for j in range(3):
+                if i == j:
+                    continue
+
+                target_tower = pegs[j]
+                target_top = target_tower[-1] if target_tower else None
+
+                for k in range(1, max_lift + 1):
+                    # Lifting more disks only makes the bottom disk larger
+                    if target_top is not None and source_tower[-k] > target_top:
+                        break
+
+                    new_pegs = [pegs[0], pegs[1], pegs[2]]
+                    new_pegs[i] = source_tower[:-k]
+                    new_pegs[j] = target_tower + source_tower[-k:]
+                    yield (i + 1, j + 1, k), trusted((new_pegs[0], new_pegs[1], new_pegs[2]), number_of_disks)
+
     def __hash__(self):
         """
         Computes the hash of the state, caching the result for efficiency.
@@ -0,0 +1,66 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+import unittest
+
+from .bitboard_state import BitboardHanoiState
+from .blind_search.bfs_solver import GeneralBFSSolver
+from .hanoi_state import HanoiState
+
+class TestSuccessors(unittest.TestCase):
+    def check_successors(self, states, max_lift):
+        solver = GeneralBFSSolver(states[0], states[0])
+        for state in states:
+            moves = solver._get_possible_moves(state, max_lift)
+            successors = list(state.successors(max_lift))
+            self.assertEqual([move for move, _ in successors], moves)
+            for move, next_state in successors:
+                expected = state.apply_move(*move)
+                self.assertEqual(next_state, expected)
+                self.assertEqual(hash(next_state), hash(expected))
+                self.assertEqual(next_state.number_of_disks, state.number_of_disks)
+
+    def test_successors_match_legal_moves(self):
+        for num_disks in range(1, 6):
+            states = [HanoiState.unrank(rank, num_disks) for rank in range(3 ** num_disks)]
+            for max_lift in (1, 2, 3, num_disks):
+                self.check_successors(states, max_lift)
+                self.check_successors([BitboardHanoiState.from_state(state) for state in states], max_lift)
+
+    def test_successors_with_non_consecutive_labels(self):
+        states = [HanoiState(((9, 4), (), (7,))), HanoiState(((), (12, 3), (8, 5)))]
+        for max_lift in (1, 2, 3):
+            self.check_successors(states, max_lift)
+
+class TestRanking(unittest.TestCase):
+    def test_rank_round_trip(self):
+        for num_disks in range(1, 7):
+            layouts = set()
+            for rank in range(3 ** num_disks):
+                state = HanoiState.unrank(rank, num_disks)
+                self.assertEqual(state.rank(), rank)
+                self.assertEqual(HanoiState(state.pegs), state)
+                layouts.add(state.pegs)
+            self.assertEqual(len(layouts), 3 ** num_disks)
+
+    def test_rank_round_trip_with_labels(self):
+        labels = (3, 5, 8, 12)
+        for rank in range(3 ** len(labels)):
+            state = HanoiState.unrank(rank, len(labels), labels)
+            self.assertEqual(state.disk_labels(), labels)
+            self.assertEqual(state.rank(), rank)
+            self.assertEqual(HanoiState.unrank(state.rank(), len(labels), labels), state)
+
+    def test_digits_are_pegs_of_smallest_disks_first(self):
+        # Disk 1 on peg 3, disk 2 on peg 1, disk 3 on peg 2
+        self.assertEqual(HanoiState(((2,), (3,), (1,))).rank(), 2 + 0 * 3 + 1 * 9)
+
+    def test_rank_out_of_range(self):
+        for rank in (-1, 3 ** 3):
+            with self.assertRaises(ValueError):
+                HanoiState.unrank(rank, 3)
+
+if __name__ == '__main__':
+    unittest.main()
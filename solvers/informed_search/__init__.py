@@ -2,16 +2,24 @@
 Informed search algorithms for Tower of Hanoi.
 
 These solvers use heuristic-guided search strategies that leverage domain-specific
-knowledge (like the blocking disks heuristic) to efficiently navigate the state
+knowledge (like the blocking disks heuristic or pattern databases) to efficiently navigate the state
 space toward optimal solutions.
 """
 
 from .astar_solver import AStarSolver
+from .anytime_astar_solver import AnytimeAStarSolver
+from .weighted_astar_solver import WeightedAStarSolver
+from .focal_search_solver import FocalSearchSolver
 from .ida_star_solver import IDAStarSolver
 from .greedy_best_first_solver import GreedyBestFirstSolver
+from .mm_solver import MMSolver
 
 __all__ = [
     'AStarSolver',
+    'AnytimeAStarSolver',
+    'WeightedAStarSolver',
+    'FocalSearchSolver',
     'IDAStarSolver',
-    'GreedyBestFirstSolver'
+    'GreedyBestFirstSolver',
+    'MMSolver'
 ] 
\ No newline at end of file
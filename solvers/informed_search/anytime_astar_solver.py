@@ -0,0 +1,226 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+"""
+Implements an anytime A* solver (Anytime Repairing A*) for the Tower of Hanoi problem.
+
+The first incumbent costs no search at all: it is the exact single-lift
+solution (see `solvers.closed_form.exact_solver`), optimal when one disk is
+lifted at a time, with each of its tower transfers done in blocks of up to
+`max_liftable_disks` disks otherwise. The search then starts as a weighted
+A*, ordering states by g + w * h, which finds a solution at most w times
+longer than the shortest one after expanding far fewer states than A*. It
+then lowers the weight step by step down to 1, reusing every g-value
+computed so far: only the states whose g-value improved since they were
+expanded (kept aside while a weight is in use) are queued again. States that
+cannot lead to a solution shorter than the incumbent are never queued. Each
+pass tightens the solution, and the last one, with weight 1, ends with a
+shortest solution.
+
+The best solution and a proven lower bound on the shortest length are
+published as soon as they improve, so a caller hitting a deadline can serve
+the incumbent instead of nothing (see `BaseSolver.get_incumbent`).
+"""
+from typing import Any, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+import heapq
+import math
+import time
+from .heuristics_solver import HeuristicsSolver
+from ..closed_form.exact_solver import optimal_parts, peg_positions
+from ..compressed_solution import CompressedSolution, TowerTransfer
+from ..search_nodes import SearchNodeArena
+
+if TYPE_CHECKING:
+    from ..hanoi_state import HanoiState
+
+# Weight of the first pass, and the amount it is lowered by after each pass
+DEFAULT_INITIAL_WEIGHT = 3.0
+DEFAULT_WEIGHT_STEP = 0.5
+
+class AnytimeAStarSolver(HeuristicsSolver):
+    """
+    A solver that runs weighted A* passes with decreasing weights, repairing the previous pass.
+
+    A first solution is built without search; each pass then ends with a
+    solution within its weight times optimal, the weights decreasing. Left to run,
+    the solver returns a shortest solution; given a timeout, it returns the
+    best solution found by then.
+    """
+
+    def _solve_internal(self, max_liftable_disks: int = 1, heuristic: str = 'blocking',
+                        cache_dir: Optional[str] = None, weight: float = DEFAULT_INITIAL_WEIGHT,
+                        weight_step: float = DEFAULT_WEIGHT_STEP, lock_settled: bool = False,
+                        timeout: Optional[float] = None) -> List[Tuple[int, int, int]]:
+        """
+        Performs Anytime Repairing A* until the solution is proven shortest, or the deadline.
+
+        Args:
+            max_liftable_disks: The max number of disks that can be lifted at once.
+            heuristic: The heuristic to use, 'blocking' (default), 'recursive' or 'pdb'.
+            cache_dir: The directory of saved pattern databases (pdb only).
+            weight: The weight of the first pass, at least 1.
+            weight_step: The amount the weight is lowered by after each pass.
+            lock_settled: If True, never move the largest disks again once they sit on their
+                          target pegs (see `BaseSolver._get_successors`).
+            timeout: Seconds after which the best solution found is returned, or None
+                     to run until it is proven shortest. The driver passes its own timeout.
+
+        Returns:
+            A list of moves, the shortest solution if the search completed.
+
+        Raises:
+            ValueError: If the weight is below 1 or the weight step is not positive.
+        """
+        if weight < 1:
+            raise ValueError(f"The weight must be at least 1, got {weight}.")
+        if weight_step <= 0:
+            raise ValueError(f"The weight step must be positive, got {weight_step}.")
+        deadline = None if timeout is None else time.perf_counter() + timeout
+
+        # Track initial state generation
+        self._stats_node_generated()
+        if self.initial_state == self.target_state:
+            return []
+
+        # The exact single-lift solution is the first incumbent, and the answer with single lifts;
+        # its tower transfers move the smallest disks as a tower, so blocks of disks can be lifted
+        parts = optimal_parts(peg_positions(self.initial_state), peg_positions(self.target_state))
+        self._stats_record_incumbent(CompressedSolution(
+            TowerTransfer(part.num_disks, part.from_peg, part.to_peg, max_liftable_disks)
+            if isinstance(part, TowerTransfer) else part for part in parts))
+        if max_liftable_disks == 1:
+            self._stats_record_lower_bound(len(self._stats_incumbent))
+            return self._stats_incumbent
+
+        evaluator = self._make_evaluator(heuristic, max_liftable_disks, cache_dir)
+        arena = SearchNodeArena(self.initial_state)
+        h_score, profile = evaluator.evaluate(self.initial_state)
+        g_scores: Dict['HanoiState', int] = {self.initial_state: 0}
+        # The queued states, and those whose g-value improved after their expansion in this pass,
+        # with their heuristic value and profile: (node, h_score, profile)
+        open_states: Dict['HanoiState', Tuple[int, int, Any]] = {self.initial_state: (0, h_score, profile)}
+        inconsistent: Dict['HanoiState', Tuple[int, int, Any]] = {}
+        # The g + h values of those states, whatever the weight: (f_score, node), cleaned lazily
+        f_scores = [(h_score, 0)]
+
+        while True:
+            # Queue the open states under the current weight: (key, -g_score, counter, node)
+            open_set = [(g_scores[state] + weight * h_score, -g_scores[state], counter, node)
+                        for counter, (state, (node, h_score, _)) in enumerate(open_states.items())]
+            heapq.heapify(open_set)
+            finished = self._improve_path(weight, max_liftable_disks, evaluator, arena, g_scores,
+                                          open_set, f_scores, open_states, inconsistent, deadline,
+                                          lock_settled)
+            self._stats_add_iteration(weight)
+
+            incumbent = self.get_incumbent()
+            if not finished or weight == 1 or len(incumbent) <= self._stats_lower_bound:
+                return incumbent
+
+            # The next pass starts from the open and inconsistent states, with a smaller weight
+            weight = max(1.0, weight - weight_step)
+            open_states.update(inconsistent)
+            inconsistent.clear()
+
+    def _improve_path(self, weight: float, max_liftable_disks: int, evaluator: Any,
+                      arena: SearchNodeArena, g_scores: Dict['HanoiState', int], open_set: List[Any],
+                      f_scores: List[Tuple[int, int]], open_states: Dict['HanoiState', Tuple[int, int, Any]],
+                      inconsistent: Dict['HanoiState', Tuple[int, int, Any]],
+                      deadline: Optional[float], lock_settled: bool = False) -> bool:
+        """
+        Expands states by increasing g + weight * h until the incumbent beats every queued key.
+
+        Args:
+            weight: The weight of this pass.
+            max_liftable_disks: The max number of disks that can be lifted at once.
+            evaluator: The heuristic evaluator.
+            arena: The search nodes, the latest node of each state on its best known path.
+            g_scores: The best known distance from the initial state of each generated state.
+            open_set: The priority queue of this pass.
+            f_scores: The g + h values of the open and inconsistent states.
+            open_states: The queued states, by state.
+            inconsistent: The states improved after their expansion in this pass, by state.
+            deadline: The `time.perf_counter` value at which to stop, or None.
+            lock_settled: If True, never move the largest disks again once they sit on their target pegs.
+
+        Returns:
+            True if the pass completed, False if the deadline passed first.
+        """
+        closed: Set['HanoiState'] = set()
+        counter = len(open_set)
+        target_state = self.target_state
+        while open_set:
+            self._stats_data_structure_size(len(open_set))
+            self._publish_lower_bound(arena, f_scores, open_states, inconsistent)
+            key, _, _, node = open_set[0]
+            if len(self._stats_incumbent) <= key:
+                return True
+            heapq.heappop(open_set)
+
+            current_state = arena.states[node]
+            # Skip stale entries, superseded by a cheaper path or already expanded
+            if current_state in closed or arena.node_of(current_state) != node:
+                continue
+            if deadline is not None and time.perf_counter() > deadline:
+                return False
+
+            _, _, profile = open_states.pop(current_state)
+            closed.add(current_state)
+            if current_state == target_state:
+                continue
+            self._stats_node_explored()
+
+            tentative_g_score = g_scores[current_state] + 1
+            for move, next_state in self._get_successors(current_state, max_liftable_disks, lock_settled=lock_settled):
+                if tentative_g_score >= g_scores.get(next_state, math.inf):
+                    continue
+                # Skip the states whose every solution is at least as long as the incumbent
+                h_score, next_profile = evaluator.evaluate_child(profile, move, next_state)
+                if tentative_g_score + h_score >= len(self._stats_incumbent):
+                    continue
+                g_scores[next_state] = tentative_g_score
+                child = arena.add(next_state, node, move)
+                self._stats_node_generated()
+
+                if next_state == target_state:
+                    self._stats_record_incumbent(arena.path_to(child))
+                heapq.heappush(f_scores, (tentative_g_score + h_score, child))
+                if next_state in closed:
+                    # Expanded with a worse g-value: queued again in the next pass only
+                    inconsistent[next_state] = (child, h_score, next_profile)
+                else:
+                    open_states[next_state] = (child, h_score, next_profile)
+                    counter += 1
+                    heapq.heappush(open_set, (tentative_g_score + weight * h_score, -tentative_g_score,
+                                              counter, child))
+        self._publish_lower_bound(arena, f_scores, open_states, inconsistent)
+        return True
+
+    def _publish_lower_bound(self, arena: SearchNodeArena, f_scores: List[Tuple[int, int]],
+                             open_states: Dict['HanoiState', Tuple[int, int, Any]],
+                             inconsistent: Dict['HanoiState', Tuple[int, int, Any]]) -> None:
+        """
+        Publishes the lower bound proven so far on the length of a shortest solution.
+
+        Unless the incumbent is shortest, every shortest solution goes through
+        an open or inconsistent state whose g-value is exact, so no solution is
+        shorter than the smallest g + h among them, or than the incumbent.
+
+        Args:
+            arena: The search nodes, the latest node of each state on its best known path.
+            f_scores: The g + h values of the open and inconsistent states.
+            open_states: The queued states, by state.
+            inconsistent: The states improved after their expansion in this pass, by state.
+        """
+        # Drop the entries of states expanded since, or reached again by a shorter path
+        while f_scores:
+            state = arena.states[f_scores[0][1]]
+            if arena.node_of(state) == f_scores[0][1] and (state in open_states or state in inconsistent):
+                break
+            heapq.heappop(f_scores)
+        bound = len(self._stats_incumbent)
+        if f_scores:
+            bound = min(bound, f_scores[0][0])
+        self._stats_record_lower_bound(bound)
@@ -0,0 +1,47 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+import unittest
+
+from ..hanoi_state import HanoiState
+from ..testing import SolverTestCase, bfs_distances, replay
+from .anytime_astar_solver import AnytimeAStarSolver
+
+class TestAnytimeAStarSolver(SolverTestCase):
+    def test_optimal_against_bfs(self):
+        def solve(initial_state):
+            solver = AnytimeAStarSolver(initial_state, target_state)
+            solution = solver._solve_internal(max_lift, heuristic=heuristic)
+            # Left to finish, the search proves its solution shortest
+            self.assertEqual(solver._stats_lower_bound, len(solution))
+            return solution
+
+        target_state = HanoiState.unrank(100, 5)
+        for max_lift in (1, 2, 3):
+            for heuristic in ('blocking', 'recursive'):
+                self.assertOptimal(solve, target_state, max_lift, range(0, 3 ** 5, 17))
+
+    def test_optimal_with_locked_settled_disks(self):
+        target_state = HanoiState.unrank(100, 5)
+        for max_lift in (2, 3):
+            self.assertOptimal(
+                lambda initial_state: AnytimeAStarSolver(initial_state, target_state)._solve_internal(
+                    max_lift, lock_settled=True),
+                target_state, max_lift, range(0, 3 ** 5, 7))
+
+    def test_deadline_returns_incumbent_and_lower_bound(self):
+        target_state = HanoiState.unrank(1000, 7)
+        distances = bfs_distances(target_state, 2)
+        for rank in range(0, 3 ** 7, 211):
+            initial_state = HanoiState.unrank(rank, 7)
+            for timeout in (0.0, 0.001):
+                solver = AnytimeAStarSolver(initial_state, target_state)
+                solution = solver._solve_internal(2, timeout=timeout)
+                self.assertEqual(replay(solution, initial_state), target_state)
+                self.assertLessEqual(solver._stats_lower_bound, distances[initial_state])
+                self.assertGreaterEqual(len(solution), distances[initial_state])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,9 +6,10 @@
 """
 Implements an A* solver for the Tower of Hanoi problem using the blocking disks heuristic.
 """
-from typing import List, Tuple, Dict, Set, Optional, TYPE_CHECKING
+from typing import List, Tuple, Dict, Optional, TYPE_CHECKING
 import heapq
 from .heuristics_solver import HeuristicsSolver
+from ..search_nodes import SearchNodeArena
 
 if TYPE_CHECKING:
     import sys
@@ -28,12 +29,17 @@ class AStarSolver(HeuristicsSolver):
     states than pure BFS by using the heuristic to guide the search.
     """
     
-    def _solve_internal(self, max_liftable_disks: int = 1) -> List[Tuple[int, int, int]]:
+    def _solve_internal(self, max_liftable_disks: int = 1, heuristic: str = 'blocking',
+                        cache_dir: Optional[str] = None, lock_settled: bool = False) -> List[Tuple[int, int, int]]:
         """
         Performs A* search to find the optimal solution.
         
         Args:
             max_liftable_disks: The max number of disks that can be lifted at once.
+            heuristic: The heuristic to use, 'blocking' (default), 'recursive' or 'pdb'.
+            cache_dir: The directory of saved pattern databases (pdb only).
+            lock_settled: If True, never move the largest disks again once they sit on their
+                          target pegs (see `BaseSolver._get_successors`).
             
         Returns:
             A list of moves representing the shortest solution path.
@@ -41,15 +47,19 @@ class AStarSolver(HeuristicsSolver):
         Raises:
             RuntimeError: If no solution is found (should not happen for valid puzzles).
         """
-        # Priority queue: (f_score, g_score, counter, state, path)
+        # Priority queue: (f_score, g_score, counter, node, profile)
         # f_score = g_score + heuristic (estimated total cost)
         # g_score = actual cost from start (number of moves)
-        # counter = unique tie-breaker to avoid comparing HanoiState objects
+        # counter = unique tie-breaker to avoid comparing nodes
+        # node = index of the search node in the arena
+        # profile = heuristic profile of the state, to evaluate its successors incrementally
+        evaluator = self._make_evaluator(heuristic, max_liftable_disks, cache_dir)
+        arena = SearchNodeArena(self.initial_state)
         counter = 0
-        open_set = [(self._blocking_disks_heuristic(self.initial_state, max_liftable_disks), 0, counter, self.initial_state, [])]
+        h_score, profile = evaluator.evaluate(self.initial_state)
+        open_set = [(h_score, 0, counter, 0, profile)]
         
-        # Keep track of visited states and their best g_scores
-        visited: Set['HanoiState'] = set()
+        # Keep track of the best g_score found for each state
         g_scores: Dict['HanoiState', int] = {self.initial_state: 0}
         
         # Track initial state generation
@@ -59,55 +69,47 @@ class AStarSolver(HeuristicsSolver):
             # Track maximum queue size
             self._stats_data_structure_size(len(open_set))
             
-            f_score, g_score, _, current_state, path = heapq.heappop(open_set)
+            f_score, g_score, _, node, profile = heapq.heappop(open_set)
+            current_state = arena.states[node]
             
             # Check if we've reached the target
             if current_state == self.target_state:
-                return path
+                return arena.path_to(node)
             
-            # Skip if we've already processed this state with a better path
-            if current_state in visited:
+            # Skip stale entries, superseded by a cheaper path to the same state
+            if g_score > g_scores[current_state]:
                 continue
                 
-            # Mark as visited and count as explored
-            visited.add(current_state)
-            self._stats_node_explored()
+            # With an admissible heuristic, no solution is shorter than the smallest f_score queued
+            if f_score > self._stats_lower_bound:
+                self._stats_record_lower_bound(f_score)
             
-            # Explore all possible moves from current state
-            possible_moves = self._get_possible_moves(current_state, max_liftable_disks)
+            # Count as explored; a state is explored again only if a cheaper path reopens it,
+            # which only happens with inconsistent heuristics
+            self._stats_node_explored()
             
-            for from_peg, to_peg, num_disks in possible_moves:
-                try:
-                    next_state = current_state.apply_move(from_peg, to_peg, num_disks)
-                    
-                    # Calculate new g_score (cost from start)
-                    tentative_g_score = g_score + 1
-                    
-                    # Skip if we've seen this state with a better or equal g_score
-                    if (next_state in g_scores and 
-                        g_scores[next_state] <= tentative_g_score):
-                        continue
-                    
-                    # Skip if already visited (and thus processed optimally)
-                    if next_state in visited:
-                        continue
-                    
-                    # This is the best path to next_state so far
-                    g_scores[next_state] = tentative_g_score
-                    
-                    # Calculate f_score = g_score + heuristic
-                    h_score = self._blocking_disks_heuristic(next_state, max_liftable_disks)
-                    f_score = tentative_g_score + h_score
-                    
-                    # Add to priority queue
-                    new_path = path + [(from_peg, to_peg, num_disks)]
-                    counter += 1
-                    heapq.heappush(open_set, (f_score, tentative_g_score, counter, next_state, new_path))
-                    self._stats_node_generated()
-                    
-                except ValueError:
-                    # Invalid move, skip
+            # Explore all successors of the current state
+            for move, next_state in self._get_successors(current_state, max_liftable_disks, lock_settled=lock_settled):
+                # Calculate new g_score (cost from start)
+                tentative_g_score = g_score + 1
+                
+                # Skip if we've seen this state with a better or equal g_score
+                if (next_state in g_scores and 
+                    g_scores[next_state] <= tentative_g_score):
                     continue
+                
+                # This is the best path to next_state so far
+                g_scores[next_state] = tentative_g_score
+                
+                # Calculate f_score = g_score + heuristic, updating the parent's profile
+                h_score, next_profile = evaluator.evaluate_child(profile, move, next_state)
+                f_score = tentative_g_score + h_score
+                
+                # Add to priority queue
+                child = arena.add(next_state, node, move)
+                counter += 1
+                heapq.heappush(open_set, (f_score, tentative_g_score, counter, child, next_profile))
+                self._stats_node_generated()
         
         # Should never reach here for valid Tower of Hanoi puzzles
         raise RuntimeError("A* search completed without finding a solution. This indicates a bug.") 
\ No newline at end of file
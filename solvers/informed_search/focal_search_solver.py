@@ -0,0 +1,203 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+"""
+Implements a focal search solver (A*_epsilon) for the Tower of Hanoi problem.
+
+Focal search keeps the open list of A*, ordered by f = g + h, but does not
+always expand its minimum. The focal list holds the open states whose f-score
+is at most w times the smallest one, f_min, and the search expands the state
+of the focal list that looks closest to the target, i.e. with the smallest h.
+Since f_min never exceeds the shortest length, every solution it reaches is
+at most w times longer than the shortest one, as with weighted A*, but the
+bound is enforced against f_min directly, so the search is free to go
+greedily towards the target as long as it stays within it.
+"""
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+import heapq
+import math
+from .heuristics_solver import HeuristicsSolver
+from .weighted_astar_solver import DEFAULT_WEIGHT
+from ..search_nodes import SearchNodeArena
+
+if TYPE_CHECKING:
+    from ..hanoi_state import HanoiState
+
+class _FocalOpenList:
+    """
+    The open list of a focal search, with its focal sublist.
+
+    Open nodes are held in a heap by f-score, for f_min, and each one is in
+    one of two more heaps: the focal heap, by heuristic value, for the nodes
+    whose f-score was within the bound when last checked, and the waiting
+    heap, by f-score, for the others. Entries are removed lazily: an entry is
+    stale once its node is no longer the open node of its state.
+    """
+
+    def __init__(self, arena: SearchNodeArena, weight: float):
+        """
+        Creates an empty open list.
+
+        Args:
+            arena: The search nodes.
+            weight: The suboptimality bound: the largest f-score ratio to f_min in the focal list.
+        """
+        self.arena = arena
+        self.weight = weight
+        self.open_nodes: Dict[Any, int] = {}
+        self.by_f_score: List[Tuple[int, int]] = []
+        # (h_score, g_score, node, f_score, profile): nearest to the target first, shallowest on ties
+        self.focal: List[Tuple[int, int, int, int, Any]] = []
+        # (f_score, node, h_score, profile)
+        self.waiting: List[Tuple[int, int, int, Any]] = []
+
+    def push(self, node: int, state: Any, h_score: int, profile: Any) -> None:
+        """
+        Opens a node.
+
+        Args:
+            node: The index of the node in the arena.
+            state: The state of the node.
+            h_score: The heuristic value of the state.
+            profile: The heuristic profile of the state.
+        """
+        g_score = self.arena.depth(node)
+        f_score = g_score + h_score
+        self.open_nodes[state] = node
+        heapq.heappush(self.by_f_score, (f_score, node))
+        if self.by_f_score[0][0] * self.weight >= f_score:
+            heapq.heappush(self.focal, (h_score, g_score, node, f_score, profile))
+        else:
+            heapq.heappush(self.waiting, (f_score, node, h_score, profile))
+
+    def _is_open(self, node: int) -> bool:
+        """Tells whether a node is still the open node of its state."""
+        return self.open_nodes.get(self.arena.states[node]) == node
+
+    def f_min(self) -> Optional[int]:
+        """
+        Returns the smallest f-score among the open nodes.
+
+        Returns:
+            The smallest f-score, or None if no node is open.
+        """
+        by_f_score = self.by_f_score
+        while by_f_score and not self._is_open(by_f_score[0][1]):
+            heapq.heappop(by_f_score)
+        return by_f_score[0][0] if by_f_score else None
+
+    def pop(self, f_min: int) -> Tuple[int, Any]:
+        """
+        Closes the focal node with the smallest heuristic value.
+
+        Args:
+            f_min: The smallest f-score among the open nodes.
+
+        Returns:
+            The node index and the heuristic profile of its state.
+        """
+        limit = f_min * self.weight
+        # Admit the waiting nodes that the bound now covers
+        waiting, focal = self.waiting, self.focal
+        while waiting and waiting[0][0] <= limit:
+            f_score, node, h_score, profile = heapq.heappop(waiting)
+            if self._is_open(node):
+                heapq.heappush(focal, (h_score, self.arena.depth(node), node, f_score, profile))
+
+        while True:
+            h_score, _, node, f_score, profile = heapq.heappop(focal)
+            if not self._is_open(node):
+                continue
+            # f_min decreases when a cheaper path reopens a state: recheck the bound
+            if f_score > limit:
+                heapq.heappush(waiting, (f_score, node, h_score, profile))
+                continue
+            del self.open_nodes[self.arena.states[node]]
+            return node, profile
+
+    def open_size(self) -> int:
+        """Returns the number of open nodes."""
+        return len(self.open_nodes)
+
+class FocalSearchSolver(HeuristicsSolver):
+    """
+    A solver that uses focal search, with a bounded suboptimality.
+
+    Among the open states within `weight` times the smallest f-score, the one
+    with the smallest heuristic value, the shallowest on ties, is expanded
+    first, so the solution is at most `weight` times longer than the shortest
+    one. With weight 1 the search is A*. The achieved bound, the solution
+    length divided by f_min when the target is reached, is reported as
+    'suboptimality_bound' in the statistics.
+    """
+
+    def _solve_internal(self, max_liftable_disks: int = 1, heuristic: str = 'blocking',
+                        cache_dir: Optional[str] = None, weight: float = DEFAULT_WEIGHT,
+                        lock_settled: bool = False) -> List[Tuple[int, int, int]]:
+        """
+        Performs focal search to find a solution within the weight times optimal.
+
+        Args:
+            max_liftable_disks: The max number of disks that can be lifted at once.
+            heuristic: The heuristic to use, 'blocking' (default), 'recursive' or 'pdb'.
+            cache_dir: The directory of saved pattern databases (pdb only).
+            weight: The largest ratio of the f-scores in the focal list to the smallest
+                    one, at least 1: the suboptimality bound.
+            lock_settled: If True, never move the largest disks again once they sit on their
+                          target pegs (see `BaseSolver._get_successors`).
+
+        Returns:
+            A list of moves at most `weight` times longer than the shortest solution.
+
+        Raises:
+            ValueError: If the weight is below 1.
+            RuntimeError: If no solution is found (should not happen for valid puzzles).
+        """
+        if weight < 1:
+            raise ValueError(f"The weight must be at least 1, got {weight}.")
+
+        evaluator = self._make_evaluator(heuristic, max_liftable_disks, cache_dir)
+        arena = SearchNodeArena(self.initial_state)
+        open_list = _FocalOpenList(arena, weight)
+        h_score, profile = evaluator.evaluate(self.initial_state)
+        open_list.push(0, self.initial_state, h_score, profile)
+
+        # Best g-score found for each state; closed states are reopened by cheaper paths
+        g_scores: Dict['HanoiState', int] = {self.initial_state: 0}
+
+        # Track initial state generation
+        self._stats_node_generated()
+
+        while True:
+            # Track maximum open list size
+            self._stats_data_structure_size(open_list.open_size())
+
+            # With an admissible heuristic, no solution is shorter than f_min
+            f_min = open_list.f_min()
+            if f_min is None:
+                break
+            self._stats_record_lower_bound(f_min)
+
+            node, profile = open_list.pop(f_min)
+            current_state = arena.states[node]
+            if current_state == self.target_state:
+                solution = arena.path_to(node)
+                self._stats_record_incumbent(solution)
+                return solution
+            self._stats_node_explored()
+
+            tentative_g_score = arena.depth(node) + 1
+            for move, next_state in self._get_successors(current_state, max_liftable_disks, lock_settled=lock_settled):
+                if tentative_g_score >= g_scores.get(next_state, math.inf):
+                    continue
+                g_scores[next_state] = tentative_g_score
+
+                h_score, next_profile = evaluator.evaluate_child(profile, move, next_state)
+                child = arena.add(next_state, node, move)
+                open_list.push(child, next_state, h_score, next_profile)
+                self._stats_node_generated()
+
+        # Should never reach here for valid Tower of Hanoi puzzles
+        raise RuntimeError("Focal search completed without finding a solution. This indicates a bug.")
@@ -6,9 +6,10 @@
 """
 Implements a Greedy Best-First Search solver for the Tower of Hanoi problem.
 """
-from typing import List, Tuple, Set, TYPE_CHECKING
+from typing import List, Optional, Tuple, TYPE_CHECKING
 import heapq
 from .heuristics_solver import HeuristicsSolver
+from ..search_nodes import SearchNodeArena
 
 if TYPE_CHECKING:
     import sys
@@ -29,12 +30,17 @@ class GreedyBestFirstSolver(HeuristicsSolver):
     the goal) are explored first.
     """
     
-    def _solve_internal(self, max_liftable_disks: int = 1) -> List[Tuple[int, int, int]]:
+    def _solve_internal(self, max_liftable_disks: int = 1, heuristic: str = 'blocking',
+                        cache_dir: Optional[str] = None, lock_settled: bool = False) -> List[Tuple[int, int, int]]:
         """
         Performs Greedy Best-First Search to find a solution.
         
         Args:
             max_liftable_disks: The max number of disks that can be lifted at once.
+            heuristic: The heuristic to use, 'blocking' (default), 'recursive' or 'pdb'.
+            cache_dir: The directory of saved pattern databases (pdb only).
+            lock_settled: If True, never move the largest disks again once they sit on their
+                          target pegs (see `BaseSolver._get_successors`).
             
         Returns:
             A list of moves representing a solution path (not necessarily shortest).
@@ -42,14 +48,16 @@ class GreedyBestFirstSolver(HeuristicsSolver):
         Raises:
             RuntimeError: If no solution is found (should not happen for valid puzzles).
         """
-        # Priority queue: (heuristic_score, counter, state, path)
+        # Priority queue: (heuristic_score, counter, node, profile)
         # heuristic_score = estimated cost to goal
-        # counter = unique tie-breaker to avoid comparing HanoiState objects
+        # counter = unique tie-breaker to avoid comparing nodes
+        # node = index of the search node in the arena
+        # profile = heuristic profile of the state, to evaluate its successors incrementally
+        evaluator = self._make_evaluator(heuristic, max_liftable_disks, cache_dir)
+        arena = SearchNodeArena(self.initial_state)
         counter = 0
-        open_set = [(self._blocking_disks_heuristic(self.initial_state, max_liftable_disks), counter, self.initial_state, [])]
-        
-        # Keep track of visited states to avoid cycles
-        visited: Set['HanoiState'] = set()
+        h_score, profile = evaluator.evaluate(self.initial_state)
+        open_set = [(h_score, counter, 0, profile)]
         
         # Track initial state generation
         self._stats_node_generated()
@@ -58,43 +66,30 @@ class GreedyBestFirstSolver(HeuristicsSolver):
             # Track maximum queue size
             self._stats_data_structure_size(len(open_set))
             
-            h_score, _, current_state, path = heapq.heappop(open_set)
+            h_score, _, node, profile = heapq.heappop(open_set)
+            current_state = arena.states[node]
             
             # Check if we've reached the target
             if current_state == self.target_state:
-                return path
+                return arena.path_to(node)
             
-            # Skip if we've already processed this state
-            if current_state in visited:
-                continue
-                
-            # Mark as visited and count as explored
-            visited.add(current_state)
+            # Count as explored (the arena guarantees each state is queued only once)
             self._stats_node_explored()
             
-            # Explore all possible moves from current state
-            possible_moves = self._get_possible_moves(current_state, max_liftable_disks)
-            
-            for from_peg, to_peg, num_disks in possible_moves:
-                try:
-                    next_state = current_state.apply_move(from_peg, to_peg, num_disks)
-                    
-                    # Skip if already visited
-                    if next_state in visited:
-                        continue
-                    
-                    # Calculate heuristic score for the next state
-                    h_score = self._blocking_disks_heuristic(next_state, max_liftable_disks)
-                    
-                    # Add to priority queue (greedy: only use heuristic, ignore path cost)
-                    new_path = path + [(from_peg, to_peg, num_disks)]
-                    counter += 1
-                    heapq.heappush(open_set, (h_score, counter, next_state, new_path))
-                    self._stats_node_generated()
-                    
-                except ValueError:
-                    # Invalid move, skip
+            # Explore all successors of the current state
+            for move, next_state in self._get_successors(current_state, max_liftable_disks, lock_settled=lock_settled):
+                # Skip states that were already generated (duplicates are detected at generation time)
+                child = arena.add_if_new(next_state, node, move)
+                if child is None:
                     continue
+                
+                # Calculate heuristic score for the next state, updating the parent's profile
+                h_score, next_profile = evaluator.evaluate_child(profile, move, next_state)
+                
+                # Add to priority queue (greedy: only use heuristic, ignore path cost)
+                counter += 1
+                heapq.heappush(open_set, (h_score, counter, child, next_profile))
+                self._stats_node_generated()
         
         # Should never reach here for valid Tower of Hanoi puzzles
         raise RuntimeError("Greedy Best-First Search completed without finding a solution. This indicates a bug.") 
\ No newline at end of file
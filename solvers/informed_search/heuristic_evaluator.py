@@ -0,0 +1,296 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+"""
+Incremental heuristic evaluation for the informed search solvers.
+
+Evaluators compute a heuristic value together with a small "profile" of the
+state, from which the value of any successor can be derived knowing only the
+move that produced it. A move changes two pegs at most, so updating the
+profile costs O(number of lifted disks) instead of a full rescan of the state.
+
+All evaluators share the same interface:
+- `evaluate(state)` returns `(h, profile)` for a state, computed from scratch;
+- `evaluate_child(profile, move, child_state)` returns `(h, profile)` for the
+  state reached by applying `move` to the state whose profile is given.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Sequence, Tuple
+
+from ..closed_form.exact_solver import peg_positions, plan_route
+from ..closed_form.multi_lift_solver import optimal_transfer
+
+# Default number of states kept by a `MemoizedEvaluator`
+DEFAULT_MEMO_SIZE = 1 << 16
+
+
+class BlockingDisksEvaluator:
+    """
+    Incremental evaluator of the blocking disks heuristic.
+
+    A disk is correctly placed when it and every disk below it sit exactly as
+    in the target state. The profile of a state is the number of correctly
+    placed disks on each peg, and the heuristic is the number of remaining
+    disks divided by the maximum lift, rounded up.
+    """
+
+    def __init__(self, target_state: Any, max_liftable_disks: int = 1):
+        """
+        Precomputes the target position of every disk.
+
+        Args:
+            target_state: The state the search must reach.
+            max_liftable_disks: Maximum number of disks that can be lifted at once.
+        """
+        self.max_liftable_disks = max_liftable_disks
+        self.number_of_disks = target_state.number_of_disks
+        # (peg index, height from the bottom) of each disk in the target state
+        self.target_position: Dict[int, Tuple[int, int]] = {
+            disk: (peg_idx, height)
+            for peg_idx, peg in enumerate(target_state.pegs)
+            for height, disk in enumerate(peg)
+        }
+
+    def _estimate(self, profile: Tuple[int, int, int]) -> int:
+        """Turns a profile into the heuristic value."""
+        misplaced_disks = self.number_of_disks - sum(profile)
+        return -(-misplaced_disks // self.max_liftable_disks)
+
+    def _correct_run(self, peg: Tuple[int, ...], peg_idx: int, start: int) -> int:
+        """
+        Extends a run of correctly placed disks upwards from a given height.
+
+        Args:
+            peg: The disks of the peg, bottom first.
+            peg_idx: The 0-indexed peg.
+            start: The height of the first disk to check.
+
+        Returns:
+            The height of the first disk that is not correctly placed.
+        """
+        target_position = self.target_position
+        height = start
+        while height < len(peg) and target_position[peg[height]] == (peg_idx, height):
+            height += 1
+        return height
+
+    def evaluate(self, state: Any) -> Tuple[int, Tuple[int, int, int]]:
+        """
+        Evaluates a state from scratch.
+
+        Args:
+            state: The state to evaluate.
+
+        Returns:
+            The heuristic value and the profile of the state.
+        """
+        pegs = state.pegs
+        profile = (self._correct_run(pegs[0], 0, 0),
+                   self._correct_run(pegs[1], 1, 0),
+                   self._correct_run(pegs[2], 2, 0))
+        return self._estimate(profile), profile
+
+    def evaluate_child(self, profile: Tuple[int, int, int], move: Tuple[int, int, int],
+                       child_state: Any) -> Tuple[int, Tuple[int, int, int]]:
+        """
+        Evaluates the state reached by a move, from the profile of its parent.
+
+        Args:
+            profile: The profile of the parent state.
+            move: The (from_peg, to_peg, num_disks) move applied to the parent.
+            child_state: The resulting state.
+
+        Returns:
+            The heuristic value and the profile of the child state.
+        """
+        from_peg, to_peg, num_disks = move
+        from_idx, to_idx = from_peg - 1, to_peg - 1
+        pegs = child_state.pegs
+        counts = list(profile)
+
+        # Lifting disks can only shorten the correct run of the source peg
+        counts[from_idx] = min(counts[from_idx], len(pegs[from_idx]))
+
+        # The lifted disks extend the run of the target peg only if it reached the old top
+        target_peg = pegs[to_idx]
+        previous_height = len(target_peg) - num_disks
+        if counts[to_idx] == previous_height:
+            counts[to_idx] = self._correct_run(target_peg, to_idx, previous_height)
+
+        profile = (counts[0], counts[1], counts[2])
+        return self._estimate(profile), profile
+
+
+def largest_disk_lower_bound(positions: Sequence[int], target_positions: Sequence[int],
+                             max_liftable_disks: int = 1) -> int:
+    """
+    Computes a lower bound on the distance between two states from their largest misplaced disk.
+
+    With single lifts the bound is the exact distance, given by the recursion
+    of the exact solver. With lifts of up to K disks, let D be the largest
+    disk on the wrong peg. When D first leaves its peg, the disks above it,
+    except at most K - 1 riders, must already sit on another peg, so at least
+    a - (K - 1) of the a disks stacked above D have been moved there as a
+    tower: restricted to those disks, that takes a full multi-lift tower
+    transfer. The same holds backwards from the target for the b disks
+    stacked above D at the end, so the distance is at least
+    T(a - K + 1) + 1 + T(b - K + 1), where T is the optimal tower transfer cost.
+
+    Args:
+        positions: The peg of every disk in the current state, smallest first.
+        target_positions: The peg of every disk in the target state, smallest first.
+        max_liftable_disks: Maximum number of disks that can be lifted at once.
+
+    Returns:
+        A lower bound on the number of moves between the two states.
+    """
+    if max_liftable_disks == 1:
+        route = plan_route(positions, target_positions)
+        return 0 if route is None else route[1]
+
+    disk = len(positions)
+    while disk > 0 and positions[disk - 1] == target_positions[disk - 1]:
+        disk -= 1
+    if disk == 0:
+        return 0
+
+    source = positions[disk - 1]
+    target = target_positions[disk - 1]
+    above_initially = sum(1 for peg in positions[:disk - 1] if peg == source)
+    above_finally = sum(1 for peg in target_positions[:disk - 1] if peg == target)
+
+    riders = max_liftable_disks - 1
+    before = optimal_transfer(max(0, above_initially - riders), max_liftable_disks)[0]
+    after = optimal_transfer(max(0, above_finally - riders), max_liftable_disks)[0]
+    return before + 1 + after
+
+
+class RecursiveEvaluator:
+    """
+    Evaluator of the largest-misplaced-disk lower bound.
+
+    With single lifts the bound is exact, hence admissible and consistent. With
+    multi-disk lifts it is admissible and combined by max with the blocking
+    disks heuristic, whose profile is updated incrementally; the bound itself
+    is recomputed in O(n) for every state.
+    """
+
+    def __init__(self, target_state: Any, max_liftable_disks: int = 1):
+        """
+        Precomputes the target peg of every disk.
+
+        Args:
+            target_state: The state the search must reach.
+            max_liftable_disks: Maximum number of disks that can be lifted at once.
+        """
+        self.max_liftable_disks = max_liftable_disks
+        self.target_positions = peg_positions(target_state)
+        self.blocking = BlockingDisksEvaluator(target_state, max_liftable_disks)
+
+    def _combine(self, state: Any, blocking_entry: Tuple[int, Any]) -> Tuple[int, Any]:
+        """Combines the recursive bound of a state with its blocking disks value."""
+        bound = largest_disk_lower_bound(peg_positions(state), self.target_positions, self.max_liftable_disks)
+        blocking_value, profile = blocking_entry
+        return max(bound, blocking_value), profile
+
+    def evaluate(self, state: Any) -> Tuple[int, Any]:
+        """
+        Evaluates a state from scratch.
+
+        Args:
+            state: The state to evaluate.
+
+        Returns:
+            The heuristic value and the blocking disks profile of the state.
+        """
+        return self._combine(state, self.blocking.evaluate(state))
+
+    def evaluate_child(self, profile: Any, move: Tuple[int, int, int], child_state: Any) -> Tuple[int, Any]:
+        """
+        Evaluates the state reached by a move, from the profile of its parent.
+
+        Args:
+            profile: The blocking disks profile of the parent state.
+            move: The (from_peg, to_peg, num_disks) move applied to the parent.
+            child_state: The resulting state.
+
+        Returns:
+            The heuristic value and the blocking disks profile of the child state.
+        """
+        return self._combine(child_state, self.blocking.evaluate_child(profile, move, child_state))
+
+
+class MemoizedEvaluator:
+    """
+    Wraps an evaluator with a bounded LRU memo keyed by state.
+
+    Searches that revisit the same states many times, like IDA* across its
+    iterations, get the stored value back with a single hash lookup. Once the
+    memo is full, the least recently used state is evicted.
+    """
+
+    def __init__(self, evaluator: Any, max_entries: int = DEFAULT_MEMO_SIZE):
+        """
+        Initializes an empty memo.
+
+        Args:
+            evaluator: The evaluator computing values on memo misses.
+            max_entries: The maximum number of states kept in the memo.
+        """
+        self.evaluator = evaluator
+        self.max_entries = max_entries
+        self._memo: 'OrderedDict[Any, Tuple[int, Any]]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Returns the number of states in the memo."""
+        return len(self._memo)
+
+    def _remember(self, state: Any, entry: Tuple[int, Any]) -> Tuple[int, Any]:
+        """Stores an entry, evicting the least recently used one if the memo is full."""
+        self._memo[state] = entry
+        if len(self._memo) > self.max_entries:
+            self._memo.popitem(last=False)
+        return entry
+
+    def evaluate(self, state: Any) -> Tuple[int, Any]:
+        """
+        Evaluates a state, from the memo if possible.
+
+        Args:
+            state: The state to evaluate.
+
+        Returns:
+            The heuristic value and the profile of the state.
+        """
+        entry = self._memo.get(state)
+        if entry is not None:
+            self.hits += 1
+            self._memo.move_to_end(state)
+            return entry
+        self.misses += 1
+        return self._remember(state, self.evaluator.evaluate(state))
+
+    def evaluate_child(self, profile: Any, move: Tuple[int, int, int], child_state: Any) -> Tuple[int, Any]:
+        """
+        Evaluates the state reached by a move, from the memo if possible.
+
+        Args:
+            profile: The profile of the parent state.
+            move: The (from_peg, to_peg, num_disks) move applied to the parent.
+            child_state: The resulting state.
+
+        Returns:
+            The heuristic value and the profile of the child state.
+        """
+        entry = self._memo.get(child_state)
+        if entry is not None:
+            self.hits += 1
+            self._memo.move_to_end(child_state)
+            return entry
+        self.misses += 1
+        return self._remember(child_state, self.evaluator.evaluate_child(profile, move, child_state))
@@ -7,8 +7,7 @@
 Abstract base class for heuristic-based Tower of Hanoi solvers.
 """
 from abc import ABC
-from typing import TYPE_CHECKING
-import math
+from typing import Any, Optional, TYPE_CHECKING
 import sys
 import os
 
@@ -16,10 +15,18 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from solvers.base_solver import BaseSolver
+from solvers.informed_search.heuristic_evaluator import (
+    BlockingDisksEvaluator,
+    RecursiveEvaluator,
+)
+from solvers.informed_search.pattern_database import PatternDatabaseHeuristic
 
 if TYPE_CHECKING:
     from ..hanoi_state import HanoiState
 
+# Heuristics selectable through the `heuristic` option of the informed solvers
+HEURISTICS = ('blocking', 'recursive', 'pdb')
+
 class HeuristicsSolver(BaseSolver, ABC):
     """
     Abstract base class for heuristic-based Tower of Hanoi solvers.
@@ -29,37 +36,38 @@ class HeuristicsSolver(BaseSolver, ABC):
     heuristics that maintain optimality guarantees while guiding the search.
     """
     
-    def _blocking_disks_heuristic(self, state: 'HanoiState', max_liftable_disks: int = 1) -> int:
+    def _make_evaluator(self, heuristic: str, max_liftable_disks: int = 1,
+                        cache_dir: Optional[str] = None, towards: Optional['HanoiState'] = None) -> Any:
         """
-        Admissible heuristic for multi-disk Tower of Hanoi.
+        Selects the heuristic evaluator used to score states.
         
-        Counts disks not in their final position and divides by max_liftable_disks
-        to get a lower bound on the number of moves needed. This maintains
-        admissibility when multiple disks can be moved at once.
+        Evaluators score the initial state with `evaluate(state)` and every
+        generated state with `evaluate_child(parent_profile, move, state)`,
+        which updates the parent's profile instead of rescanning the state
+        (see `heuristic_evaluator`).
         
         Args:
-            state: The current state to evaluate.
+            heuristic: 'blocking' for the blocking disks heuristic, 'recursive'
+                       for the largest misplaced disk bound (exact with single
+                       lifts), or 'pdb' for pattern databases over groups of
+                       disks, combined by max.
             max_liftable_disks: Maximum number of disks that can be lifted at once.
+            cache_dir: The directory where pattern databases are saved and
+                       loaded from (pdb only). Defaults to ~/.cache/hanoi.
+            towards: The state distances are estimated to. Defaults to the
+                     target state; backward searches pass the initial state.
             
         Returns:
-            Lower bound estimate of moves needed to reach target.
-        """
-        # Count total disks not in their final position
-        misplaced_disks = 0
-        
-        for peg_idx in range(len(state.pegs)):
-            current_peg = state.pegs[peg_idx]
-            target_peg = self.target_state.pegs[peg_idx]
+            An evaluator of lower bounds on the distance to the target.
             
-            # Find the deepest correctly placed disks
-            correct_bottom = 0
-            while (correct_bottom < len(current_peg) and 
-                   correct_bottom < len(target_peg) and
-                   current_peg[correct_bottom] == target_peg[correct_bottom]):
-                correct_bottom += 1
-            
-            # All disks above the correctly placed bottom are misplaced
-            misplaced_disks += len(current_peg) - correct_bottom
-        
-        # With max_liftable_disks per move, we need at least ceil(misplaced / max_liftable) moves
-        return math.ceil(misplaced_disks / max_liftable_disks) if misplaced_disks > 0 else 0 
\ No newline at end of file
+        Raises:
+            ValueError: If the heuristic is unknown.
+        """
+        goal_state = self.target_state if towards is None else towards
+        if heuristic == 'blocking':
+            return BlockingDisksEvaluator(goal_state, max_liftable_disks)
+        if heuristic == 'recursive':
+            return RecursiveEvaluator(goal_state, max_liftable_disks)
+        if heuristic == 'pdb':
+            return PatternDatabaseHeuristic(goal_state, max_liftable_disks, cache_dir)
+        raise ValueError(f"Unknown heuristic: {heuristic}. Expected one of {', '.join(HEURISTICS)}.")
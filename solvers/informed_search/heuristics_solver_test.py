@@ -0,0 +1,56 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+import unittest
+
+from ..hanoi_state import HanoiState
+from ..testing import SolverTestCase, bfs_distances
+from .astar_solver import AStarSolver
+from .heuristic_evaluator import RecursiveEvaluator
+
+class TestRecursiveHeuristic(SolverTestCase):
+    def check_target(self, target_state, max_lift):
+        distances = bfs_distances(target_state, max_lift)
+        evaluator = RecursiveEvaluator(target_state, max_lift)
+        for state, distance in distances.items():
+            value, profile = evaluator.evaluate(state)
+            self.assertLessEqual(value, distance)
+            if max_lift == 1:
+                self.assertEqual(value, distance)
+
+            # The incremental evaluation of every successor matches the evaluation from scratch
+            for move, next_state in state.successors(max_lift):
+                self.assertEqual(evaluator.evaluate_child(profile, move, next_state),
+                                 evaluator.evaluate(next_state))
+
+    def test_admissible_for_every_target(self):
+        for max_lift in (1, 2, 3):
+            for rank in range(3 ** 4):
+                self.check_target(HanoiState.unrank(rank, 4), max_lift)
+
+    def test_admissible_on_larger_puzzles(self):
+        for max_lift in (1, 2, 3):
+            for rank in (0, 3 ** 6 - 1, 100, 555):
+                self.check_target(HanoiState.unrank(rank, 6), max_lift)
+
+    def test_consistent_with_single_lifts(self):
+        target_state = HanoiState.unrank(200, 5)
+        evaluator = RecursiveEvaluator(target_state, 1)
+        for rank in range(3 ** 5):
+            state = HanoiState.unrank(rank, 5)
+            value, _ = evaluator.evaluate(state)
+            for _, next_state in state.successors(1):
+                self.assertLessEqual(abs(value - evaluator.evaluate(next_state)[0]), 1)
+
+    def test_astar_finds_optimal_solutions(self):
+        target_state = HanoiState.unrank(17, 5)
+        for max_lift in (1, 2):
+            self.assertOptimal(
+                lambda initial_state: AStarSolver(initial_state, target_state)._solve_internal(
+                    max_lift, heuristic='recursive'),
+                target_state, max_lift, range(0, 3 ** 5, 7))
+
+if __name__ == '__main__':
+    unittest.main()
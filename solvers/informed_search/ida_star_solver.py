@@ -10,22 +10,43 @@ Licensed under the Unlicense - see LICENSE file for details
 Multi-AI development project - Repository: [URL to be added when public]
 """
 
-from typing import List, Optional, Tuple
+from collections import OrderedDict
+from typing import Any, List, Optional, Tuple
 from .heuristics_solver import HeuristicsSolver
+from .heuristic_evaluator import MemoizedEvaluator
 from ..hanoi_state import HanoiState
 
+# Default number of states kept in the transposition table
+DEFAULT_TABLE_SIZE = 1 << 18
+
+# Next bound reported when no state exceeded the current one
+NO_BOUND = 999999
+
 
 class IDAStarSolver(HeuristicsSolver):
     """
     IDA* (Iterative Deepening A*) solver.
     
     Combines iterative deepening with A* heuristic guidance:
-    - Memory efficient like DFS (O(depth) space)
+    - Memory efficient like DFS (O(depth) space, plus a bounded transposition table)
     - Optimal like A* (with admissible heuristic)
     - Iteratively increases f-cost bound until solution found
+    
+    The search is iterative: it keeps a single path of states, extended and
+    shortened in place, with a companion set for O(1) cycle checks. A
+    transposition table remembers, for recently seen states, the smallest
+    g-cost at which the current iteration entered them and a backed-up
+    heuristic value, learned from their completed subtrees and kept across
+    iterations. A state entered again at an equal or higher g-cost in the same
+    iteration cannot lead anywhere new and is skipped, and backed-up values
+    prune states earlier in later iterations. When the table is full, the
+    least recently used state is evicted.
     """
     
-    def _solve_internal(self, max_liftable_disks: int = 1, quiet: bool = False) -> List[Tuple[int, int, int]]:
+    def _solve_internal(self, max_liftable_disks: int = 1, quiet: bool = False, heuristic: str = 'blocking',
+                        cache_dir: Optional[str] = None,
+                        table_size: int = DEFAULT_TABLE_SIZE,
+                        prune_moves: bool = True, lock_settled: bool = False) -> List[Tuple[int, int, int]]:
         """
         Solve using IDA* algorithm.
         
@@ -34,101 +55,178 @@ class IDAStarSolver(HeuristicsSolver):
         Args:
             max_liftable_disks: The max number of disks that can be lifted at once.
             quiet: If True, suppress progress output during search.
+            heuristic: The heuristic to use, 'blocking' (default), 'recursive' or 'pdb'.
+            cache_dir: The directory of saved pattern databases (pdb only).
+            table_size: The maximum number of states in the transposition table (0 disables it).
+            prune_moves: If True, never lift again the disks placed by the previous move.
+            lock_settled: If True, never move the largest disks again once they sit on their
+                          target pegs (see `BaseSolver._get_successors`).
             
         Returns:
             A list of moves representing the shortest solution path.
+            
+        Raises:
+            RuntimeError: If no solution is found (should not happen for valid puzzles).
         """
         # Track initial state generation
         self._stats_node_generated()
         
+        # Every iteration re-evaluates the same states, so their values are memoized
+        evaluator = MemoizedEvaluator(self._make_evaluator(heuristic, max_liftable_disks, cache_dir))
+        table: 'OrderedDict[HanoiState, Tuple[int, int, int]]' = OrderedDict()
+        
         # Initial bound is the heuristic value of start state
-        bound = self._blocking_disks_heuristic(self.initial_state, max_liftable_disks)
+        h_cost, _ = evaluator.evaluate(self.initial_state)
+        bound = h_cost
         
         while True:
             if not quiet:
                 print(f"IDA* searching with f-cost bound: {bound}")
             self._stats_add_iteration(bound)
             
+            # The smaller bounds failed, so no solution is shorter than this one
+            self._stats_record_lower_bound(bound)
+            
             # Search with current bound
-            moves, next_bound = self._ida_star_search(
-                [self.initial_state], [], 0, bound, max_liftable_disks
-            )
+            moves, next_bound = self._ida_star_search(bound, max_liftable_disks, evaluator, table, table_size,
+                                                     prune_moves, lock_settled)
             
             # If solution found, return the moves
             if moves is not None:
                 return moves
                 
             # If no improvement possible, no solution exists
-            if next_bound >= 999999:
+            if next_bound >= NO_BOUND:
                 raise RuntimeError("IDA* search completed without finding a solution. "
                                  "This indicates a bug.")
                 
             # Update bound for next iteration
             bound = next_bound
-            
-    def _ida_star_search(self, state_path: List['HanoiState'], move_path: List[Tuple[int, int, int]], 
-                        g_cost: int, bound: int, max_liftable_disks: int) -> Tuple[Optional[List[Tuple[int, int, int]]], int]:
+    
+    def _remember(self, table: 'OrderedDict[HanoiState, Tuple[int, int, int]]', table_size: int,
+                  state: 'HanoiState', entry: Tuple[int, int, int]) -> None:
+        """Stores a transposition table entry, evicting the least recently used one if the table is full."""
+        if table_size <= 0:
+            return
+        table[state] = entry
+        table.move_to_end(state)
+        if len(table) > table_size:
+            table.popitem(last=False)
+    
+    def _ida_star_search(self, bound: int, max_liftable_disks: int, evaluator: Any,
+                         table: 'OrderedDict[HanoiState, Tuple[int, int, int]]',
+                         table_size: int, prune_moves: bool = True,
+                         lock_settled: bool = False) -> Tuple[Optional[List[Tuple[int, int, int]]], int]:
         """
-        Recursive IDA* search with f-cost bound.
+        Iterative depth-first search of one IDA* iteration, with f-cost bound.
+        
+        Every transposition table entry is a (bound, g_cost, backed_up_h) tuple:
+        the bound of the iteration that last entered the state, the smallest
+        g-cost at which that iteration entered it, and a lower bound on the
+        distance of the state to the target. A state finished without reaching
+        the target backs up the smallest value among its successors, plus one:
+        successors skipped because they are on the path contribute their
+        heuristic value, so backed-up values stay admissible whatever the path.
         
         Args:
-            state_path: Current path of states
-            move_path: Current path of moves
-            g_cost: Current g-cost (moves from start)
             bound: Current f-cost bound
             max_liftable_disks: Maximum disks that can be lifted
+            evaluator: The heuristic evaluator
+            table: The transposition table, kept across iterations
+            table_size: The maximum number of states in the table
+            prune_moves: Whether to prune the moves lifting again the disks placed by the previous move
+            lock_settled: Whether to never move the largest disks again once they sit on their target pegs
             
         Returns:
             (solution_moves, next_bound) where:
             - solution_moves is the move sequence if found, None otherwise
             - next_bound is the minimum f-cost that exceeded the bound
         """
-        current_state = state_path[-1]
-        f_cost = g_cost + self._blocking_disks_heuristic(current_state, max_liftable_disks)
+        target_state = self.target_state
+        initial_state = self.initial_state
         
-        # Track data structure size (state path for cycle detection)
-        self._stats_data_structure_size(len(state_path))
+        h_cost, profile = evaluator.evaluate(initial_state)
+        entry = table.get(initial_state)
+        if entry is not None:
+            h_cost = max(h_cost, entry[2])
+        if h_cost > bound:
+            return None, h_cost
+        if initial_state == target_state:
+            return [], h_cost
         
-        # If f-cost exceeds bound, return the exceeded value
-        if f_cost > bound:
-            return None, int(f_cost)
-            
-        # Check if we reached the target
-        if current_state == self.target_state:
-            return move_path, f_cost
-            
-        # Track node exploration
+        # The path: its moves, its states for cycle checks, and one frame per state with
+        # [state, g_cost, h_cost, profile, successors, backed-up h, smallest exceeded f]
+        move_path: List[Tuple[int, int, int]] = []
+        path_states = {initial_state}
+        stack: List[List[Any]] = [[initial_state, 0, h_cost, profile,
+                                   iter(self._get_successors(initial_state, max_liftable_disks, lock_settled=lock_settled)),
+                                   NO_BOUND, NO_BOUND]]
+        self._remember(table, table_size, initial_state, (bound, 0, h_cost))
         self._stats_node_explored()
-        min_exceeded = float('inf')
         
-        # Try all possible moves
-        for from_peg, to_peg, num_disks in self._get_possible_moves(current_state, max_liftable_disks):
-            try:
-                new_state = current_state.apply_move(from_peg, to_peg, num_disks)
-                self._stats_node_generated()
-                
-                # Avoid cycles (check if state already in path)
-                if new_state in state_path:
+        while stack:
+            frame = stack[-1]
+            current_state, g_cost, _, profile, successors, _, _ = frame
+            
+            # Track data structure size (path and transposition table)
+            self._stats_data_structure_size(len(stack) + len(table))
+            
+            step = next(successors, None)
+            if step is None:
+                # Subtree exhausted: back up its value and leave the state
+                stack.pop()
+                path_states.discard(current_state)
+                backed_up_h = max(frame[2], frame[5])
+                self._remember(table, table_size, current_state, (bound, g_cost, backed_up_h))
+                if stack:
+                    move_path.pop()
+                    parent = stack[-1]
+                    parent[5] = min(parent[5], backed_up_h + 1)
+                    parent[6] = min(parent[6], frame[6])
                     continue
-                    
-                # Recursive search with increased g-cost
-                new_state_path = state_path + [new_state]
-                new_move_path = move_path + [(from_peg, to_peg, num_disks)]
-                
-                result, exceeded = self._ida_star_search(
-                    new_state_path, new_move_path, g_cost + 1, bound, max_liftable_disks
-                )
-                
-                # If solution found, return it
-                if result is not None:
-                    return result, exceeded
-                    
-                # Track minimum exceeded f-cost for next iteration
-                if exceeded < min_exceeded:
-                    min_exceeded = exceeded
-                    
-            except ValueError:
-                # Invalid move, skip
+                return None, frame[6]
+            
+            move, new_state = step
+            new_g_cost = g_cost + 1
+            new_h_cost, new_profile = evaluator.evaluate_child(profile, move, new_state)
+            entry = table.get(new_state)
+            if entry is not None:
+                new_h_cost = max(new_h_cost, entry[2])
+            
+            # Moves lifting again the disks placed by the last move are pruned (see
+            # `BaseSolver._is_redundant_move`), but still bound the paths through them
+            if prune_moves and move_path and self._is_redundant_move(move, move_path[-1]):
+                frame[5] = min(frame[5], new_h_cost + 1)
                 continue
-                
-        return None, int(min_exceeded) if min_exceeded != float('inf') else 999999 
\ No newline at end of file
+            self._stats_node_generated()
+            
+            # Avoid cycles, and states this iteration already entered at a lower or equal g-cost,
+            # whose value still bounds every path through them
+            new_f_cost = new_g_cost + new_h_cost
+            if (new_state in path_states
+                    or (entry is not None and entry[0] == bound and entry[1] <= new_g_cost)):
+                frame[5] = min(frame[5], new_h_cost + 1)
+                continue
+            
+            # If f-cost exceeds bound, remember the exceeded value
+            if new_f_cost > bound:
+                frame[5] = min(frame[5], new_h_cost + 1)
+                frame[6] = min(frame[6], new_f_cost)
+                continue
+            
+            # Check if we reached the target
+            move_path.append(move)
+            if new_state == target_state:
+                return move_path, new_f_cost
+            
+            # Enter the successor
+            path_states.add(new_state)
+            self._remember(table, table_size, new_state, (bound, new_g_cost, new_h_cost))
+            stack.append([new_state, new_g_cost, new_h_cost, new_profile,
+                          iter(self._get_successors(new_state, max_liftable_disks, lock_settled=lock_settled)),
+                          NO_BOUND, NO_BOUND])
+            
+            # Track node exploration
+            self._stats_node_explored()
+        
+        return None, NO_BOUND
@@ -0,0 +1,48 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+import tempfile
+import unittest
+
+from ..hanoi_state import HanoiState
+from ..testing import SolverTestCase
+from .ida_star_solver import IDAStarSolver
+
+class TestIDAStarSolver(SolverTestCase):
+    def setUp(self):
+        # Pattern databases are saved here rather than in the user's cache
+        self.cache_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.cache_dir.cleanup()
+
+    def check_optimal(self, num_disks, max_lift, heuristic, table_size, prune_moves=True):
+        target_state = HanoiState.unrank(3 ** num_disks // 3, num_disks)
+        self.assertOptimal(
+            lambda initial_state: IDAStarSolver(initial_state, target_state)._solve_internal(
+                max_lift, quiet=True, heuristic=heuristic, table_size=table_size, prune_moves=prune_moves,
+                cache_dir=self.cache_dir.name),
+            target_state, max_lift, range(0, 3 ** num_disks, 11))
+
+    def test_optimal_without_table(self):
+        for max_lift in (1, 2):
+            self.check_optimal(4, max_lift, 'blocking', 0)
+
+    def test_optimal_without_pruning(self):
+        for max_lift in (1, 2):
+            self.check_optimal(5, max_lift, 'recursive', 1 << 18, prune_moves=False)
+
+    def test_optimal_with_tiny_table(self):
+        # Constant evictions must never cost optimality
+        for max_lift in (1, 2, 3):
+            self.check_optimal(5, max_lift, 'recursive', 7)
+
+    def test_optimal_with_default_table(self):
+        for max_lift in (1, 2, 3):
+            for heuristic in ('blocking', 'recursive', 'pdb'):
+                self.check_optimal(5, max_lift, heuristic, 1 << 18)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,232 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+"""
+Implements the MM bidirectional heuristic search solver for the Tower of Hanoi problem.
+
+MM ("meet in the middle") runs an A*-like search from each end of the puzzle:
+forwards from the initial state, with a heuristic towards the target state,
+and backwards from the target state, with a heuristic towards the initial
+state (moves are reversible, so the predecessors of a state are its
+successors). Nodes are prioritized by max(f, 2g), so neither search expands
+a node past the middle of the optimal solution.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+import heapq
+from .heuristics_solver import HeuristicsSolver
+from ..search_nodes import SearchNodeArena
+
+class _SearchDirection:
+    """
+    The open list and the generated nodes of one direction of an MM search.
+
+    Open nodes are held in three heaps, by priority, by f-score and by g-score,
+    whose minima drive node selection and the termination test. Entries are
+    removed lazily: an entry is stale once its node is no longer the open node
+    of its state.
+    """
+
+    def __init__(self, root_state: Any, evaluator: Any):
+        """
+        Opens the root node of the direction.
+
+        Args:
+            root_state: The state the direction starts from.
+            evaluator: The heuristic evaluator towards the other end.
+        """
+        self.evaluator = evaluator
+        self.arena = SearchNodeArena(root_state)
+        # Best g-score found for each generated state, and the open node of each open state
+        self.g_scores: Dict[Any, int] = {}
+        self.open_nodes: Dict[Any, int] = {}
+        self.by_priority: List[Tuple[int, int, int, Any]] = []
+        self.by_f_score: List[Tuple[int, int]] = []
+        self.by_g_score: List[Tuple[int, int]] = []
+        h_score, profile = evaluator.evaluate(root_state)
+        self.push(0, root_state, h_score, profile)
+
+    def push(self, node: int, state: Any, h_score: int, profile: Any) -> None:
+        """
+        Opens a node.
+
+        Args:
+            node: The index of the node in the arena.
+            state: The state of the node.
+            h_score: The heuristic value of the state.
+            profile: The heuristic profile of the state.
+        """
+        g_score = self.arena.depth(node)
+        f_score = g_score + h_score
+        self.g_scores[state] = g_score
+        self.open_nodes[state] = node
+        heapq.heappush(self.by_priority, (max(f_score, 2 * g_score), g_score, node, profile))
+        heapq.heappush(self.by_f_score, (f_score, node))
+        heapq.heappush(self.by_g_score, (g_score, node))
+
+    def _is_open(self, node: int) -> bool:
+        """Tells whether a node is still the open node of its state."""
+        return self.open_nodes.get(self.arena.states[node]) == node
+
+    def _clean(self, heap: List[Any], node_position: int) -> None:
+        """Pops the stale entries at the top of a heap."""
+        while heap and not self._is_open(heap[0][node_position]):
+            heapq.heappop(heap)
+
+    def minima(self) -> Optional[Tuple[int, int, int]]:
+        """
+        Returns the smallest priority, f-score and g-score among the open nodes.
+
+        Returns:
+            A (priority, f_score, g_score) tuple, or None if no node is open.
+        """
+        self._clean(self.by_priority, 2)
+        if not self.by_priority:
+            return None
+        self._clean(self.by_f_score, 1)
+        self._clean(self.by_g_score, 1)
+        return self.by_priority[0][0], self.by_f_score[0][0], self.by_g_score[0][0]
+
+    def pop(self) -> Tuple[int, Any]:
+        """
+        Closes the open node with the smallest priority.
+
+        Returns:
+            The node index and the heuristic profile of its state.
+        """
+        self._clean(self.by_priority, 2)
+        _, _, node, profile = heapq.heappop(self.by_priority)
+        del self.open_nodes[self.arena.states[node]]
+        return node, profile
+
+    def open_size(self) -> int:
+        """Returns the number of open nodes."""
+        return len(self.open_nodes)
+
+class MMSolver(HeuristicsSolver):
+    """
+    A solver that uses MM, bidirectional heuristic search meeting in the middle.
+
+    Each direction is a best-first search with front-to-end heuristics: the
+    forward search estimates the distance to the target state, the backward
+    search the distance to the initial state. Nodes are expanded by priority
+    max(f, 2g), always in the direction with the smaller minimum, and every
+    generated state is checked against the other direction to update the best
+    solution cost U. The search stops once U is at most the largest of the
+    minimum priority, the minimum f-scores of both directions and the sum of
+    their minimum g-scores plus one, each a lower bound on any solution not
+    found yet, so the solution is optimal with any admissible heuristic.
+    """
+
+    def _solve_internal(self, max_liftable_disks: int = 1, heuristic: str = 'blocking',
+                        cache_dir: Optional[str] = None) -> List[Tuple[int, int, int]]:
+        """
+        Performs MM search to find the optimal solution.
+
+        Args:
+            max_liftable_disks: The max number of disks that can be lifted at once.
+            heuristic: The heuristic to use, 'blocking' (default), 'recursive' or 'pdb'.
+            cache_dir: The directory of saved pattern databases (pdb only).
+
+        Returns:
+            A list of moves representing the shortest solution path.
+
+        Raises:
+            RuntimeError: If no solution is found (should not happen for valid puzzles).
+        """
+        if self.initial_state == self.target_state:
+            return []
+
+        # The backward search swaps roles: it starts from the target and estimates the distance to the start
+        forward = _SearchDirection(
+            self.initial_state, self._make_evaluator(heuristic, max_liftable_disks, cache_dir))
+        backward = _SearchDirection(
+            self.target_state, self._make_evaluator(heuristic, max_liftable_disks, cache_dir,
+                                                    towards=self.initial_state))
+
+        # Track initial and target state generation
+        self._stats_node_generated()
+        self._stats_node_generated()
+
+        # Best solution found so far: (cost, forward node, backward node)
+        best: Optional[Tuple[int, int, int]] = None
+
+        while True:
+            # Track the size of both open lists
+            self._stats_data_structure_size(forward.open_size() + backward.open_size())
+
+            forward_minima = forward.minima()
+            backward_minima = backward.minima()
+            if forward_minima is None or backward_minima is None:
+                break
+
+            # Stop once no solution cheaper than the best one can remain
+            lower_bound = max(min(forward_minima[0], backward_minima[0]),
+                              forward_minima[1], backward_minima[1],
+                              forward_minima[2] + backward_minima[2] + 1)
+            self._stats_record_lower_bound(lower_bound)
+            if best is not None and best[0] <= lower_bound:
+                return self._join(forward.arena, best[1], backward.arena, best[2])
+
+            # Expand the direction with the smaller priority, or the smaller open list on ties
+            if (forward_minima[0], forward.open_size()) <= (backward_minima[0], backward.open_size()):
+                direction, other = forward, backward
+            else:
+                direction, other = backward, forward
+
+            node, profile = direction.pop()
+            current_state = direction.arena.states[node]
+            g_score = direction.arena.depth(node)
+            self._stats_node_explored()
+
+            for move, next_state in self._get_successors(current_state, max_liftable_disks):
+                tentative_g_score = g_score + 1
+
+                # Skip states already reached with a better or equal g-score, open or closed
+                known_g_score = direction.g_scores.get(next_state)
+                if known_g_score is not None and known_g_score <= tentative_g_score:
+                    continue
+
+                # This is the best path to next_state so far: (re)open it
+                h_score, next_profile = direction.evaluator.evaluate_child(profile, move, next_state)
+                child = direction.arena.add(next_state, node, move)
+                direction.push(child, next_state, h_score, next_profile)
+                self._stats_node_generated()
+
+                # Check whether the other direction already reached this state
+                other_g_score = other.g_scores.get(next_state)
+                if other_g_score is not None and (best is None or tentative_g_score + other_g_score < best[0]):
+                    other_node = other.arena.node_of(next_state)
+                    if direction is forward:
+                        best = (tentative_g_score + other_g_score, child, other_node)
+                    else:
+                        best = (tentative_g_score + other_g_score, other_node, child)
+                    # Publish it, for callers that stop the search at a deadline
+                    self._stats_record_incumbent(self._join(forward.arena, best[1], backward.arena, best[2]))
+
+        if best is not None:
+            return self._join(forward.arena, best[1], backward.arena, best[2])
+
+        # Should never reach here for valid Tower of Hanoi puzzles
+        raise RuntimeError("MM search completed without finding a solution. This indicates a bug.")
+
+    def _join(self, forward_arena: SearchNodeArena, forward_node: int,
+              backward_arena: SearchNodeArena, backward_node: int) -> List[Tuple[int, int, int]]:
+        """
+        Builds the solution through a state reached by both directions.
+
+        Args:
+            forward_arena: The node arena of the forward search.
+            forward_node: The meeting node in the forward arena.
+            backward_arena: The node arena of the backward search.
+            backward_node: The meeting node in the backward arena.
+
+        Returns:
+            Complete solution path from initial to target state.
+        """
+        # The backward path leads from the target to the meeting state: reverse it and invert its moves
+        backward_path = backward_arena.path_to(backward_node)
+        return forward_arena.path_to(forward_node) + [
+            (to_peg, from_peg, num_disks) for from_peg, to_peg, num_disks in reversed(backward_path)
+        ]
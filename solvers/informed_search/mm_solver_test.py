@@ -0,0 +1,31 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+import tempfile
+import unittest
+
+from ..hanoi_state import HanoiState
+from ..testing import SolverTestCase
+from .mm_solver import MMSolver
+
+class TestMMSolver(SolverTestCase):
+    def setUp(self):
+        # Pattern databases are saved here rather than in the user's cache
+        self.cache_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.cache_dir.cleanup()
+
+    def test_optimal_against_bfs(self):
+        target_state = HanoiState.unrank(100, 5)
+        for max_lift in (1, 2, 3):
+            for heuristic in ('blocking', 'recursive', 'pdb'):
+                self.assertOptimal(
+                    lambda initial_state: MMSolver(initial_state, target_state)._solve_internal(
+                        max_lift, heuristic=heuristic, cache_dir=self.cache_dir.name),
+                    target_state, max_lift, range(0, 3 ** 5, 17))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,220 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+"""
+Pattern-database heuristics for the informed search solvers.
+
+A pattern is a group of consecutive disk sizes. Ignoring every other disk
+turns the puzzle into a smaller abstract puzzle whose moves are exactly the
+projections of the real ones: a real move lifts at most K disks of the pattern
+and never places a pattern disk on a smaller one, so the abstract distance to
+the projected target is a lower bound on the real distance. A pattern database
+stores that distance for every abstract state, computed once by a breadth-first
+search from the abstract target (moves are reversible, so this is the backward
+search towards it).
+
+Abstract states are indexed by their dense rank (see `HanoiState.rank`), and
+since the rank of a state lists the peg of each disk from the smallest up, the
+abstract rank of a pattern is just a slice of base-3 digits of the full rank.
+Tables hold one byte per abstract state and are saved to a cache directory,
+from which later runs map them with `mmap` instead of rebuilding them.
+"""
+
+from collections import deque
+from typing import Any, List, Optional, Tuple
+
+from ..hanoi_state import HanoiState
+from ..table_cache import load_table as load_saved_table
+
+# Largest number of disks in a single pattern (3^8 = 6561 table entries)
+DEFAULT_PATTERN_SIZE = 8
+
+# Table entry of abstract states not reached yet during the build
+UNSEEN = 255
+
+# Largest distance stored in a table; longer distances are capped, which keeps them admissible
+MAX_STORED_DISTANCE = 254
+
+
+def build_table(num_disks: int, target_rank: int, max_lift: int) -> bytearray:
+    """
+    Computes the distance to an abstract target from every abstract state.
+
+    Args:
+        num_disks: The number of disks in the abstract puzzle.
+        target_rank: The rank of the abstract target state.
+        max_lift: The maximum number of disks lifted by a single move.
+
+    Returns:
+        A table with one byte per abstract rank, holding the capped distance.
+    """
+    table = bytearray([UNSEEN]) * (3 ** num_disks)
+    table[target_rank] = 0
+
+    queue = deque([HanoiState.unrank(target_rank, num_disks)])
+    while queue:
+        state = queue.popleft()
+        distance = min(table[state.rank()] + 1, MAX_STORED_DISTANCE)
+        for _, next_state in state.successors(max_lift):
+            next_rank = next_state.rank()
+            if table[next_rank] == UNSEEN:
+                table[next_rank] = distance
+                queue.append(next_state)
+
+    return table
+
+
+def load_table(num_disks: int, target_rank: int, max_lift: int, cache_dir: Optional[str] = None) -> Any:
+    """
+    Gets a pattern-database table, from memory, from the cache directory or by building it.
+
+    Newly built tables are written to the cache directory; if it cannot be
+    written, the table is simply kept in memory (see `solvers.table_cache.load_table`).
+
+    Args:
+        num_disks: The number of disks in the abstract puzzle.
+        target_rank: The rank of the abstract target state.
+        max_lift: The maximum number of disks lifted by a single move.
+        cache_dir: The directory holding saved tables. Defaults to ~/.cache/hanoi.
+
+    Returns:
+        An indexable table of distances (a `bytearray` or a read-only `mmap`).
+    """
+    # Lifting more disks than the pattern holds makes no difference
+    max_lift = min(max_lift, num_disks)
+    return load_saved_table(('pdb', num_disks, max_lift, target_rank),
+                            f"pdb_{num_disks}disks_lift{max_lift}_target{target_rank}.bin",
+                            3 ** num_disks, lambda: build_table(num_disks, target_rank, max_lift), cache_dir)
+
+
+class PatternDatabase:
+    """
+    Exact abstract distances for a group of consecutive disk sizes.
+
+    Attributes:
+        first_disk (int): The 0-indexed size rank of the smallest disk of the pattern.
+        num_disks (int): The number of disks in the pattern.
+        table: The distance of every abstract state, indexed by abstract rank.
+    """
+
+    def __init__(self, target_state: Any, first_disk: int, num_disks: int,
+                 max_lift: int, cache_dir: Optional[str] = None):
+        """
+        Builds or loads the pattern database for a target state.
+
+        Args:
+            target_state: The state the search must reach.
+            first_disk: The 0-indexed size rank of the smallest disk of the pattern.
+            num_disks: The number of disks in the pattern.
+            max_lift: The maximum number of disks lifted by a single move.
+            cache_dir: The directory holding saved tables. Defaults to ~/.cache/hanoi.
+        """
+        self.first_disk = first_disk
+        self.num_disks = num_disks
+        self._divisor = 3 ** first_disk
+        self._modulus = 3 ** num_disks
+        self.table = load_table(num_disks, self.abstract_rank(target_state.rank()), max_lift, cache_dir)
+
+    def abstract_rank(self, rank: int) -> int:
+        """Projects the rank of a full state onto the pattern."""
+        return (rank // self._divisor) % self._modulus
+
+    def lookup(self, rank: int) -> int:
+        """
+        Returns the lower bound stored for a state.
+
+        Args:
+            rank: The rank of the full state.
+
+        Returns:
+            The exact distance of the projected state to the projected target.
+        """
+        return self.table[(rank // self._divisor) % self._modulus]
+
+
+class PatternDatabaseHeuristic:
+    """
+    Admissible heuristic combining several pattern databases by maximum.
+
+    The disks are split into patterns of at most `pattern_size` consecutive
+    sizes, starting from the largest disks, whose moves dominate the cost.
+    As an evaluator (see `heuristic_evaluator`), its profile is the rank of
+    the state, which a move changes by a sum over the lifted disks only.
+    """
+
+    def __init__(self, target_state: Any, max_lift: int, cache_dir: Optional[str] = None,
+                 pattern_size: int = DEFAULT_PATTERN_SIZE):
+        """
+        Prepares the pattern databases for a target state.
+
+        Args:
+            target_state: The state the search must reach.
+            max_lift: The maximum number of disks lifted by a single move.
+            cache_dir: The directory holding saved tables. Defaults to ~/.cache/hanoi.
+            pattern_size: The maximum number of disks in a pattern.
+
+        Raises:
+            ValueError: If the pattern size is not positive.
+        """
+        if pattern_size < 1:
+            raise ValueError("The pattern size must be positive.")
+
+        self.databases: List[PatternDatabase] = []
+        top = target_state.number_of_disks
+        while top > 0:
+            first_disk = max(0, top - pattern_size)
+            self.databases.append(PatternDatabase(target_state, first_disk, top - first_disk, max_lift, cache_dir))
+            top = first_disk
+
+        # Rank weight of each disk: base-3 digit i of a rank belongs to the i-th smallest disk
+        self._weight_of_disk = {disk: 3 ** idx for idx, disk in enumerate(target_state.disk_labels())}
+
+    def _estimate(self, rank: int) -> int:
+        """Returns the largest lower bound among the pattern databases."""
+        return max((database.lookup(rank) for database in self.databases), default=0)
+
+    def evaluate(self, state: Any) -> Tuple[int, int]:
+        """
+        Evaluates a state from scratch.
+
+        Args:
+            state: The state to evaluate.
+
+        Returns:
+            The heuristic value and the rank of the state.
+        """
+        rank = state.rank()
+        return self._estimate(rank), rank
+
+    def evaluate_child(self, rank: int, move: Tuple[int, int, int], child_state: Any) -> Tuple[int, int]:
+        """
+        Evaluates the state reached by a move, from the rank of its parent.
+
+        Args:
+            rank: The rank of the parent state.
+            move: The (from_peg, to_peg, num_disks) move applied to the parent.
+            child_state: The resulting state.
+
+        Returns:
+            The heuristic value and the rank of the child state.
+        """
+        from_peg, to_peg, num_disks = move
+        weight_of_disk = self._weight_of_disk
+        # The lifted disks are now the top disks of the target peg, and each one changes peg digit
+        for disk in child_state.pegs[to_peg - 1][-num_disks:]:
+            rank += (to_peg - from_peg) * weight_of_disk[disk]
+        return self._estimate(rank), rank
+
+    def __call__(self, state: Any) -> int:
+        """
+        Estimates the number of moves from a state to the target.
+
+        Args:
+            state: The state to evaluate.
+
+        Returns:
+            The largest lower bound among the pattern databases.
+        """
+        return self._estimate(state.rank())
@@ -0,0 +1,135 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+"""
+Implements a weighted A* solver for the Tower of Hanoi problem.
+
+Weighted A* orders states by g + w * h instead of g + h. With an admissible
+heuristic, the first solution it reaches is at most w times longer than the
+shortest one, and a larger weight lets it trust the heuristic more and expand
+fewer states. Besides this a priori guarantee, the smallest g + h among the
+open states is a lower bound on the shortest length, so each run also reports
+the bound it actually achieved, usually much tighter than w.
+"""
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+import heapq
+import math
+from .heuristics_solver import HeuristicsSolver
+from ..search_nodes import SearchNodeArena
+
+if TYPE_CHECKING:
+    from ..hanoi_state import HanoiState
+
+# Default weight of the heuristic, i.e. the default suboptimality bound
+DEFAULT_WEIGHT = 2.0
+
+class WeightedAStarSolver(HeuristicsSolver):
+    """
+    A solver that uses weighted A* search, with a bounded suboptimality.
+
+    The solution is at most `weight` times longer than the shortest one, and
+    with weight 1 the search is A*. The achieved bound, the solution length
+    divided by the proven lower bound, is reported as 'suboptimality_bound'
+    in the statistics.
+    """
+
+    def _solve_internal(self, max_liftable_disks: int = 1, heuristic: str = 'blocking',
+                        cache_dir: Optional[str] = None, weight: float = DEFAULT_WEIGHT,
+                        lock_settled: bool = False) -> List[Tuple[int, int, int]]:
+        """
+        Performs weighted A* search to find a solution within the weight times optimal.
+
+        Args:
+            max_liftable_disks: The max number of disks that can be lifted at once.
+            heuristic: The heuristic to use, 'blocking' (default), 'recursive' or 'pdb'.
+            cache_dir: The directory of saved pattern databases (pdb only).
+            weight: The weight of the heuristic, at least 1: the suboptimality bound.
+            lock_settled: If True, never move the largest disks again once they sit on their
+                          target pegs (see `BaseSolver._get_successors`).
+
+        Returns:
+            A list of moves at most `weight` times longer than the shortest solution.
+
+        Raises:
+            ValueError: If the weight is below 1.
+            RuntimeError: If no solution is found (should not happen for valid puzzles).
+        """
+        if weight < 1:
+            raise ValueError(f"The weight must be at least 1, got {weight}.")
+
+        # Priority queue: (priority, -g_score, counter, node, profile), with priority = g + weight * h;
+        # deeper states first on ties. The f-score heap holds (g + h, node) for the lower bound.
+        evaluator = self._make_evaluator(heuristic, max_liftable_disks, cache_dir)
+        arena = SearchNodeArena(self.initial_state)
+        counter = 0
+        h_score, profile = evaluator.evaluate(self.initial_state)
+        open_set = [(weight * h_score, 0, counter, 0, profile)]
+        by_f_score = [(h_score, 0)]
+
+        # Best g-score found for each state, and the open node of each open state
+        g_scores: Dict['HanoiState', int] = {self.initial_state: 0}
+        open_nodes: Dict['HanoiState', int] = {self.initial_state: 0}
+
+        # Track initial state generation
+        self._stats_node_generated()
+
+        while open_set:
+            # Track maximum queue size
+            self._stats_data_structure_size(len(open_set))
+
+            _, _, _, node, profile = heapq.heappop(open_set)
+            current_state = arena.states[node]
+
+            # Skip stale entries, superseded by a cheaper path or already expanded
+            if open_nodes.get(current_state) != node:
+                continue
+
+            # No solution is shorter than the smallest f-score of an open state, this one included
+            self._publish_lower_bound(arena, by_f_score, open_nodes)
+
+            if current_state == self.target_state:
+                solution = arena.path_to(node)
+                self._stats_record_incumbent(solution)
+                return solution
+
+            # Closed states are reopened when a cheaper path reaches them
+            del open_nodes[current_state]
+            self._stats_node_explored()
+
+            tentative_g_score = arena.depth(node) + 1
+            for move, next_state in self._get_successors(current_state, max_liftable_disks, lock_settled=lock_settled):
+                if tentative_g_score >= g_scores.get(next_state, math.inf):
+                    continue
+                g_scores[next_state] = tentative_g_score
+
+                h_score, next_profile = evaluator.evaluate_child(profile, move, next_state)
+                child = arena.add(next_state, node, move)
+                open_nodes[next_state] = child
+                counter += 1
+                heapq.heappush(open_set, (tentative_g_score + weight * h_score, -tentative_g_score,
+                                          counter, child, next_profile))
+                heapq.heappush(by_f_score, (tentative_g_score + h_score, child))
+                self._stats_node_generated()
+
+        # Should never reach here for valid Tower of Hanoi puzzles
+        raise RuntimeError("Weighted A* search completed without finding a solution. This indicates a bug.")
+
+    def _publish_lower_bound(self, arena: SearchNodeArena, by_f_score: List[Tuple[int, int]],
+                             open_nodes: Dict['HanoiState', int]) -> None:
+        """
+        Publishes the smallest f-score among the open states as a lower bound.
+
+        Every shortest solution goes through an open state whose g-score is
+        exact, so with an admissible heuristic none is shorter than that f-score.
+
+        Args:
+            arena: The search nodes.
+            by_f_score: The (f_score, node) heap of the open nodes, cleaned lazily.
+            open_nodes: The open node of each open state.
+        """
+        while by_f_score and open_nodes.get(arena.states[by_f_score[0][1]]) != by_f_score[0][1]:
+            heapq.heappop(by_f_score)
+        if by_f_score:
+            self._stats_record_lower_bound(by_f_score[0][0])
@@ -0,0 +1,41 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+import unittest
+
+from ..hanoi_state import HanoiState
+from ..testing import bfs_distances, replay
+from .weighted_astar_solver import WeightedAStarSolver
+from .focal_search_solver import FocalSearchSolver
+
+class TestBoundedSuboptimalSolvers(unittest.TestCase):
+    def test_within_weight_times_optimal(self):
+        target_state = HanoiState.unrank(100, 5)
+        for max_lift in (1, 2, 3):
+            distances = bfs_distances(target_state, max_lift)
+            for solver_class in (WeightedAStarSolver, FocalSearchSolver):
+                for weight, lock_settled in ((1.0, False), (1.5, False), (3.0, False), (1.0, True), (3.0, True)):
+                    for rank in range(0, 3 ** 5, 13):
+                        initial_state = HanoiState.unrank(rank, 5)
+                        solver = solver_class(initial_state, target_state)
+                        solution = solver._solve_internal(max_lift, weight=weight, lock_settled=lock_settled)
+                        optimum = distances[initial_state]
+                        self.assertEqual(replay(solution, initial_state), target_state)
+                        self.assertLessEqual(len(solution), weight * optimum)
+                        self.assertLessEqual(solver._stats_lower_bound, optimum)
+                        bound = solver.suboptimality_bound(len(solution), solver._stats_lower_bound)
+                        self.assertLessEqual(bound, weight)
+                        self.assertLessEqual(len(solution), bound * optimum)
+                        if weight == 1.0:
+                            self.assertEqual(len(solution), optimum)
+
+    def test_rejects_weight_below_one(self):
+        for solver_class in (WeightedAStarSolver, FocalSearchSolver):
+            solver = solver_class(HanoiState.classic_init(3, on_peg=1), HanoiState.classic_init(3, on_peg=3))
+            with self.assertRaises(ValueError):
+                solver._solve_internal(1, weight=0.5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,421 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+"""
+Shared search-node storage for the search-based solvers.
+
+Instead of carrying a full copy of the move list with every frontier entry,
+solvers store each generated node once in a `SearchNodeArena`: the node keeps
+its state, the index of its parent node and a compact code for the move that
+produced it. Frontiers then only hold integer node indices, and the move list
+is rebuilt by following parent pointers once the goal has been reached.
+
+For large instances, `CompactSearchNodeArena` keeps the same interface but
+stores each node as the dense rank of its state (see `HanoiState.rank`) and
+detects duplicates with a `RankBitmap`, which costs one bit per possible state
+instead of a hash-set entry per generated state.
+"""
+
+from array import array
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+# Parent index and move code of the root node
+NO_PARENT = -1
+NO_MOVE = -1
+
+# Supported duplicate-detection structures for `create_arena`
+VISITED_MODES = ('set', 'bitmap')
+
+
+def encode_move(from_peg: int, to_peg: int, num_disks: int) -> int:
+    """
+    Packs a move into a single small integer.
+
+    Args:
+        from_peg: The 1-indexed source peg.
+        to_peg: The 1-indexed target peg.
+        num_disks: The number of disks lifted by the move.
+
+    Returns:
+        A non-negative integer code for the move.
+    """
+    return ((num_disks - 1) * 3 + (from_peg - 1)) * 3 + (to_peg - 1)
+
+
+def decode_move(code: int) -> Tuple[int, int, int]:
+    """
+    Unpacks a move code produced by `encode_move`.
+
+    Args:
+        code: The move code.
+
+    Returns:
+        The move as a (from_peg, to_peg, num_disks) tuple.
+    """
+    return (code // 3) % 3 + 1, code % 3 + 1, code // 9 + 1
+
+
+class SearchNodeArena:
+    """
+    Append-only store of search nodes with parent pointers.
+
+    Node 0 is always the root. Each node records its state, its parent node
+    index, the code of the move that led to it and its depth. A dictionary from
+    state to node index provides duplicate detection at generation time; when
+    a node is re-added for a state that is already known (e.g. A* finding a
+    cheaper path), the index is updated to point to the newest node.
+    """
+
+    def __init__(self, root_state: Any):
+        """
+        Initializes the arena with its root node.
+
+        Args:
+            root_state: The state the search starts from.
+        """
+        self.states: List[Any] = [root_state]
+        self.parents = array('l', [NO_PARENT])
+        self.moves = array('l', [NO_MOVE])
+        self.depths = array('l', [0])
+        self._index = {root_state: 0}
+
+    def __len__(self) -> int:
+        """Returns the number of nodes stored in the arena."""
+        return len(self.states)
+
+    def __contains__(self, state: Any) -> bool:
+        """Checks whether a node has already been generated for a state."""
+        return state in self._index
+
+    def keys(self) -> Iterator[Any]:
+        """Returns a view over the distinct states stored in the arena."""
+        return self._index.keys()
+
+    def common_states(self, other: 'SearchNodeArena') -> Iterable[Any]:
+        """
+        Returns the states generated both in this arena and in another one.
+
+        Args:
+            other: The arena to intersect with.
+
+        Returns:
+            The states known to both arenas.
+        """
+        return self._index.keys() & other._index.keys()
+
+    def node_of(self, state: Any) -> Optional[int]:
+        """
+        Looks up the most recent node generated for a state.
+
+        Args:
+            state: The state to look up.
+
+        Returns:
+            The node index, or None if the state has not been generated.
+        """
+        return self._index.get(state)
+
+    def add(self, state: Any, parent: int, move: Tuple[int, int, int]) -> int:
+        """
+        Appends a new node, even if the state was already generated.
+
+        Args:
+            state: The state of the new node.
+            parent: The index of the parent node.
+            move: The (from_peg, to_peg, num_disks) move leading from the parent.
+
+        Returns:
+            The index of the new node.
+        """
+        node = len(self.states)
+        # Populate the node before publishing it in the index, so that readers
+        # in other threads never see a half-built node
+        self.states.append(state)
+        self.parents.append(parent)
+        self.moves.append(encode_move(*move))
+        self.depths.append(self.depths[parent] + 1)
+        self._index[state] = node
+        return node
+
+    def add_if_new(self, state: Any, parent: int, move: Tuple[int, int, int]) -> Optional[int]:
+        """
+        Appends a new node only if the state has never been generated.
+
+        Args:
+            state: The state of the new node.
+            parent: The index of the parent node.
+            move: The (from_peg, to_peg, num_disks) move leading from the parent.
+
+        Returns:
+            The index of the new node, or None if the state is a duplicate.
+        """
+        if state in self._index:
+            return None
+        return self.add(state, parent, move)
+
+    def depth(self, node: int) -> int:
+        """Returns the number of moves from the root to a node."""
+        return self.depths[node]
+
+    def last_move(self, node: int) -> Optional[Tuple[int, int, int]]:
+        """
+        Returns the move that produced a node.
+
+        Args:
+            node: The node index.
+
+        Returns:
+            The (from_peg, to_peg, num_disks) move, or None for the root.
+        """
+        code = self.moves[node]
+        return None if code == NO_MOVE else decode_move(code)
+
+    def path_to(self, node: int) -> List[Tuple[int, int, int]]:
+        """
+        Rebuilds the move sequence leading from the root to a node.
+
+        Args:
+            node: The node index.
+
+        Returns:
+            The list of (from_peg, to_peg, num_disks) moves, root first.
+        """
+        codes = []
+        parents = self.parents
+        moves = self.moves
+        while parents[node] != NO_PARENT:
+            codes.append(moves[node])
+            node = parents[node]
+
+        codes.reverse()
+        return [decode_move(code) for code in codes]
+
+
+class RankBitmap:
+    """
+    Set of state ranks stored as a bitmap over all 3^n possible ranks.
+
+    Bit r of the underlying `bytearray` is set once the state of rank r has
+    been added. Membership tests and insertions are O(1), and the whole set
+    takes 3^n / 8 bytes regardless of how many states it holds.
+    """
+
+    def __init__(self, number_of_disks: int):
+        """
+        Initializes an empty bitmap covering every state with a given number of disks.
+
+        Args:
+            number_of_disks: The number of disks in the puzzle.
+        """
+        self.capacity = 3 ** number_of_disks
+        self.bits = bytearray((self.capacity + 7) // 8)
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Returns the number of ranks in the set."""
+        return self._count
+
+    def __contains__(self, rank: int) -> bool:
+        """Checks whether a rank is in the set."""
+        return bool(self.bits[rank >> 3] & (1 << (rank & 7)))
+
+    def add(self, rank: int) -> bool:
+        """
+        Adds a rank to the set.
+
+        Args:
+            rank: The rank to add.
+
+        Returns:
+            True if the rank was not in the set before, False otherwise.
+        """
+        byte = rank >> 3
+        bit = 1 << (rank & 7)
+        if self.bits[byte] & bit:
+            return False
+        self.bits[byte] |= bit
+        self._count += 1
+        return True
+
+    def intersection(self, other: 'RankBitmap') -> Iterator[int]:
+        """
+        Iterates over the ranks present in both this bitmap and another one.
+
+        Args:
+            other: A bitmap over the same number of disks.
+
+        Yields:
+            The common ranks, in increasing order.
+        """
+        common = int.from_bytes(self.bits, 'little') & int.from_bytes(other.bits, 'little')
+        while common:
+            low = common & -common
+            yield low.bit_length() - 1
+            common ^= low
+
+
+class _UnrankedStates:
+    """
+    Read-only sequence view that rebuilds the state of each node from its rank.
+    """
+
+    def __init__(self, arena: 'CompactSearchNodeArena'):
+        self._arena = arena
+
+    def __len__(self) -> int:
+        return len(self._arena.ranks)
+
+    def __getitem__(self, node: int) -> Any:
+        arena = self._arena
+        return arena.state_class.unrank(arena.ranks[node], arena.number_of_disks, arena.disk_labels)
+
+
+class CompactSearchNodeArena(SearchNodeArena):
+    """
+    Memory-lean `SearchNodeArena` that stores dense state ranks instead of states.
+
+    Nodes are kept in typed arrays (rank, parent, move code, depth: about 18
+    bytes per node) and duplicates are detected with a `RankBitmap`. States are
+    rebuilt on demand with `unrank` through the `states` view, so solvers use
+    this arena exactly like the default one.
+
+    The arena only supports searches that add each state once (`add_if_new`).
+    Looking up the node of a state is a linear scan over the ranks: it is
+    meant for the one-off lookups done when two searches meet.
+    """
+
+    def __init__(self, root_state: Any):
+        """
+        Initializes the arena with its root node.
+
+        Args:
+            root_state: The state the search starts from. Its class must
+                        provide `rank`, `unrank` and `disk_labels`.
+        """
+        self.state_class = type(root_state)
+        self.number_of_disks = root_state.number_of_disks
+        self.disk_labels = root_state.disk_labels()
+        self.visited = RankBitmap(self.number_of_disks)
+
+        root_rank = root_state.rank()
+        self.visited.add(root_rank)
+        self.ranks = array('q', [root_rank])
+        self.parents = array('i', [NO_PARENT])
+        self.moves = array('h', [NO_MOVE])
+        self.depths = array('i', [0])
+        self.states = _UnrankedStates(self)
+
+    def __len__(self) -> int:
+        """Returns the number of nodes stored in the arena."""
+        return len(self.ranks)
+
+    def __contains__(self, state: Any) -> bool:
+        """Checks whether a node has already been generated for a state."""
+        return state.rank() in self.visited
+
+    def keys(self) -> Iterator[Any]:
+        """Iterates over the distinct states stored in the arena."""
+        return iter(self.states)
+
+    def common_states(self, other: SearchNodeArena) -> Iterable[Any]:
+        """
+        Returns the states generated both in this arena and in another one.
+
+        Args:
+            other: The arena to intersect with.
+
+        Returns:
+            The states known to both arenas.
+        """
+        if not isinstance(other, CompactSearchNodeArena):
+            return [state for state in other.keys() if state in self]
+
+        unrank = self.state_class.unrank
+        return [unrank(rank, self.number_of_disks, self.disk_labels)
+                for rank in self.visited.intersection(other.visited)]
+
+    def node_of(self, state: Any) -> Optional[int]:
+        """
+        Looks up the node generated for a state.
+
+        Args:
+            state: The state to look up.
+
+        Returns:
+            The node index, or None if the state has not been generated.
+        """
+        rank = state.rank()
+        if rank not in self.visited:
+            return None
+        return self.ranks.index(rank)
+
+    def add(self, state: Any, parent: int, move: Tuple[int, int, int]) -> int:
+        """
+        Appends a new node for a state that has not been generated yet.
+
+        Args:
+            state: The state of the new node.
+            parent: The index of the parent node.
+            move: The (from_peg, to_peg, num_disks) move leading from the parent.
+
+        Returns:
+            The index of the new node.
+
+        Raises:
+            ValueError: If the state has already been generated.
+        """
+        node = self.add_if_new(state, parent, move)
+        if node is None:
+            raise ValueError("The compact arena stores each state only once.")
+        return node
+
+    def add_if_new(self, state: Any, parent: int, move: Tuple[int, int, int]) -> Optional[int]:
+        """
+        Appends a new node only if the state has never been generated.
+
+        Args:
+            state: The state of the new node.
+            parent: The index of the parent node.
+            move: The (from_peg, to_peg, num_disks) move leading from the parent.
+
+        Returns:
+            The index of the new node, or None if the state is a duplicate.
+        """
+        rank = state.rank()
+        if rank in self.visited:
+            return None
+
+        node = len(self.ranks)
+        # Populate the node before publishing it in the bitmap, so that readers
+        # in other threads never see a half-built node
+        self.ranks.append(rank)
+        self.parents.append(parent)
+        self.moves.append(encode_move(*move))
+        self.depths.append(self.depths[parent] + 1)
+        self.visited.add(rank)
+        return node
+
+
+def create_arena(root_state: Any, visited: str = 'set') -> SearchNodeArena:
+    """
+    Creates the node arena matching a duplicate-detection mode.
+
+    Args:
+        root_state: The state the search starts from.
+        visited: 'set' for a `SearchNodeArena` indexed by a dictionary of
+                 states, or 'bitmap' for a `CompactSearchNodeArena` indexed by
+                 a `RankBitmap` of state ranks.
+
+    Returns:
+        A new arena rooted at the given state.
+
+    Raises:
+        ValueError: If the visited mode is unknown.
+    """
+    if visited == 'set':
+        return SearchNodeArena(root_state)
+    if visited == 'bitmap':
+        return CompactSearchNodeArena(root_state)
+    raise ValueError(f"Unknown visited mode: {visited}. Expected one of {', '.join(VISITED_MODES)}.")
@@ -0,0 +1,137 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+import unittest
+
+from .hanoi_state import HanoiState
+from .search_nodes import CompactSearchNodeArena, RankBitmap, SearchNodeArena, create_arena, decode_move, encode_move
+from .testing import replay
+
+class TestSearchNodeArena(unittest.TestCase):
+    arena_class = SearchNodeArena
+
+    def build_tree(self, root_state, max_lift, depth):
+        # Breadth-first tree of the states within a given distance of the root
+        arena = self.arena_class(root_state)
+        layer = [0]
+        for _ in range(depth):
+            next_layer = []
+            for node in layer:
+                for move, next_state in arena.states[node].successors(max_lift):
+                    child = arena.add_if_new(next_state, node, move)
+                    if child is not None:
+                        next_layer.append(child)
+            layer = next_layer
+        return arena
+
+    def test_move_codes_round_trip(self):
+        codes = set()
+        for from_peg in (1, 2, 3):
+            for to_peg in (1, 2, 3):
+                for num_disks in range(1, 20):
+                    code = encode_move(from_peg, to_peg, num_disks)
+                    self.assertGreaterEqual(code, 0)
+                    self.assertEqual(decode_move(code), (from_peg, to_peg, num_disks))
+                    codes.add(code)
+        self.assertEqual(len(codes), 9 * 19)
+
+    def test_path_to_replays_to_the_node_state(self):
+        root_state = HanoiState.classic_init(4, on_peg=1)
+        for max_lift in (1, 2):
+            arena = self.build_tree(root_state, max_lift, 6)
+            self.assertEqual(arena.path_to(0), [])
+            self.assertIsNone(arena.last_move(0))
+            for node in range(len(arena)):
+                state = arena.states[node]
+                path = arena.path_to(node)
+                self.assertEqual(len(path), arena.depth(node))
+                self.assertEqual(replay(path, root_state), state)
+                self.assertEqual(arena.node_of(state), node)
+                if path:
+                    self.assertEqual(arena.last_move(node), path[-1])
+
+    def test_add_if_new_skips_duplicates(self):
+        root_state = HanoiState.classic_init(3, on_peg=1)
+        arena = self.arena_class(root_state)
+        (move, next_state), _ = list(root_state.successors())[:2]
+        child = arena.add_if_new(next_state, 0, move)
+        self.assertEqual(child, 1)
+        self.assertIn(next_state, arena)
+        self.assertIsNone(arena.add_if_new(next_state, 0, move))
+        self.assertIsNone(arena.add_if_new(root_state, child, (move[1], move[0], move[2])))
+        self.assertEqual(len(arena), 2)
+        self.assertEqual(set(arena.keys()), {root_state, next_state})
+
+    def test_add_points_to_the_newest_node(self):
+        root_state = HanoiState.classic_init(3, on_peg=1)
+        arena = SearchNodeArena(root_state)
+        first = arena.add(HanoiState(((3, 2), (), (1,))), 0, (1, 3, 1))
+        second = arena.add(HanoiState(((3,), (2,), (1,))), first, (1, 2, 1))
+        again = arena.add(HanoiState(((3, 2), (), (1,))), second, (2, 1, 1))
+        self.assertEqual(arena.node_of(HanoiState(((3, 2), (), (1,)))), again)
+        self.assertEqual(arena.depth(again), 3)
+        self.assertEqual(arena.path_to(again), [(1, 3, 1), (1, 2, 1), (2, 1, 1)])
+        self.assertEqual(len(arena), 4)
+
+    def test_common_states(self):
+        left = self.build_tree(HanoiState.classic_init(3, on_peg=1), 1, 3)
+        right = self.build_tree(HanoiState.classic_init(3, on_peg=3), 1, 4)
+        expected = set(left.keys()) & set(right.keys())
+        self.assertTrue(expected)
+        self.assertEqual(set(left.common_states(right)), expected)
+
+class TestCompactSearchNodeArena(TestSearchNodeArena):
+    arena_class = CompactSearchNodeArena
+
+    def test_add_points_to_the_newest_node(self):
+        # Each state is stored once, so re-adding a state is an error
+        root_state = HanoiState.classic_init(3, on_peg=1)
+        arena = CompactSearchNodeArena(root_state)
+        child = arena.add(HanoiState(((3, 2), (), (1,))), 0, (1, 3, 1))
+        with self.assertRaises(ValueError):
+            arena.add(HanoiState(((3, 2), (), (1,))), child, (1, 3, 1))
+
+    def test_mixed_common_states(self):
+        left = self.build_tree(HanoiState.classic_init(3, on_peg=1), 1, 3)
+        right = TestSearchNodeArena.build_tree(self, HanoiState.classic_init(3, on_peg=3), 1, 4)
+        self.assertEqual(set(left.common_states(right)), set(left.keys()) & set(right.keys()))
+
+    def test_states_keep_labels(self):
+        root_state = HanoiState(((9, 4), (), (7,)))
+        arena = self.build_tree(root_state, 1, 3)
+        self.assertEqual(arena.states[0], root_state)
+        for node in range(len(arena)):
+            self.assertEqual(arena.states[node].disk_labels(), (4, 7, 9))
+
+    def test_create_arena(self):
+        root_state = HanoiState.classic_init(3)
+        self.assertIs(type(create_arena(root_state)), SearchNodeArena)
+        self.assertIs(type(create_arena(root_state, 'bitmap')), CompactSearchNodeArena)
+        with self.assertRaises(ValueError):
+            create_arena(root_state, 'tree')
+
+class TestRankBitmap(unittest.TestCase):
+    def test_add_and_contains(self):
+        bitmap = RankBitmap(4)
+        ranks = [0, 7, 8, 9, 80, 41]
+        for rank in ranks:
+            self.assertNotIn(rank, bitmap)
+            self.assertTrue(bitmap.add(rank))
+            self.assertIn(rank, bitmap)
+            self.assertFalse(bitmap.add(rank))
+        self.assertEqual(len(bitmap), len(ranks))
+        self.assertEqual([rank for rank in range(3 ** 4) if rank in bitmap], sorted(ranks))
+
+    def test_intersection(self):
+        left, right = RankBitmap(5), RankBitmap(5)
+        for rank in range(0, 3 ** 5, 2):
+            left.add(rank)
+        for rank in range(0, 3 ** 5, 3):
+            right.add(rank)
+        self.assertEqual(list(left.intersection(right)), list(range(0, 3 ** 5, 6)))
+        self.assertEqual(list(left.intersection(RankBitmap(5))), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+"""
+Saved tables of precomputed distances, and the ones loaded in this process.
+
+Pattern databases (see `solvers.informed_search.pattern_database`) and
+distance tables (see `solvers.depth_table`) are built once, saved to a cache
+directory and mapped read-only from there by later runs. Within a process,
+the tables in use are kept in memory up to a total size, the least recently
+used ones being dropped first.
+"""
+
+import mmap
+import os
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+# Default location of the saved tables
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'hanoi')
+
+# Total size of the tables a process keeps loaded (256 MiB)
+DEFAULT_MAX_LOADED_BYTES = 256 << 20
+
+
+class LoadedTables:
+    """
+    The tables already built or mapped in this process, bounded in total size.
+
+    Tables are dropped least recently used first once their total size exceeds
+    the limit; a solver still holding a dropped table keeps it alive until it
+    is done with it. The newest table is always kept, even alone over the limit.
+
+    Attributes:
+        max_bytes (int): The largest total size of the tables kept.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_LOADED_BYTES):
+        """
+        Creates an empty set of loaded tables.
+
+        Args:
+            max_bytes: The largest total size of the tables kept.
+        """
+        self.max_bytes = max_bytes
+        self._tables: 'OrderedDict[Hashable, Tuple[Any, int]]' = OrderedDict()
+        self._total_bytes = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Gets a loaded table, marking it as the most recently used.
+
+        Args:
+            key: The key the table was stored with.
+
+        Returns:
+            The table, or None if it is not loaded.
+        """
+        entry = self._tables.get(key)
+        if entry is None:
+            return None
+        self._tables.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: Hashable, table: Any) -> None:
+        """
+        Stores a loaded table, dropping the least recently used ones beyond the limit.
+
+        Args:
+            key: The key of the table.
+            table: The table buffer.
+        """
+        if key in self._tables:
+            self._total_bytes -= self._tables.pop(key)[1]
+        size = len(table)
+        self._tables[key] = (table, size)
+        self._total_bytes += size
+        while self._total_bytes > self.max_bytes and len(self._tables) > 1:
+            _, (_, evicted_size) = self._tables.popitem(last=False)
+            self._total_bytes -= evicted_size
+
+    def clear(self) -> None:
+        """Drops every loaded table."""
+        self._tables.clear()
+        self._total_bytes = 0
+
+    def __len__(self) -> int:
+        """Returns the number of loaded tables."""
+        return len(self._tables)
+
+
+# The tables loaded in this process, pattern databases and distance tables alike
+LOADED_TABLES = LoadedTables()
+
+
+def load_table(key: Hashable, file_name: str, size: int, build: Callable[[], Any],
+               cache_dir: Optional[str] = None) -> Any:
+    """
+    Gets a table, from memory, from the cache directory or by building it.
+
+    Saved tables are mapped read-only with `mmap`, so that several processes
+    using the same table share one copy in memory. Newly built tables are
+    written to the cache directory; if it cannot be written, the table is
+    simply kept in memory.
+
+    Args:
+        key: The key of the table among the loaded ones.
+        file_name: The name of the table file in the cache directory.
+        size: The size of the table in bytes; saved files of another size are rebuilt.
+        build: Builds the table buffer, when it is neither loaded nor saved.
+        cache_dir: The directory holding saved tables. Defaults to ~/.cache/hanoi.
+
+    Returns:
+        The table buffer (the one built, or a read-only `mmap`).
+    """
+    table = LOADED_TABLES.get(key)
+    if table is not None:
+        return table
+
+    cache_dir = cache_dir or DEFAULT_CACHE_DIR
+    path = os.path.join(cache_dir, file_name)
+
+    try:
+        if os.path.getsize(path) == size:
+            with open(path, 'rb') as table_file:
+                table = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+    except OSError:
+        pass
+
+    if table is None:
+        table = build()
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Write to a temporary file first, so that readers never see a partial table
+            temporary_path = f"{path}.{os.getpid()}.tmp"
+            with open(temporary_path, 'wb') as table_file:
+                table_file.write(table)
+            os.replace(temporary_path, path)
+        except OSError:
+            pass
+
+    LOADED_TABLES.put(key, table)
+    return table
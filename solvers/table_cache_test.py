@@ -0,0 +1,29 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+import unittest
+
+from .table_cache import LoadedTables
+
+class TestLoadedTables(unittest.TestCase):
+    def test_least_recently_used_dropped_beyond_limit(self):
+        tables = LoadedTables(max_bytes=30)
+        for key in 'abc':
+            tables.put(key, bytearray(10))
+        tables.get('a')
+        tables.put('d', bytearray(10))
+        self.assertIsNone(tables.get('b'))
+        for key in 'acd':
+            self.assertIsNotNone(tables.get(key))
+
+    def test_newest_table_kept_over_limit(self):
+        tables = LoadedTables(max_bytes=30)
+        tables.put('a', bytearray(10))
+        tables.put('b', bytearray(100))
+        self.assertEqual(len(tables), 1)
+        self.assertIsNotNone(tables.get('b'))
+
+if __name__ == '__main__':
+    unittest.main()
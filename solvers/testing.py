@@ -0,0 +1,82 @@
+# This file is part of the Hanoi project
+# © 2025 - Multi-AI collaborative development (Claude Sonnet 4 & Gemini 2.5 Pro)
+# This is free and unencumbered software released into the public domain.
+# For more information, please refer to the LICENSE file or <https://unlicense.org>
+
+"""
+Helpers shared by the solver tests: reference distances and solution checks.
+"""
+
+import unittest
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, Sequence, Tuple
+
+from .hanoi_state import HanoiState
+
+Move = Tuple[int, int, int]
+
+
+def bfs_distances(state: Any, max_lift: int = 1) -> Dict[Any, int]:
+    """
+    Computes the distance between a state and every state reachable from it.
+
+    Moves are reversible, so distances from a target state are also
+    distances to it.
+
+    Args:
+        state: The state the distances are measured from.
+        max_lift: The maximum number of disks lifted by a single move.
+
+    Returns:
+        The distance of every reachable state, by state.
+    """
+    distances = {state: 0}
+    queue = deque([state])
+    while queue:
+        current = queue.popleft()
+        for _, next_state in current.successors(max_lift):
+            if next_state not in distances:
+                distances[next_state] = distances[current] + 1
+                queue.append(next_state)
+    return distances
+
+
+def replay(solution: Iterable[Move], state: Any) -> Any:
+    """
+    Plays moves from a state, checking that each one is legal.
+
+    Args:
+        solution: The moves to play.
+        state: The state before the first move.
+
+    Returns:
+        The state after the last move.
+
+    Raises:
+        ValueError: If a move is illegal.
+    """
+    for move in solution:
+        state = state.apply_move(*move)
+    return state
+
+
+class SolverTestCase(unittest.TestCase):
+    """A test case with checks of solver outputs against breadth-first search."""
+
+    def assertOptimal(self, solve: Callable[[HanoiState], Sequence[Move]], target_state: HanoiState,
+                      max_lift: int, ranks: Iterable[int]) -> None:
+        """
+        Checks that solutions towards a target are legal and as short as possible.
+
+        Args:
+            solve: Maps an initial state to the solution of a solver towards `target_state`.
+            target_state: The target state of every solution.
+            max_lift: The maximum number of disks lifted by a single move.
+            ranks: The ranks of the initial states to solve from.
+        """
+        distances = bfs_distances(target_state, max_lift)
+        for rank in ranks:
+            initial_state = HanoiState.unrank(rank, target_state.number_of_disks)
+            solution = solve(initial_state)
+            self.assertEqual(len(solution), distances[initial_state])
+            self.assertEqual(replay(solution, initial_state), target_state)